@@ -77,5 +77,6 @@ setup(
     extras_require={
         "tests": test_requires,
         "uvloop": ["uvloop>=0.12.2,<0.13.0"],
+        "curl": ["pycurl>=7.43"],
     },
 )
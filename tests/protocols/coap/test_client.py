@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+from types import SimpleNamespace
+
+import aiocoap
 import pytest
+from mock import MagicMock, patch
 
 from tests.protocols.helpers import (
     client_test_invoke_action_async,
@@ -13,6 +18,9 @@ from tests.protocols.helpers import (
     client_test_write_property_async,
 )
 from wotpy.protocols.coap.client import CoAPClient
+from wotpy.protocols.enums import Protocols
+from wotpy.protocols.exceptions import ClientRequestTimeout
+from wotpy.wot.td import ThingDescription
 
 
 @pytest.mark.asyncio
@@ -70,3 +78,112 @@ async def test_on_property_change_error(coap_servient):
 
     async for servient in coap_servient:
         await client_test_on_property_change_error_async(servient, CoAPClient)
+
+
+@pytest.mark.asyncio
+async def test_shared_context(coap_servient):
+    """The CoAP client reuses one client context for all requests."""
+
+    async for servient in coap_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        coap_client = CoAPClient()
+
+        with patch(
+            "aiocoap.Context.create_client_context",
+            wraps=aiocoap.Context.create_client_context,
+        ) as mock_create:
+            await asyncio.gather(
+                *[coap_client.read_property(td, prop_name) for _ in range(5)]
+            )
+
+            await coap_client.write_property(td, prop_name, "value")
+
+            assert mock_create.call_count == 1
+
+            await coap_client.shutdown()
+            await coap_client.read_property(td, prop_name)
+
+            assert mock_create.call_count == 2
+
+        await coap_client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_servient_shutdown(coap_servient):
+    """The shared client context is shut down when the servient shuts down."""
+
+    async for servient in coap_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        coap_client = servient.clients[Protocols.COAP]
+
+        await coap_client.read_property(td, prop_name)
+        context = await coap_client._get_coap_client()
+
+        with patch.object(context, "shutdown", wraps=context.shutdown) as mock_shutdown:
+            await servient.shutdown()
+
+            assert mock_shutdown.call_count == 1
+            assert coap_client._coap_client is None
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_request(coap_servient):
+    """Property requests that time out are cancelled."""
+
+    async for servient in coap_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        coap_client = CoAPClient()
+        requests = []
+
+        def request(msg):
+            requests.append(
+                SimpleNamespace(response=asyncio.get_running_loop().create_future())
+            )
+
+            return requests[-1]
+
+        async def get_coap_client():
+            return MagicMock(request=request)
+
+        with patch.object(coap_client, "_get_coap_client", new=get_coap_client):
+            with pytest.raises(ClientRequestTimeout):
+                await coap_client.read_property(td, prop_name, timeout=0.05)
+
+            with pytest.raises(ClientRequestTimeout):
+                await coap_client.write_property(td, prop_name, "value", timeout=0.05)
+
+        assert len(requests) == 2
+        assert all(item.response.cancelled() for item in requests)
+
+
+def test_context_loop_change():
+    """The client context created on a previous event loop is shut down when replaced."""
+
+    coap_client = CoAPClient()
+    loop_prev = asyncio.new_event_loop()
+    loop_next = asyncio.new_event_loop()
+
+    try:
+        context_prev = loop_prev.run_until_complete(coap_client._get_coap_client())
+
+        with patch.object(
+            context_prev, "shutdown", wraps=context_prev.shutdown
+        ) as mock_shutdown:
+            context_next = loop_next.run_until_complete(coap_client._get_coap_client())
+
+            assert context_next is not context_prev
+
+            loop_prev.run_until_complete(asyncio.sleep(0.1))
+
+            assert mock_shutdown.call_count == 1
+
+        loop_next.run_until_complete(coap_client.shutdown())
+    finally:
+        loop_prev.close()
+        loop_next.close()
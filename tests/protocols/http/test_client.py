@@ -1,6 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import uuid
+
+import pytest
+from mock import patch
+from rx.concurrency import IOLoopScheduler
+
 from tests.protocols.helpers import \
     client_test_on_property_change, \
     client_test_on_event, \
@@ -9,7 +16,10 @@ from tests.protocols.helpers import \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
-from wotpy.protocols.http.client import HTTPClient
+from tests.utils import run_test_coroutine
+from wotpy.protocols.http.client import HTTPClient, ObservationConnection
+from wotpy.support import is_curl_supported
+from wotpy.wot.td import ThingDescription
 
 
 def test_read_property(http_servient):
@@ -53,3 +63,189 @@ def test_on_property_change_error(http_servient):
     observation are propagated to the subscription as expected."""
 
     client_test_on_property_change_error(http_servient, HTTPClient)
+
+
+def test_shared_client_pool(http_servient):
+    """All requests share one bounded HTTP client and the queue wait is tracked."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    num_reads = 6
+
+    async def test_coroutine():
+        http_client = HTTPClient(max_per_host=2)
+
+        with patch.object(http_client, "_build_engine", wraps=http_client._build_engine) as mock_build:
+            await asyncio.gather(*[
+                http_client.read_property(td, prop_name)
+                for _ in range(num_reads)
+            ])
+
+            await http_client.write_property(td, prop_name, "value")
+
+            assert mock_build.call_count == 1
+
+        stats = http_client.pool_stats
+
+        assert stats["requests"] == num_reads + 1
+        assert stats["active"] == 0
+        assert stats["waiting"] == 0
+        assert stats["saturation"] == 0
+        assert stats["queue_wait_max"] > 0
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_on_property_change_event_stream(http_servient):
+    """The HTTP client receives every Property update over one Server-Sent Events stream."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    values = [uuid.uuid4().hex for _ in range(10)]
+
+    async def test_coroutine():
+        http_client = HTTPClient()
+        received = []
+        future_done = asyncio.Future()
+
+        def on_next(item):
+            received.append(item.data.value)
+
+            if len(received) == len(values) and not future_done.done():
+                future_done.set_result(True)
+
+        with patch.object(http_client, "_fetch", wraps=http_client._fetch) as mock_fetch:
+            observable = http_client.on_property_change(td, prop_name)
+            subscription = observable.subscribe_on(IOLoopScheduler()).subscribe(on_next)
+
+            await asyncio.sleep(0.5)
+
+            for value in values:
+                await exposed_thing.properties[prop_name].write(value)
+
+            await asyncio.wait_for(future_done, timeout=5)
+
+            assert received == values
+            assert mock_fetch.call_count == 0
+            assert http_client.pool_stats["observation_requests"] == 1
+
+        subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_observations_out_of_pool(http_servient):
+    """Observations do not take slots from the shared client pool
+    and their pending requests end as soon as they are disposed."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    max_clients = 2
+
+    async def test_coroutine():
+        http_client = HTTPClient(max_clients=max_clients, max_per_host=max_clients)
+        fetches_done = []
+        fetch_original = ObservationConnection.fetch
+
+        async def fetch(conn, http_request):
+            try:
+                return await fetch_original(conn, http_request)
+            finally:
+                fetches_done.append(True)
+
+        with patch.object(ObservationConnection, "fetch", fetch):
+            subscriptions = [
+                http_client.on_property_change(td, prop_name)
+                .subscribe_on(IOLoopScheduler())
+                .subscribe(lambda item: None)
+                for _ in range(max_clients * 2)
+            ]
+
+            await asyncio.sleep(0.5)
+
+            assert http_client.pool_stats["observations"] == len(subscriptions)
+
+            value = uuid.uuid4().hex
+            await asyncio.wait_for(http_client.write_property(td, prop_name, value), 5)
+            read_value = await asyncio.wait_for(
+                http_client.read_property(td, prop_name), 5
+            )
+
+            assert read_value == value
+
+            for subscription in subscriptions:
+                subscription.dispose()
+
+            await asyncio.sleep(0.5)
+
+            assert len(fetches_done) == len(subscriptions)
+            assert http_client.pool_stats["observations"] == 0
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_shutdown(http_servient):
+    """Shutting down the client closes the shared client and completes
+    the active observations. The client may be used again afterwards."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+
+    async def test_coroutine():
+        http_client = HTTPClient()
+        future_completed = asyncio.get_event_loop().create_future()
+
+        subscription = (
+            http_client.on_property_change(td, prop_name)
+            .subscribe_on(IOLoopScheduler())
+            .subscribe(
+                on_next=lambda item: None,
+                on_completed=lambda: future_completed.set_result(True),
+            )
+        )
+
+        await http_client.read_property(td, prop_name)
+        await asyncio.sleep(0.5)
+
+        assert http_client.pool_stats["observations"] == 1
+
+        await http_client.shutdown()
+
+        assert http_client.pool_stats["observations"] == 0
+        assert http_client._engine is None
+        assert await asyncio.wait_for(future_completed, timeout=5)
+
+        value = uuid.uuid4().hex
+        await http_client.write_property(td, prop_name, value)
+
+        assert await http_client.read_property(td, prop_name) == value
+
+        subscription.dispose()
+        await http_client.shutdown()
+
+    run_test_coroutine(test_coroutine)
+
+
+@pytest.mark.skipif(is_curl_supported(), reason="Only for platforms without pycurl")
+def test_curl_unavailable():
+    """Requesting the curl backend without pycurl fails on construction."""
+
+    with pytest.raises(ValueError):
+        HTTPClient(use_curl=True)
+
+
+def test_invalid_pool_limits():
+    """Pools without a positive connection limit are rejected on construction."""
+
+    for kwargs in [
+        {"max_clients": 0},
+        {"max_clients": None},
+        {"max_per_host": 0},
+        {"max_per_host": None},
+    ]:
+        with pytest.raises(ValueError):
+            HTTPClient(**kwargs)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import asyncio
 import datetime
+import gc
 import json
 import random
 import ssl
@@ -15,8 +17,10 @@ from faker import Faker
 from tornado.concurrent import Future
 
 from tests.utils import find_free_port, run_test_coroutine
+from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import InteractionVerbs
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
+from wotpy.protocols.http.invocations import PendingInvocationStore
 from wotpy.protocols.http.server import HTTPServer
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
 from wotpy.wot.exposed.thing import ExposedThing
@@ -129,6 +133,34 @@ def test_property_set_json(http_server):
     _test_property_set(http_server, body, prop_value, headers=JSON_HEADERS)
 
 
+def test_observe_forms_media_types(http_server):
+    """The Server-Sent Events and long-polling observation forms share
+    their href and are told apart by the subprotocol and the media type."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop = next(iter(exposed_thing.thing.properties.values()))
+    event = next(iter(exposed_thing.thing.events.values()))
+
+    for interaction, op in [
+        (prop, InteractionVerbs.OBSERVE_PROPERTY),
+        (event, InteractionVerbs.SUBSCRIBE_EVENT),
+    ]:
+        forms = [
+            form
+            for form in http_server.build_forms("localhost", interaction)
+            if op in form.op
+        ]
+
+        form_sse = next(
+            form for form in forms if form.subprotocol == HTTPSubprotocols.SSE
+        )
+        form_poll = next(form for form in forms if form.subprotocol is None)
+
+        assert form_sse.href == form_poll.href
+        assert form_sse.content_type == MediaTypes.EVENT_STREAM
+        assert form_poll.content_type == MediaTypes.JSON
+
+
 def test_property_subscribe(http_server):
     """Properties exposed in an HTTP server can be subscribed to with an HTTP GET request."""
 
@@ -260,6 +292,140 @@ def test_action_run_error(http_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_action_run_inline(http_server):
+    """Actions that finish within the wait budget return the result inline."""
+
+    exposed_thing = next(http_server.exposed_things)
+    action_name = next(iter(exposed_thing.thing.actions.keys()))
+    href = _get_action_href(exposed_thing, action_name, http_server)
+
+    action_future = Future()
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        yield action_future
+        raise tornado.gen.Return(parameters.get("input") * 2)
+
+    exposed_thing.set_action_handler(action_name, action_handler)
+
+    @tornado.gen.coroutine
+    def invoke(input_value, wait_secs):
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        headers = dict(JSON_HEADERS, Prefer="wait={}".format(wait_secs))
+        http_request = tornado.httpclient.HTTPRequest(
+            href,
+            method="POST",
+            body=json.dumps({"input": input_value}),
+            headers=headers,
+        )
+        response = yield http_client.fetch(http_request)
+        raise tornado.gen.Return(json.loads(response.body))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        input_value = Faker().pyint()
+        num_pending = len(http_server.pending_actions)
+
+        result = yield invoke(input_value, 0.05)
+
+        assert result.get("invocation") is not None
+        assert len(http_server.pending_actions) == num_pending + 1
+
+        tornado.ioloop.IOLoop.current().add_timeout(
+            datetime.timedelta(seconds=0.1),
+            lambda: action_future.set_result(True),
+        )
+
+        result = yield invoke(input_value, http_server.action_wait)
+
+        assert result.get("invocation") is None
+        assert result.get("done") is True
+        assert result.get("result") == input_value * 2
+        assert len(http_server.pending_actions) == num_pending + 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_action_pending_store():
+    """Pending invocations expire on a timer and are evicted when the store is full."""
+
+    ttl_secs = 0.1
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        store = PendingInvocationStore(ttl_secs=ttl_secs, max_size=2)
+        futures = {uuid.uuid4().hex: Future() for _ in range(3)}
+
+        for invocation_id, fut in futures.items():
+            store.add(invocation_id, fut)
+
+        ids = list(futures.keys())
+
+        assert len(store) == 2
+        assert ids[0] not in store
+        assert store.stats["stored"] == 3
+        assert store.stats["evicted"] == 1
+
+        futures[ids[1]].set_result(True)
+
+        yield tornado.gen.sleep(ttl_secs * 2)
+
+        assert ids[1] not in store
+        assert store.get(ids[2]) is futures[ids[2]]
+        assert store.stats["expired"] == 1
+        assert store.stats["size"] == 1
+
+        futures[ids[2]].set_result(True)
+        store.clear()
+
+        yield tornado.gen.sleep(ttl_secs * 2)
+
+        assert len(store) == 0
+        assert store.stats["expired"] == 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_action_pending_store_discarded_errors():
+    """The errors of the invocations discarded from the store are retrieved,
+    so they are not reported as never retrieved when the Futures are collected."""
+
+    ttl_secs = 0.05
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        loop = asyncio.get_event_loop()
+        handler_prev = loop.get_exception_handler()
+        contexts = []
+        loop.set_exception_handler(lambda _, context: contexts.append(context))
+
+        try:
+            store = PendingInvocationStore(ttl_secs=ttl_secs, max_size=1)
+            fut_evicted, fut_expired = Future(), Future()
+            store.add(uuid.uuid4().hex, fut_evicted)
+            store.add(uuid.uuid4().hex, fut_expired)
+            fut_expired.set_exception(Exception())
+
+            yield tornado.gen.sleep(ttl_secs * 4)
+
+            assert len(store) == 0
+            assert store.stats["evicted"] == 1
+            assert store.stats["expired"] == 1
+
+            fut_evicted.set_exception(Exception())
+
+            yield tornado.gen.sleep(0)
+
+            del fut_evicted, fut_expired
+            gc.collect()
+
+            assert not contexts
+        finally:
+            loop.set_exception_handler(handler_prev)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_event_subscribe(http_server):
     """Events exposed in an HTTP server can be subscribed to with an HTTP GET request."""
 
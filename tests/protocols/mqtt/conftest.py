@@ -28,11 +28,25 @@ skip_reasons = [(not is_mqtt_supported(), "Unsupported platform")]
 for skip_check, reason in skip_reasons:
     if skip_check:
         logging.warning("Skipping MQTT tests: {}".format(reason))
-        collect_ignore += ["test_server.py", "test_client.py"]
+        collect_ignore += [
+            "test_server.py",
+            "test_client.py",
+            "test_routes.py",
+            "test_coalesce.py",
+            "test_digest.py",
+            "test_replies.py",
+            "test_router.py",
+            "test_runner.py",
+        ]
         break
 
 
-@pytest.fixture(params=[{"property_callback_ms": None}])
+@pytest.fixture(
+    params=[
+        {"property_callback_ms": None},
+        {"property_callback_ms": None, "multiplexed": True},
+    ]
+)
 def mqtt_server(request):
     """Builds a MQTTServer instance that contains an ExposedThing."""
 
@@ -82,13 +96,14 @@ def mqtt_server(request):
 
 
 @pytest.fixture
-async def mqtt_servient():
+async def mqtt_servient(request):
     """Returns a Servient that exposes a CoAP server and one ExposedThing."""
 
     from tests.protocols.mqtt.broker import get_test_broker_url
     from wotpy.protocols.mqtt.server import MQTTServer
 
-    server = MQTTServer(broker_url=get_test_broker_url())
+    server_kwargs = getattr(request, "param", {})
+    server = MQTTServer(broker_url=get_test_broker_url(), **server_kwargs)
     servient = Servient(catalogue_port=None)
     servient.add_server(server)
     wot = await servient.start()
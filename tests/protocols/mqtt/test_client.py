@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import uuid
+
 import pytest
+from mock import patch
 
 from tests.protocols.helpers import (
     client_test_invoke_action_async,
@@ -12,7 +16,11 @@ from tests.protocols.helpers import (
     client_test_write_property_async,
 )
 from tests.protocols.mqtt.broker import BROKER_SKIP_REASON, is_test_broker_online
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.enums import MQTTSubprotocols
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.td import ThingDescription
 
 pytestmark = pytest.mark.skipif(
     is_test_broker_online() is False, reason=BROKER_SKIP_REASON
@@ -59,6 +67,86 @@ async def test_on_property_change(mqtt_servient):
         await client_test_on_property_change_async(servient, MQTTClient)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mqtt_servient", [{"property_digest_ms": 50}], indirect=True)
+async def test_on_property_change_digest(mqtt_servient):
+    """Property updates batched in the servient digest topic
+    are demultiplexed by the MQTT binding client."""
+
+    async for servient in mqtt_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+
+        observe_forms = [
+            form
+            for form in td.get_property_forms(prop_name)
+            if form.op == InteractionVerbs.OBSERVE_PROPERTY
+        ]
+
+        assert len(observe_forms) == 1
+        assert observe_forms[0].subprotocol == MQTTSubprotocols.DIGEST
+
+        await client_test_on_property_change_async(servient, MQTTClient)
+        await client_test_read_property_async(servient, MQTTClient)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mqtt_servient", [{"property_digest_ms": 50}], indirect=True)
+async def test_on_property_change_digest_shared(mqtt_servient):
+    """Observations of Properties on the same digest topic share one subscription."""
+
+    async for servient in mqtt_servient:
+        exposed_thing = next(servient.exposed_things)
+        prop_names = [uuid.uuid4().hex for _ in range(2)]
+
+        for prop_name in prop_names:
+            exposed_thing.add_property(
+                prop_name,
+                PropertyFragmentDict({"type": "number", "observable": True}),
+                value=0,
+            )
+
+        servient.refresh_forms()
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        mqtt_client = MQTTClient()
+        observed = {prop_name: asyncio.Future() for prop_name in prop_names}
+
+        def build_on_next(prop_name):
+            def on_next(ev):
+                if ev.data.value and not observed[prop_name].done():
+                    observed[prop_name].set_result(ev.data.value)
+
+            return on_next
+
+        with patch.object(
+            mqtt_client, "_build_subscribe", wraps=mqtt_client._build_subscribe
+        ) as build_subscribe:
+            subscriptions = [
+                mqtt_client.on_property_change(td, prop_name).subscribe(
+                    build_on_next(prop_name)
+                )
+                for prop_name in prop_names
+            ]
+
+        async def write_values():
+            while not all(fut.done() for fut in observed.values()):
+                for idx, prop_name in enumerate(prop_names):
+                    await exposed_thing.properties[prop_name].write(idx + 1)
+
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(write_values(), timeout=5.0)
+
+        assert build_subscribe.call_count == 1
+        assert [observed[prop_name].result() for prop_name in prop_names] == [1, 2]
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        await mqtt_client.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_on_event(mqtt_servient):
     """Event emissions may be observed using the MQTT binding client."""
@@ -67,6 +155,82 @@ async def test_on_event(mqtt_servient):
         await client_test_on_event_async(servient, MQTTClient)
 
 
+@pytest.mark.asyncio
+async def test_connection_pool(mqtt_servient):
+    """Idle broker connections are kept open and reused by sequential requests."""
+
+    async for servient in mqtt_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        mqtt_client = MQTTClient(idle_timeout_secs=10)
+        num_reads = 5
+
+        for _ in range(num_reads):
+            await mqtt_client.read_property(td, prop_name)
+
+        assert mqtt_client.pool_stats["misses"] == 1
+        assert mqtt_client.pool_stats["hits"] == num_reads - 1
+        assert mqtt_client.pool_stats["idle"] == 1
+
+        await mqtt_client.shutdown()
+
+        assert mqtt_client.pool_stats["idle"] == 0
+
+
+@pytest.mark.asyncio
+async def test_servient_shutdown(mqtt_servient):
+    """Connections kept idle by the pool are closed when the servient shuts down."""
+
+    async for servient in mqtt_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        mqtt_client = MQTTClient(idle_timeout_secs=10)
+
+        await servient.shutdown()
+        servient.add_client(mqtt_client)
+        await servient.start()
+        await mqtt_client.read_property(td, prop_name)
+
+        assert mqtt_client.pool_stats["idle"] == 1
+
+        await servient.shutdown()
+
+        assert mqtt_client.pool_stats["idle"] == 0
+        assert not mqtt_client._clients
+
+
+@pytest.mark.asyncio
+async def test_persistent_reply_subscriptions(mqtt_servient):
+    """Reply topic subscriptions are kept across requests on a pooled connection."""
+
+    async for servient in mqtt_servient:
+        exposed_thing = next(servient.exposed_things)
+        td = ThingDescription.from_thing(exposed_thing.thing)
+        prop_name = next(iter(td.properties.keys()))
+        action_name = next(iter(td.actions.keys()))
+        mqtt_client = MQTTClient(idle_timeout_secs=10)
+
+        await mqtt_client.read_property(td, prop_name)
+        await mqtt_client.invoke_action(td, action_name, 1)
+
+        num_subscribes = mqtt_client.message_stats["subscribes"]
+
+        assert num_subscribes > 0
+
+        for idx in range(5):
+            await mqtt_client.read_property(td, prop_name)
+            assert (await mqtt_client.invoke_action(td, action_name, idx)) == idx * 2
+
+        message_stats = mqtt_client.message_stats
+
+        assert message_stats["subscribes"] == num_subscribes
+        assert message_stats["waiters"] == 0
+
+        await mqtt_client.shutdown()
+
+
 @pytest.mark.skip(reason="ToDo: Implement this test")
 def test_timeout_invoke_action(mqtt_servient):
     """Timeouts can be defined on Action invocations."""
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import uuid
+
+import pytest
+
+from wotpy.protocols.mqtt.handlers.coalesce import CoalescingPublisher
+from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
+from wotpy.protocols.mqtt.server import MQTTServer
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+
+def _message(topic, value):
+    return {"topic": topic, "data": value, "qos": 0}
+
+
+@pytest.mark.asyncio
+async def test_coalescing_publisher():
+    """Messages on the same topic are rate limited and only the latest value is kept."""
+
+    interval_ms = 100
+    queue = asyncio.Queue()
+    publisher = CoalescingPublisher(queue=queue, min_interval_ms=interval_ms)
+
+    for idx in range(10):
+        publisher.publish(_message("a", idx))
+
+    publisher.publish(_message("b", 0))
+
+    assert queue.qsize() == 2
+    assert publisher.stats["pending"] == 1
+    assert publisher.stats["merged"] == 8
+
+    await asyncio.sleep((interval_ms / 1000.0) * 1.5)
+
+    messages = [queue.get_nowait() for _ in range(queue.qsize())]
+
+    assert [(msg["topic"], msg["data"]) for msg in messages] == [
+        ("a", 0),
+        ("b", 0),
+        ("a", 9),
+    ]
+
+    assert publisher.stats["published"] == 3
+    assert publisher.stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalescing_publisher_retain_drop():
+    """Messages may be retained and are dropped when the queue is full."""
+
+    queue = asyncio.Queue(maxsize=1)
+    publisher = CoalescingPublisher(queue=queue, retain=True)
+
+    publisher.publish(_message("a", 0))
+    publisher.publish(_message("a", 1))
+
+    assert queue.get_nowait()["retain"] is True
+    assert publisher.stats["published"] == 1
+    assert publisher.stats["dropped"] == 1
+
+    publisher.clear()
+
+
+@pytest.mark.asyncio
+async def test_property_handler_bounded_queue():
+    """Property updates are dropped when the bounded handler queue is full."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    prop_name = uuid.uuid4().hex
+
+    exposed_thing.add_property(
+        prop_name, PropertyFragmentDict({"type": "number", "observable": True}), value=0
+    )
+
+    server.add_exposed_thing(exposed_thing)
+
+    queue_size = 2
+    handler = PropertyMQTTHandler(mqtt_server=server, queue_size=queue_size)
+
+    assert handler.queue.maxsize == queue_size
+
+    await handler.init()
+    await asyncio.sleep(0.1)
+
+    try:
+        for idx in range(queue_size + 3):
+            await exposed_thing.properties[prop_name].write(idx)
+
+        assert handler.queue.qsize() == queue_size
+        assert handler.updates_stats["published"] == queue_size
+        assert handler.updates_stats["dropped"] == 3
+    finally:
+        await handler.teardown()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+import pytest
+
+from wotpy.protocols.mqtt.handlers.digest import DigestPublisher
+
+
+@pytest.mark.asyncio
+async def test_digest_publisher():
+    """Property updates are batched in one message per window or when the digest is full."""
+
+    window_ms = 50
+    queue = asyncio.Queue()
+    publisher = DigestPublisher(
+        queue=queue, topic="sid/property/digest", window_ms=window_ms, max_updates=3
+    )
+
+    publisher.add("thing_a", "prop", 1)
+    publisher.add("thing_b", "prop", 2)
+
+    assert queue.empty()
+
+    await asyncio.sleep((window_ms / 1000.0) * 2)
+
+    message = queue.get_nowait()
+    updates = json.loads(message["data"].decode())[DigestPublisher.KEY_UPDATES]
+
+    assert message["topic"] == "sid/property/digest"
+    assert [update[:3] for update in updates] == [
+        ["thing_a", "prop", 1],
+        ["thing_b", "prop", 2],
+    ]
+
+    for idx in range(3):
+        publisher.add("thing_a", "prop", idx)
+
+    assert queue.qsize() == 1
+    assert publisher.stats["updates"] == 5
+    assert publisher.stats["batches"] == 2
+    assert publisher.stats["pending"] == 0
+
+    publisher.clear()
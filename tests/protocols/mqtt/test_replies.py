@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import contextlib
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import aiomqtt
+import pytest
+from faker import Faker
+from mock import MagicMock, patch
+
+from wotpy.protocols.exceptions import ClientRequestTimeout
+from wotpy.protocols.mqtt.client import MQTTClient
+
+BROKER_URL = "mqtt://localhost"
+
+
+def _build_message(topic, data):
+    """Builds an object that looks like a message delivered by aiomqtt."""
+
+    return SimpleNamespace(
+        topic=SimpleNamespace(value=topic), payload=json.dumps(data).encode()
+    )
+
+
+async def _build_client(topic, **kwargs):
+    """Builds an MQTTClient subscribed to the given topic on a fake connection."""
+
+    mqtt_client = MQTTClient(**kwargs)
+    fake_conn = MagicMock(subscribe=AsyncMock(), publish=AsyncMock())
+
+    with patch.dict(mqtt_client._clients, {BROKER_URL: fake_conn}):
+        await mqtt_client._subscribe(BROKER_URL, topic, qos=1)
+
+    return mqtt_client
+
+
+@pytest.mark.asyncio
+async def test_reply_during_publish():
+    """Correlated replies that arrive while publishing are taken from the index."""
+
+    topic = uuid.uuid4().hex
+    mqtt_client = await _build_client(topic)
+    reply = {"id": uuid.uuid4().hex, "result": Faker().pystr()}
+
+    async def publish(**kwargs):
+        await mqtt_client._new_message(BROKER_URL, _build_message(topic, reply))
+
+    with patch.object(mqtt_client, "_publish", side_effect=publish):
+        with patch.object(
+            mqtt_client, "_add_waiter", wraps=mqtt_client._add_waiter
+        ) as mock_add_waiter:
+            message_dict = await mqtt_client._publish_and_wait(
+                publish_args={},
+                reply_broker_url=BROKER_URL,
+                reply_topic=topic,
+                correlation_id=reply["id"],
+                timeout=1,
+            )
+
+            assert mock_add_waiter.call_count == 0
+
+    assert message_dict["data"] == reply
+    assert mqtt_client.message_stats["indexed"] == 0
+    assert mqtt_client.message_stats["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reply_after_publish():
+    """Correlated replies that arrive after publishing resolve a waiter."""
+
+    topic = uuid.uuid4().hex
+    mqtt_client = await _build_client(topic)
+    reply = {"id": uuid.uuid4().hex, "result": Faker().pystr()}
+    reply_other = {"id": uuid.uuid4().hex, "result": Faker().pystr()}
+
+    async def deliver_replies():
+        await asyncio.sleep(0.1)
+
+        for data in [reply_other, reply]:
+            await mqtt_client._new_message(BROKER_URL, _build_message(topic, data))
+
+    with patch.object(mqtt_client, "_publish", new=AsyncMock()):
+        task = asyncio.ensure_future(deliver_replies())
+
+        message_dict = await mqtt_client._publish_and_wait(
+            publish_args={},
+            reply_broker_url=BROKER_URL,
+            reply_topic=topic,
+            correlation_id=reply["id"],
+            timeout=1,
+        )
+
+        await task
+
+    assert message_dict["data"] == reply
+    assert mqtt_client.message_stats["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_message_ring_buffers():
+    """Unclaimed correlated replies are kept in fixed-capacity buffers
+    indexed by correlation ID while uncorrelated messages are not buffered."""
+
+    topic = uuid.uuid4().hex
+    buffer_size = 2
+    mqtt_client = await _build_client(topic, msg_buffer_size=buffer_size)
+    replies = [{"ack": uuid.uuid4().hex} for _ in range(buffer_size * 3)]
+
+    for data in replies + [{"value": Faker().pystr()}]:
+        await mqtt_client._new_message(BROKER_URL, _build_message(topic, data))
+
+    message_stats = mqtt_client.message_stats
+
+    assert message_stats["buffered"] == buffer_size
+    assert message_stats["indexed"] == buffer_size
+
+    with patch.object(mqtt_client, "_publish", new=AsyncMock()):
+        message_dict = await mqtt_client._publish_and_wait(
+            publish_args={},
+            reply_broker_url=BROKER_URL,
+            reply_topic=topic,
+            correlation_id=replies[-1]["ack"],
+            timeout=1,
+        )
+
+        assert message_dict["data"] == replies[-1]
+
+        with pytest.raises(ClientRequestTimeout):
+            await mqtt_client._publish_and_wait(
+                publish_args={},
+                reply_broker_url=BROKER_URL,
+                reply_topic=topic,
+                correlation_id=replies[0]["ack"],
+                timeout=0.1,
+            )
+
+    assert mqtt_client.message_stats["indexed"] == buffer_size - 1
+    assert mqtt_client.message_stats["waiters"] == 0
+
+
+class LostSessionConnection(object):
+    """Fake connection that loses its session the first time messages are read."""
+
+    def __init__(self):
+        self.subscribe = AsyncMock()
+        self.__aenter__ = AsyncMock()
+        self.num_sessions = 0
+
+    @contextlib.asynccontextmanager
+    async def messages(self):
+        self.num_sessions += 1
+
+        if self.num_sessions == 1:
+            raise aiomqtt.MqttError("Session lost")
+
+        async def idle():
+            await asyncio.Event().wait()
+            yield
+
+        yield idle()
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_after_reconnect():
+    """Topic subscriptions are renewed after reconnecting a client that lost its session."""
+
+    topic = uuid.uuid4().hex
+    mqtt_client = await _build_client(topic)
+    mqtt_client.SLEEP_SECS_DELIVER_ERR = 0
+    fake_conn = LostSessionConnection()
+    mqtt_client._clients[BROKER_URL] = fake_conn
+
+    stop_event = asyncio.Event()
+    task_deliver = asyncio.create_task(
+        mqtt_client._build_deliver(BROKER_URL, stop_event)()
+    )
+
+    async def wait_session():
+        while fake_conn.num_sessions < 2:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait_session(), timeout=5)
+
+    stop_event.set()
+    await asyncio.wait_for(task_deliver, timeout=5)
+
+    assert fake_conn.__aenter__.await_count == 1
+    assert fake_conn.subscribe.await_count == 2
+    assert all(call.kwargs["topic"] == topic for call in fake_conn.subscribe.mock_calls)
+    assert BROKER_URL not in mqtt_client._unhealthy_clients
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import uuid
+
+from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.handlers.ping import PingMQTTHandler
+from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
+from wotpy.protocols.mqtt.runner import MQTTTopicRouter
+from wotpy.protocols.mqtt.server import MQTTServer
+
+
+def test_topic_router():
+    """The topic router dispatches topics to the handlers with matching filters."""
+
+    handler_ping = object()
+    handler_prop = object()
+    handler_all = object()
+
+    router = MQTTTopicRouter()
+    router.add("sid/ping", handler_ping)
+    router.add("sid/property/requests/#", handler_prop)
+    router.add("+/#", handler_all)
+
+    assert router.route("sid/ping") == [handler_all, handler_ping]
+    assert router.route("sid/property/requests/thing/prop") == [
+        handler_all,
+        handler_prop,
+    ]
+    assert router.route("sid/property/updates/thing/prop") == [handler_all]
+    assert router.route("sid") == [handler_all]
+    assert router.route("other/ping") == [handler_all]
+
+    handler_shared = object()
+    router.add("$share/group/sid/action/invocation/#", handler_shared)
+
+    assert router.route("sid/action/invocation/thing/action") == [
+        handler_all,
+        handler_shared,
+    ]
+
+
+def test_shared_subscription_topics():
+    """Request handlers subscribe through $share/<group> when a shared group is set."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    shared_group = uuid.uuid4().hex
+
+    handler_action = ActionMQTTHandler(mqtt_server=server, shared_group=shared_group)
+    handler_prop = PropertyMQTTHandler(mqtt_server=server, shared_group=shared_group)
+
+    assert [topic for topic, _qos in handler_action.topics] == [
+        "$share/{}/{}".format(shared_group, handler_action.topic_wildcard_invocation)
+    ]
+
+    assert [topic for topic, _qos in handler_prop.topics] == [
+        "$share/{}/{}".format(shared_group, handler_prop.topic_wildcard_requests)
+    ]
+
+    handler_action_plain = ActionMQTTHandler(mqtt_server=server)
+
+    assert [topic for topic, _qos in handler_action_plain.topics] == [
+        handler_action_plain.topic_wildcard_invocation
+    ]
+
+    topic = uuid.uuid4().hex
+
+    assert BaseMQTTHandler.build_shared_topic(topic) == topic
+    assert BaseMQTTHandler.build_shared_topic(topic, shared_group).startswith(
+        BaseMQTTHandler.SHARED_SUBSCRIPTION_PREFIX
+    )
+
+
+def test_topic_router_shared_subscriptions():
+    """Messages published on plain topics are dispatched to the
+    handlers that subscribed through shared subscription topics."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    shared_group = uuid.uuid4().hex
+    servient_id = server.servient_id
+
+    handlers = [
+        PingMQTTHandler(mqtt_server=server),
+        PropertyMQTTHandler(mqtt_server=server, shared_group=shared_group),
+        ActionMQTTHandler(mqtt_server=server, shared_group=shared_group),
+    ]
+
+    handler_ping, handler_prop, handler_action = handlers
+
+    router = MQTTTopicRouter()
+
+    for handler in handlers:
+        for topic, _qos in handler.topics:
+            router.add(topic, handler)
+
+    assert router.route("{}/action/invocation/thing/action".format(servient_id)) == [
+        handler_action
+    ]
+
+    assert router.route("{}/property/requests/thing/prop".format(servient_id)) == [
+        handler_prop
+    ]
+
+    assert router.route("{}/property/updates/thing/prop".format(servient_id)) == []
+    assert router.route("$share/{}/other".format(shared_group)) == []
+
+    handler_other_group = object()
+    router.add(
+        "$share/{}/{}".format(
+            uuid.uuid4().hex, handler_action.topic_wildcard_invocation
+        ),
+        handler_other_group,
+    )
+
+    assert router.route("{}/action/invocation/thing/action".format(servient_id)) == [
+        handler_action,
+        handler_other_group,
+    ]
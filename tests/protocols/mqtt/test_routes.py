@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import uuid
+
+import pytest
+from faker import Faker
+from mock import patch
+
+from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
+from wotpy.protocols.mqtt.handlers.routes import InteractionRoutes
+from wotpy.protocols.mqtt.server import MQTTServer
+from wotpy.wot.dictionaries.interaction import ActionFragmentDict, PropertyFragmentDict
+from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+
+def _build_exposed_thing():
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+
+    exposed_thing.add_property(
+        uuid.uuid4().hex,
+        PropertyFragmentDict({"type": "string", "observable": True}),
+        value=Faker().sentence(),
+    )
+
+    return exposed_thing
+
+
+def test_interaction_routes():
+    """The routing table is kept updated as ExposedThings and their Interactions change."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    exposed_thing = _build_exposed_thing()
+    server.add_exposed_thing(exposed_thing)
+
+    routes = InteractionRoutes(
+        interaction_type=InteractionTypes.PROPERTY, server=server
+    )
+
+    routes.start()
+
+    prop = next(iter(exposed_thing.thing.properties.values()))
+    thing_url_name = exposed_thing.thing.url_name
+
+    assert routes.find(thing_url_name, prop.url_name) == (exposed_thing, prop)
+    assert routes.find(thing_url_name, uuid.uuid4().hex) is None
+
+    prop_name = uuid.uuid4().hex
+    exposed_thing.add_property(prop_name, PropertyFragmentDict({"type": "number"}))
+    prop_new = exposed_thing.thing.properties[prop_name]
+
+    assert routes.find(thing_url_name, prop_new.url_name) == (exposed_thing, prop_new)
+
+    exposed_thing.add_action(
+        uuid.uuid4().hex, ActionFragmentDict({"input": {"type": "number"}})
+    )
+
+    assert len(routes) == 2
+
+    exposed_thing.remove_property(prop_name)
+
+    assert routes.find(thing_url_name, prop_new.url_name) is None
+
+    with patch.object(
+        routes, "_index_exposed_thing", wraps=routes._index_exposed_thing
+    ) as mock_index:
+        assert routes.find(thing_url_name, uuid.uuid4().hex) is None
+        assert mock_index.call_count == 0
+
+    exposed_thing.title = Faker().pystr()
+
+    assert routes.find(exposed_thing.thing.url_name, prop.url_name) == (
+        exposed_thing,
+        prop,
+    )
+
+    assert routes.find(thing_url_name, prop.url_name) is None
+
+    thing_url_name = exposed_thing.thing.url_name
+    exposed_thing.thing.title = Faker().pystr()
+
+    assert routes.find(exposed_thing.thing.url_name, prop.url_name) == (
+        exposed_thing,
+        prop,
+    )
+
+    assert routes.find(thing_url_name, prop.url_name) is None
+
+    exposed_thing_other = _build_exposed_thing()
+    server.add_exposed_thing(exposed_thing_other)
+
+    assert len(routes) == 2
+
+    server.remove_exposed_thing(exposed_thing.thing.id)
+
+    assert len(routes) == 1
+
+    routes.dispose()
+
+    assert len(routes) == 0
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_title_change():
+    """Property updates are published on the topics of the new
+    Thing URL name after the title of the ExposedThing changes."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    exposed_thing = _build_exposed_thing()
+    server.add_exposed_thing(exposed_thing)
+    prop = next(iter(exposed_thing.thing.properties.values()))
+    handler = PropertyMQTTHandler(mqtt_server=server)
+
+    await handler.init()
+
+    try:
+        topic_old = handler.build_property_updates_topic(exposed_thing, prop)
+        exposed_thing.title = Faker().pystr()
+        topic_new = handler.build_property_updates_topic(exposed_thing, prop)
+
+        assert topic_new != topic_old
+
+        await asyncio.sleep(0.1)
+        await exposed_thing.properties[prop.name].write(Faker().sentence())
+
+        messages = [handler.queue.get_nowait() for _ in range(handler.queue.qsize())]
+
+        assert [msg["topic"] for msg in messages] == [topic_new]
+    finally:
+        await handler.teardown()
+
+
+@pytest.mark.asyncio
+async def test_shared_watcher():
+    """All the MQTT handlers of a server share one ExposedThings watcher."""
+
+    server = MQTTServer(broker_url="mqtt://localhost")
+    exposed_thing = _build_exposed_thing()
+    server.add_exposed_thing(exposed_thing)
+    watcher = server.exposed_things_watcher
+    handlers = [runner.mqtt_handlers for runner in server._handler_runners]
+    handlers = [handler for items in handlers for handler in items]
+
+    await asyncio.gather(*[handler.init() for handler in handlers])
+
+    try:
+        assert watcher.num_listeners == 4
+        assert watcher.exposed_things == [exposed_thing]
+
+        with patch.object(
+            exposed_thing, "on_td_change", wraps=exposed_thing.on_td_change
+        ) as mock_on_td_change:
+            server.remove_exposed_thing(exposed_thing.thing.id)
+            server.add_exposed_thing(exposed_thing)
+
+            assert mock_on_td_change.call_count == 1
+    finally:
+        await asyncio.gather(*[handler.teardown() for handler in handlers])
+
+    assert watcher.num_listeners == 0
+    assert watcher.exposed_things == []
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import types
+import uuid
+
+import pytest
+
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.runner import MQTTHandlerRunner
+
+
+class OrderedHandler(BaseMQTTHandler):
+    """Handler that orders the messages by payload key and
+    blocks on the messages that are flagged as blocking."""
+
+    def __init__(self):
+        super(OrderedHandler, self).__init__(mqtt_server=None)
+        self.event_release = asyncio.Event()
+        self.handled = []
+
+    def ordering_key(self, msg):
+        return msg.payload["key"]
+
+    async def handle_message(self, msg):
+        if msg.payload.get("block"):
+            await self.event_release.wait()
+
+        self.handled.append(msg.payload["id"])
+
+
+def _build_broker_free_runner(handler, **kwargs):
+    """Builds a runner that does not connect to a broker."""
+
+    runner = MQTTHandlerRunner(
+        broker_url="mqtt://localhost", mqtt_handler=handler, **kwargs
+    )
+
+    async def no_connection(*args, **kwargs):
+        pass
+
+    async def deliver_messages():
+        await runner._event_stop_request.wait()
+
+    runner.connect = no_connection
+    runner.disconnect = no_connection
+    runner._deliver_messages = deliver_messages
+
+    return runner
+
+
+def _message(key, block=False):
+    """Builds a message for the ordered handler."""
+
+    payload = {"id": uuid.uuid4().hex, "key": key, "block": block}
+
+    return types.SimpleNamespace(topic=key, payload=payload)
+
+
+@pytest.mark.asyncio
+async def test_restart_saturated_runner():
+    """A runner that is stopped while all the concurrency slots are taken
+    does not leave stale ordering queues behind when it is restarted."""
+
+    handler = OrderedHandler()
+    runner = _build_broker_free_runner(handler, concurrency=1)
+
+    await runner.start()
+
+    msg_blocking = _message("key_01", block=True)
+    msg_waiting = _message("key_02")
+
+    runner._messages_buffer.put_nowait(msg_blocking)
+    runner._messages_buffer.put_nowait(msg_waiting)
+
+    while not runner._messages_buffer.empty() or runner.num_inflight < 1:
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.05)
+
+    task_stop = asyncio.create_task(runner.stop(run_loop_timeout=5))
+    await asyncio.sleep(0.05)
+    handler.event_release.set()
+    await asyncio.wait_for(task_stop, timeout=5)
+
+    assert handler.handled == [msg_blocking.payload["id"]]
+    assert runner.num_inflight == 0
+    assert runner.num_parked == 0
+
+    await runner.start()
+
+    msg_restart = _message("key_02")
+    runner._messages_buffer.put_nowait(msg_restart)
+
+    async def wait_handled():
+        while msg_restart.payload["id"] not in handler.handled:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait_handled(), timeout=5)
+
+    assert runner.num_parked == 0
+
+    await runner.stop(run_loop_timeout=5)
@@ -22,7 +22,14 @@ from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.server import MQTTServer
 from wotpy.protocols.mqtt.utils import MQTTBrokerURL
-from wotpy.wot.dictionaries.interaction import ActionFragmentDict, PropertyFragmentDict
+from wotpy.wot.dictionaries.interaction import (
+    ActionFragmentDict,
+    EventFragmentDict,
+    PropertyFragmentDict,
+)
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
 
 pytestmark = pytest.mark.skipif(
     is_test_broker_online() is False, reason=BROKER_SKIP_REASON
@@ -74,15 +81,16 @@ async def _ping(mqtt_server, timeout=None):
         async with aiomqtt.Client(**_client_config()) as client:
             await client.subscribe(topic=topic_pong, qos=2)
 
-            async def read_messages():
-                async with client.messages() as messages:
+            async with client.messages() as messages:
+
+                async def read_messages():
                     async for message in messages:
                         assert message.payload == bytes_payload
                         break
 
-            _logger.debug("Sending PING message: %s", bytes_payload)
-            await client.publish(topic_ping, payload=bytes_payload, qos=2)
-            await asyncio.wait_for(read_messages(), timeout=timeout)
+                _logger.debug("Sending PING message: %s", bytes_payload)
+                await client.publish(topic_ping, payload=bytes_payload, qos=2)
+                await asyncio.wait_for(read_messages(), timeout=timeout)
 
         return True
     except Exception:
@@ -148,6 +156,21 @@ async def test_servient_id():
     await asyncio.gather(mqtt_srv_01.stop(), mqtt_srv_03.stop())
 
 
+@pytest.mark.asyncio
+async def test_multiplexed_start_stop():
+    """A multiplexed MQTT server uses a single broker connection for all handlers."""
+
+    mqtt_server = MQTTServer(broker_url=get_test_broker_url(), multiplexed=True)
+
+    assert mqtt_server.multiplexed
+
+    await mqtt_server.start()
+    assert await _ping(mqtt_server)
+    await mqtt_server.stop()
+
+    assert not await _ping(mqtt_server, timeout=DEFAULT_PING_TIMEOUT)
+
+
 @pytest.mark.asyncio
 async def test_property_read(mqtt_server):
     """Current Property values may be requested using the MQTT binding."""
@@ -241,7 +264,9 @@ CALLBACK_MS = 50
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "mqtt_server", [{"property_callback_ms": CALLBACK_MS}], indirect=True
+    "mqtt_server",
+    [{"property_callback_ms": CALLBACK_MS}, {"property_callback_ms": None}],
+    indirect=True,
 )
 async def test_property_add_remove(mqtt_server):
     """The MQTT binding reacts appropriately to Properties
@@ -375,6 +400,38 @@ async def test_observe_property_changes(mqtt_server):
         await task_write
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mqtt_server",
+    [{"property_min_interval_ms": 200, "property_retain": True}],
+    indirect=True,
+)
+async def test_observe_property_coalesced(mqtt_server):
+    """Property updates are rate limited, coalesced to the
+    latest value and retained for late subscribers."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    prop_name = next(iter(exposed_thing.thing.properties.keys()))
+    prop = exposed_thing.thing.properties[prop_name]
+    topic_observe = build_topic(mqtt_server, prop, InteractionVerbs.OBSERVE_PROPERTY)
+
+    values = [Faker().sentence() for _ in range(20)]
+
+    for value in values:
+        await exposed_thing.properties[prop_name].write(value)
+
+    await asyncio.sleep(0.5)
+
+    async with aiomqtt.Client(**_client_config()) as client:
+        async with client.messages() as obs_msgs:
+            await client.subscribe(topic=topic_observe, qos=0)
+            msg = await asyncio.wait_for(obs_msgs.__aiter__().__anext__(), timeout=1.0)
+
+        await client.publish(topic_observe, payload=b"", retain=True)
+
+    assert json.loads(msg.payload.decode()).get("value") == values[-1]
+
+
 @pytest.mark.asyncio
 async def test_observe_event(mqtt_server):
     """Events may be observed using the MQTT binding."""
@@ -411,6 +468,31 @@ async def test_observe_event(mqtt_server):
         await task_emit
 
 
+@pytest.mark.asyncio
+async def test_observe_event_thing_added(mqtt_server):
+    """Events of ExposedThings added to a running MQTT server
+    are published without waiting for a periodic refresh."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    event_name = uuid.uuid4().hex
+    exposed_thing.add_event(event_name, EventFragmentDict({"type": "number"}))
+    mqtt_server.add_exposed_thing(exposed_thing)
+
+    event = exposed_thing.thing.events[event_name]
+    topic = build_topic(mqtt_server, event, InteractionVerbs.SUBSCRIBE_EVENT)
+
+    async with mqtt_client(topic) as client:
+        emitted_value = Faker().pyint()
+        exposed_thing.events[event_name].emit(emitted_value)
+
+        async with client.messages() as obs_msgs:
+            msg = await asyncio.wait_for(obs_msgs.__aiter__().__anext__(), timeout=1.0)
+
+        assert json.loads(msg.payload.decode()).get("data") == emitted_value
+
+    mqtt_server.remove_exposed_thing(exposed_thing.thing.id)
+
+
 @pytest.mark.asyncio
 async def test_action_invoke(mqtt_server):
     """Actions can be invoked using the MQTT binding."""
@@ -427,11 +509,11 @@ async def test_action_invoke(mqtt_server):
             data = {"id": uuid.uuid4().hex, "input": Faker().pyint()}
             now_ms = int(time.time() * 1000)
 
-            await client_invoke.publish(
-                topic=topic_invoke, payload=json.dumps(data).encode(), qos=2
-            )
-
             async with client_result.messages() as msgs:
+                await client_invoke.publish(
+                    topic=topic_invoke, payload=json.dumps(data).encode(), qos=2
+                )
+
                 async for msg in msgs:
                     msg_data = json.loads(msg.payload.decode())
                     break
@@ -441,6 +523,76 @@ async def test_action_invoke(mqtt_server):
             assert msg_data.get("timestamp") >= now_ms
 
 
+@pytest.mark.asyncio
+async def test_action_invoke_shared_group():
+    """Replicas of a servient in the same shared subscription group
+    split the Action invocations between them."""
+
+    thing_id = uuid.uuid4().urn
+    action_name = uuid.uuid4().hex
+    servient_id = uuid.uuid4().hex
+    invocations = {}
+
+    def build_server(replica):
+        exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=thing_id))
+        invocations[replica] = 0
+
+        async def handler(parameters):
+            invocations[replica] += 1
+            return parameters.get("input")
+
+        exposed_thing.add_action(
+            action_name, ActionFragmentDict({"input": {"type": "number"}}), handler
+        )
+
+        server = MQTTServer(
+            broker_url=get_test_broker_url(),
+            servient_id=servient_id,
+            shared_group="replicas",
+        )
+
+        server.add_exposed_thing(exposed_thing)
+
+        return server, exposed_thing
+
+    servers = [build_server(replica) for replica in range(2)]
+    server, exposed_thing = servers[0]
+    action = exposed_thing.thing.actions[action_name]
+    topic_invoke = build_topic(server, action, InteractionVerbs.INVOKE_ACTION)
+    topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
+
+    await asyncio.gather(*[item.start() for item, _ in servers])
+
+    num_invocations = 10
+
+    try:
+        async with mqtt_client(topic_result) as client:
+            async with client.messages() as msgs:
+                for idx in range(num_invocations):
+                    data = {"id": uuid.uuid4().hex, "input": idx}
+
+                    await client.publish(
+                        topic=topic_invoke, payload=json.dumps(data).encode(), qos=2
+                    )
+
+                results = []
+
+                async def read_results():
+                    async for msg in msgs:
+                        results.append(json.loads(msg.payload.decode()))
+
+                        if len(results) == num_invocations:
+                            break
+
+                await asyncio.wait_for(read_results(), timeout=5.0)
+    finally:
+        await asyncio.gather(*[item.stop() for item, _ in servers])
+
+    assert sorted(item["result"] for item in results) == list(range(num_invocations))
+    assert sum(invocations.values()) == num_invocations
+    assert all(val > 0 for val in invocations.values())
+
+
 @pytest.mark.asyncio
 async def test_action_invoke_error(mqtt_server):
     """Action errors are handled appropriately by the MQTT binding."""
@@ -467,11 +619,11 @@ async def test_action_invoke_error(mqtt_server):
         async with mqtt_client(topic_result) as client_result:
             data = {"id": uuid.uuid4().hex, "input": Faker().pyint()}
 
-            await client_invoke.publish(
-                topic=topic_invoke, payload=json.dumps(data).encode(), qos=2
-            )
-
             async with client_result.messages() as msgs:
+                await client_invoke.publish(
+                    topic=topic_invoke, payload=json.dumps(data).encode(), qos=2
+                )
+
                 async for msg in msgs:
                     msg_data = json.loads(msg.payload.decode())
                     break
@@ -501,23 +653,27 @@ async def test_action_invoke_parallel(mqtt_server):
 
             now_ms = int(time.time() * 1000)
 
-            await asyncio.gather(
-                *[
-                    client_invoke.publish(
-                        topic=topic_invoke,
-                        payload=json.dumps(requests[idx]).encode(),
-                        qos=2,
-                    )
-                    for idx in range(num_requests)
-                ]
-            )
+            async with client_result.messages() as msgs:
+                await asyncio.gather(
+                    *[
+                        client_invoke.publish(
+                            topic=topic_invoke,
+                            payload=json.dumps(requests[idx]).encode(),
+                            qos=2,
+                        )
+                        for idx in range(num_requests)
+                    ]
+                )
 
-            for _ in range(num_requests):
-                async with client_result.messages() as msgs:
-                    async for msg in msgs:
-                        msg_data = json.loads(msg.payload.decode())
+                results = []
+
+                async for msg in msgs:
+                    results.append(json.loads(msg.payload.decode()))
+
+                    if len(results) == num_requests:
                         break
 
+            for msg_data in results:
                 expected = next(
                     item for item in requests if item.get("id") == msg_data.get("id")
                 )
@@ -525,3 +681,123 @@ async def test_action_invoke_parallel(mqtt_server):
                 assert msg_data.get("id") == expected.get("id")
                 assert msg_data.get("result") == "{:f}".format(expected.get("input"))
                 assert msg_data.get("timestamp") >= now_ms
+
+
+@pytest.mark.asyncio
+async def test_action_invoke_slow_handler(mqtt_server):
+    """A slow Action handler does not block the invocations of other Actions."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    name_slow = uuid.uuid4().hex
+    name_fast = uuid.uuid4().hex
+    event_release = asyncio.Event()
+
+    async def handler_slow(parameters):
+        await asyncio.wait_for(event_release.wait(), timeout=10)
+        return name_slow
+
+    async def handler_fast(parameters):
+        return name_fast
+
+    for name, handler in [(name_slow, handler_slow), (name_fast, handler_fast)]:
+        exposed_thing.add_action(
+            name, ActionFragmentDict({"output": {"type": "string"}}), handler
+        )
+
+    topics_invoke = [
+        build_topic(
+            mqtt_server,
+            exposed_thing.thing.actions[name],
+            InteractionVerbs.INVOKE_ACTION,
+        )
+        for name in [name_slow, name_fast]
+    ]
+
+    topics_result = [
+        (ActionMQTTHandler.to_result_topic(topic), 0) for topic in topics_invoke
+    ]
+
+    async with mqtt_client(topics_invoke[0]) as client_invoke:
+        async with mqtt_client(topics_result) as client_result:
+            async with client_result.messages() as msgs:
+                for topic in topics_invoke:
+                    await client_invoke.publish(
+                        topic=topic,
+                        payload=json.dumps({"id": uuid.uuid4().hex}).encode(),
+                        qos=2,
+                    )
+
+                results = []
+
+                async def read_results():
+                    async for msg in msgs:
+                        results.append(json.loads(msg.payload.decode()).get("result"))
+
+                        if len(results) == 1:
+                            event_release.set()
+                        elif len(results) == 2:
+                            break
+
+                await asyncio.wait_for(read_results(), timeout=5)
+
+    assert results == [name_fast, name_slow]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mqtt_server",
+    [{"concurrency": 2}, {"concurrency": 2, "multiplexed": True}],
+    indirect=True,
+)
+async def test_ordered_burst_no_head_of_line(mqtt_server):
+    """A burst of ordered requests on one topic does not take all the
+    concurrency slots and block the requests on other topics."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    prop_name = next(iter(exposed_thing.thing.properties.keys()))
+    prop = exposed_thing.thing.properties[prop_name]
+    action_name = next(iter(exposed_thing.thing.actions.keys()))
+    action = exposed_thing.thing.actions[action_name]
+    event_release = asyncio.Event()
+    event_writes_done = asyncio.Event()
+    values_written = []
+    num_writes = 10
+
+    async def write_handler(value):
+        await asyncio.wait_for(event_release.wait(), timeout=10)
+        values_written.append(value)
+
+        if len(values_written) == num_writes:
+            event_writes_done.set()
+
+    exposed_thing.set_property_write_handler(prop_name, write_handler)
+
+    topic_write = build_topic(mqtt_server, prop, InteractionVerbs.WRITE_PROPERTY)
+    topic_invoke = build_topic(mqtt_server, action, InteractionVerbs.INVOKE_ACTION)
+    topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
+
+    try:
+        async with mqtt_client(topic_result) as client:
+            async with client.messages() as msgs:
+                for idx in range(num_writes):
+                    await client.publish(
+                        topic=topic_write,
+                        payload=json.dumps({"action": "write", "value": idx}).encode(),
+                        qos=1,
+                    )
+
+                await client.publish(
+                    topic=topic_invoke,
+                    payload=json.dumps({"id": uuid.uuid4().hex, "input": 1}).encode(),
+                    qos=2,
+                )
+
+                msg = await asyncio.wait_for(msgs.__aiter__().__anext__(), timeout=5)
+
+        assert json.loads(msg.payload.decode()).get("result") == "{:f}".format(1)
+    finally:
+        event_release.set()
+
+    await asyncio.wait_for(event_writes_done.wait(), timeout=5)
+
+    assert values_written == list(range(num_writes))
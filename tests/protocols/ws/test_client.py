@@ -8,6 +8,7 @@ import uuid
 import pytest
 import tornado.concurrent
 import tornado.gen
+import tornado.websocket
 from mock import patch
 from rx.concurrency import IOLoopScheduler
 from tornado.concurrent import Future
@@ -23,6 +24,8 @@ from tests.protocols.helpers import (
 from tests.utils import run_test_coroutine
 from wotpy.protocols.exceptions import ClientRequestTimeout, ProtocolClientException
 from wotpy.protocols.ws.client import WebsocketClient
+from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.protocols.ws.messages import WebsocketMessageRequest
 from wotpy.wot.td import ThingDescription
 
 
@@ -141,6 +144,124 @@ def test_on_property_change(websocket_servient):
     run_test_coroutine(test_coroutine)
 
 
+def test_subscriptions_shared_connection(websocket_servient):
+    """Requests and subscriptions to the same servient share one WebSockets connection."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_names = list(td.properties.keys())
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+
+        with patch(
+            "tornado.websocket.websocket_connect",
+            wraps=tornado.websocket.websocket_connect,
+        ) as mock_connect:
+            futures = {name: Future() for name in prop_names}
+
+            def build_on_next(name):
+                def on_next(ev):
+                    if not futures[name].done():
+                        futures[name].set_result(ev.data.value)
+
+                return on_next
+
+            subscriptions = [
+                ws_client.on_property_change(td, name)
+                .subscribe_on(IOLoopScheduler())
+                .subscribe(build_on_next(name))
+                for name in prop_names
+            ]
+
+            while not all(fut.done() for fut in futures.values()):
+                for name in prop_names:
+                    yield exposed_thing.write_property(name, uuid.uuid4().hex)
+
+                yield tornado.gen.sleep(0.05)
+
+            value = yield ws_client.read_property(td, prop_names[0])
+
+            assert value == (yield exposed_thing.read_property(prop_names[0]))
+            assert mock_connect.call_count == 1
+
+            for subscription in subscriptions:
+                subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_connection_pool(websocket_servient):
+    """Idle connections are kept open and reused by sequential requests."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    num_reads = 5
+
+    @tornado.gen.coroutine
+    def read_sequentially(ws_client):
+        with patch(
+            "tornado.websocket.websocket_connect",
+            wraps=tornado.websocket.websocket_connect,
+        ) as mock_connect:
+            for _ in range(num_reads):
+                yield ws_client.read_property(td, prop_name)
+
+            return mock_connect.call_count
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient(idle_timeout_secs=10)
+
+        assert (yield read_sequentially(ws_client)) == 1
+        assert ws_client.pool_stats["hits"] == num_reads - 1
+        assert ws_client.pool_stats["misses"] == 1
+        assert ws_client.pool_stats["idle"] == 1
+
+        yield ws_client.shutdown()
+
+        assert ws_client.pool_stats["idle"] == 0
+
+        ws_client = WebsocketClient()
+
+        assert (yield read_sequentially(ws_client)) == num_reads
+        assert ws_client.pool_stats["misses"] == num_reads
+        assert ws_client.pool_stats["idle"] == 0
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_servient_shutdown(websocket_servient):
+    """Connections kept idle by the pool are closed when the servient shuts down."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient(idle_timeout_secs=10)
+
+        yield websocket_servient.shutdown()
+        websocket_servient.add_client(ws_client)
+        yield websocket_servient.start()
+        yield ws_client.read_property(td, prop_name)
+
+        assert ws_client.pool_stats["idle"] == 1
+
+        ws_conns = list(ws_client._conns.values())
+
+        yield websocket_servient.shutdown()
+
+        assert ws_client.pool_stats["idle"] == 0
+        assert not ws_client._conns
+        assert all(ws_conn.protocol is None for ws_conn in ws_conns)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_on_property_change_error(websocket_servient):
     """Errors that arise in the middle of an ongoing Property
     observation are propagated to the subscription as expected."""
@@ -148,11 +269,11 @@ def test_on_property_change_error(websocket_servient):
     client_test_on_property_change_error(websocket_servient, WebsocketClient)
 
 
-def _condition_coro(*args, **kwargs):
-    """Coroutine mock side effect that returns a Condition that is never notified."""
+def _pending_future_coro(*args, **kwargs):
+    """Coroutine mock side effect that returns a Future that is never resolved."""
 
     async def _coro():
-        return asyncio.Condition()
+        return asyncio.Future()
 
     return _coro()
 
@@ -160,7 +281,7 @@ def _condition_coro(*args, **kwargs):
 def test_timeout_read_property(websocket_servient):
     """Timeouts can be defined on Property reads."""
 
-    with patch.object(WebsocketClient, "_send_message", _condition_coro):
+    with patch.object(WebsocketClient, "_send_message", _pending_future_coro):
         with pytest.raises(ClientRequestTimeout):
             client_test_read_property(
                 websocket_servient, WebsocketClient, timeout=random.random()
@@ -170,13 +291,56 @@ def test_timeout_read_property(websocket_servient):
 def test_timeout_write_property(websocket_servient):
     """Timeouts can be defined on Property writes."""
 
-    with patch.object(WebsocketClient, "_send_message", _condition_coro):
+    with patch.object(WebsocketClient, "_send_message", _pending_future_coro):
         with pytest.raises(ClientRequestTimeout):
             client_test_write_property(
                 websocket_servient, WebsocketClient, timeout=random.random()
             )
 
 
+def test_pending_requests_eviction(websocket_servient):
+    """Pending requests are removed from the client on completion and on timeout."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+
+        yield [ws_client.read_property(td, prop_name) for _ in range(20)]
+
+        assert ws_client.num_pending_requests == 0
+
+        with patch.object(WebsocketClient, "_resolve_pending_request"):
+            with pytest.raises(ClientRequestTimeout):
+                yield ws_client.read_property(td, prop_name, timeout=0.1)
+
+        assert ws_client.num_pending_requests == 0
+
+    run_test_coroutine(test_coroutine)
+
+
+@pytest.mark.asyncio
+async def test_request_without_connection():
+    """Requests on a URL without an active connection raise a client error."""
+
+    ws_client = WebsocketClient()
+    ws_url = "ws://localhost/{}".format(uuid.uuid4().hex)
+
+    msg_req = WebsocketMessageRequest(
+        method=WebsocketMethods.READ_PROPERTY,
+        params={"name": uuid.uuid4().hex},
+        msg_id=uuid.uuid4().hex,
+    )
+
+    with pytest.raises(ProtocolClientException):
+        await ws_client._request(ws_url, msg_req)
+
+    assert ws_client.num_pending_requests == 0
+
+
 @pytest.mark.skip(reason="ToDo: Implement this test")
 @pytest.mark.asyncio
 async def test_timeout_invoke_action(websocket_servient):
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import uuid
+
+import pytest
+from faker import Faker
+from mock import MagicMock, patch
+
+from wotpy.protocols.ws import messages
+from wotpy.protocols.ws.enums import WebsocketErrors, WebsocketMethods
+from wotpy.protocols.ws.messages import (
+    WebsocketMessageEmittedItem,
+    WebsocketMessageError,
+    WebsocketMessageException,
+    WebsocketMessageRequest,
+    WebsocketMessageResponse,
+    parse_ws_message,
+)
+from wotpy.protocols.ws.schemas import JSON_RPC_VERSION
+
+
+def _build_messages():
+    """Returns a list of valid messages of each class."""
+
+    return [
+        WebsocketMessageRequest(
+            method=WebsocketMethods.READ_PROPERTY,
+            params={"name": Faker().pystr()},
+            msg_id=uuid.uuid4().hex,
+        ),
+        WebsocketMessageResponse(result=Faker().pystr(), msg_id=uuid.uuid4().hex),
+        WebsocketMessageError(
+            message=Faker().pystr(),
+            code=WebsocketErrors.INVALID_METHOD_PARAMS,
+            msg_id=uuid.uuid4().hex,
+        ),
+        WebsocketMessageEmittedItem(
+            subscription_id=uuid.uuid4().hex,
+            name=Faker().pystr(),
+            data={"value": Faker().pyint()},
+        ),
+    ]
+
+
+def test_parse_dispatch_by_shape():
+    """Raw messages are parsed to the message class that matches their shape."""
+
+    for msg in _build_messages():
+        parsed = parse_ws_message(msg.to_json())
+        assert isinstance(parsed, msg.__class__)
+        assert parsed.to_dict() == msg.to_dict()
+
+
+def test_parse_validates_once():
+    """Parsed messages are validated once and built with validate=False."""
+
+    msg = _build_messages()[0]
+    validator = MagicMock(wraps=messages.VALIDATOR_REQUEST)
+
+    with patch.object(messages, "VALIDATOR_REQUEST", validator):
+        with patch.object(
+            messages, "WebsocketMessageRequest", wraps=WebsocketMessageRequest
+        ) as mock_request:
+            parse_ws_message(msg.to_json())
+
+    assert validator.validate.call_count == 1
+    assert mock_request.call_args[1].get("validate") is False
+
+
+def test_parse_malformed_json():
+    """Raw messages that are not valid JSON raise WebsocketMessageException."""
+
+    with pytest.raises(WebsocketMessageException):
+        parse_ws_message("{" + Faker().pystr())
+
+    with pytest.raises(WebsocketMessageException):
+        parse_ws_message(None)
+
+
+def test_parse_unknown_shape():
+    """Raw messages with an unknown shape raise WebsocketMessageException."""
+
+    unknown_msgs = [
+        {"jsonrpc": JSON_RPC_VERSION, "id": uuid.uuid4().hex},
+        [{"method": WebsocketMethods.READ_PROPERTY}],
+        Faker().pyint(),
+    ]
+
+    for msg in unknown_msgs:
+        with pytest.raises(WebsocketMessageException):
+            parse_ws_message(json.dumps(msg))
+
+
+def test_parse_invalid_params():
+    """Requests with invalid params or methods raise WebsocketMessageException."""
+
+    invalid_reqs = [
+        {
+            "jsonrpc": JSON_RPC_VERSION,
+            "method": WebsocketMethods.READ_PROPERTY,
+            "params": Faker().pystr(),
+            "id": uuid.uuid4().hex,
+        },
+        {
+            "jsonrpc": JSON_RPC_VERSION,
+            "method": WebsocketMethods.READ_PROPERTY,
+            "id": uuid.uuid4().hex,
+        },
+        {
+            "jsonrpc": JSON_RPC_VERSION,
+            "method": Faker().pystr(),
+            "params": {},
+            "id": uuid.uuid4().hex,
+        },
+    ]
+
+    for msg in invalid_reqs:
+        with pytest.raises(WebsocketMessageException):
+            parse_ws_message(json.dumps(msg))
+
+    with pytest.raises(WebsocketMessageException):
+        parse_ws_message(json.dumps({"jsonrpc": JSON_RPC_VERSION, "error": {}}))
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import gc
 import time
 import uuid
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
@@ -17,6 +19,7 @@ from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.enums import DataType, TDChangeMethod, TDChangeType
 from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.exposed.thing_set import ExposedThingSet
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
 
@@ -349,6 +352,52 @@ def test_on_td_change(
     )
 
 
+def test_on_td_change_thing(exposed_thing):
+    """Updates of the ThingFragment attributes, either through the ExposedThing
+    or directly on the Thing, are observed as THING Thing Description changes."""
+
+    td_changes = []
+
+    exposed_thing.thing.title = Faker().pystr()
+
+    subscription = exposed_thing.on_td_change().subscribe(on_next=td_changes.append)
+
+    title_exposed = Faker().pystr()
+    exposed_thing.title = title_exposed
+
+    title_thing = Faker().pystr()
+    exposed_thing.thing.title = title_thing
+
+    subscription.dispose()
+
+    exposed_thing.thing.title = Faker().pystr()
+
+    assert len(td_changes) == 2
+    assert all(item.data.td_change_type == TDChangeType.THING for item in td_changes)
+    assert all(item.data.method == TDChangeMethod.CHANGE for item in td_changes)
+    assert all(item.data.name == "title" for item in td_changes)
+    assert td_changes[0].data.description["title"] == title_exposed
+    assert td_changes[1].data.description["title"] == title_thing
+
+
+def test_thing_change_callback_collected():
+    """The Thing does not keep alive the ExposedThings built on top of it."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+    exp_thing = ExposedThing(servient=Servient(), thing=thing)
+    ref_exp_thing = weakref.ref(exp_thing)
+
+    assert len(thing._change_callbacks) == 1
+
+    del exp_thing
+    gc.collect()
+
+    assert ref_exp_thing() is None
+    assert len(thing._change_callbacks) == 0
+
+    thing.title = Faker().pystr()
+
+
 def test_thing_property_get(exposed_thing, property_fragment):
     """Property values can be retrieved on ExposedThings using the map-like interface."""
 
@@ -620,14 +669,25 @@ def test_thing_fragment_getters_setters():
     description_original = thing_fragment.description
     description_updated = Faker().pystr()
 
+    td_changes = []
+    exp_thing.on_td_change().subscribe(on_next=td_changes.append)
+
     exp_thing.title = title_updated
     exp_thing.description = description_updated
 
+    assert [item.data.name for item in td_changes] == ["title", "description"]
+    assert all(item.data.td_change_type == TDChangeType.THING for item in td_changes)
+    assert all(item.data.method == TDChangeMethod.CHANGE for item in td_changes)
+
     assert exp_thing.title == title_updated
     assert exp_thing.title != title_original
     assert exp_thing.description == description_updated
     assert exp_thing.description != description_original
 
+    exp_thing.thing.title = Faker().pystr()
+
+    assert [item.data.name for item in td_changes] == ["title", "description", "title"]
+
     with pytest.raises(AttributeError):
         # noinspection PyPropertyAccess
         exp_thing.id = Faker().pystr()
@@ -707,3 +767,90 @@ def test_interaction_name_url_safe():
     """ExposedThing interaction names are equivalent in a URL-safe fashion."""
 
     _test_equivalent_interaction_names("url_UnSafE-Str", lambda name: slugify(name))
+
+
+def test_exposed_thing_set_lookups(property_fragment):
+    """ExposedThingSet lookups by ID, URL name and interaction stay consistent."""
+
+    servient = Servient()
+    thing_set = ExposedThingSet()
+
+    exp_things = [
+        ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+        for _ in range(5)
+    ]
+
+    for exp_thing in exp_things:
+        exp_thing.add_property(Faker().pystr(), property_fragment)
+        thing_set.add(exp_thing)
+
+    exp_thing = exp_things[2]
+    prop = next(iter(exp_thing.thing.properties.values()))
+
+    assert thing_set.contains(exp_thing)
+    assert thing_set.find_by_thing_id(exp_thing.id) is exp_thing
+    assert thing_set.find_by_thing_id(exp_thing.url_name) is exp_thing
+    assert thing_set.find_by_interaction(prop) is exp_thing
+    assert thing_set.find_by_thing_id(uuid.uuid4().urn) is None
+    assert thing_set.find_by_thing_id(exp_thing.uuid) is None
+
+    url_name_original = exp_thing.url_name
+    exp_thing.title = Faker().sentence()
+
+    assert thing_set.find_by_thing_id(url_name_original) is None
+    assert thing_set.find_by_thing_id(exp_thing.url_name) is exp_thing
+
+    thing_set.remove(exp_thing.url_name)
+
+    assert not thing_set.contains(exp_thing)
+    assert thing_set.find_by_thing_id(exp_thing.id) is None
+    assert thing_set.find_by_interaction(prop) is None
+    assert len(list(thing_set.exposed_things)) == len(exp_things) - 1
+
+
+def test_event_routing(exposed_thing, property_fragment, event_fragment):
+    """Emissions only reach the subscribers of the related event or property."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_names = [uuid.uuid4().hex for _ in range(3)]
+        event_names = [uuid.uuid4().hex for _ in range(3)]
+
+        for name in prop_names:
+            exposed_thing.add_property(name, property_fragment)
+
+        for name in event_names:
+            exposed_thing.add_event(name, event_fragment)
+
+        received = {name: [] for name in prop_names + event_names}
+
+        def build_on_next(name):
+            return lambda item: received[name].append(item)
+
+        subscriptions = [
+            exposed_thing.on_property_change(name).subscribe(build_on_next(name))
+            for name in prop_names
+        ] + [
+            exposed_thing.on_event(name).subscribe(build_on_next(name))
+            for name in event_names
+        ]
+
+        yield exposed_thing.write_property(prop_names[0], Faker().pystr())
+        exposed_thing.emit_event(event_names[1], Faker().pystr())
+        exposed_thing.emit_event(event_names[1], Faker().pystr())
+
+        assert [len(received[name]) for name in prop_names] == [1, 0, 0]
+        assert [len(received[name]) for name in event_names] == [0, 2, 0]
+        assert received[prop_names[0]][0].data.name == prop_names[0]
+        assert all(item.name == event_names[1] for item in received[event_names[1]])
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        yield exposed_thing.write_property(prop_names[0], Faker().pystr())
+        exposed_thing.emit_event(event_names[1], Faker().pystr())
+
+        assert [len(received[name]) for name in prop_names] == [1, 0, 0]
+        assert [len(received[name]) for name in event_names] == [0, 2, 0]
+
+    run_test_coroutine(test_coroutine)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import contextlib
 import json
 import random
 import uuid
@@ -11,6 +12,7 @@ import tornado.httpclient
 import tornado.ioloop
 import tornado.websocket
 from faker import Faker
+from mock import patch
 
 from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.enums import Protocols
@@ -103,6 +105,55 @@ def test_servient_td_catalogue(servient):
     run_test_coroutine(test_coroutine)
 
 
+def test_servient_td_catalogue_etag(servient):
+    """The TD catalogue responses carry an ETag that changes when the TD changes."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+        exposed_thing = wot.produce(json.dumps(TD_DICT_01))
+        exposed_thing.expose()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        thing_url = "http://localhost:{}/{}".format(
+            servient.catalogue_port, exposed_thing.thing.url_name
+        )
+
+        expanded_url = "http://localhost:{}/?expanded=true".format(
+            servient.catalogue_port
+        )
+
+        for url in [thing_url, expanded_url]:
+            res_01 = yield http_client.fetch(url)
+            res_02 = yield http_client.fetch(url)
+
+            etag = res_01.headers.get("Etag")
+
+            assert etag
+            assert etag == res_02.headers.get("Etag")
+            assert json.loads(res_01.body) == json.loads(res_02.body)
+
+            res_not_modified = yield http_client.fetch(
+                url, headers={"If-None-Match": etag}, raise_error=False
+            )
+
+            assert res_not_modified.code == 304
+
+        res_before = yield http_client.fetch(thing_url)
+
+        exposed_thing.add_property(uuid.uuid4().hex, {"type": "string"})
+
+        res_after = yield http_client.fetch(thing_url)
+
+        assert res_before.headers.get("Etag") != res_after.headers.get("Etag")
+        assert len(json.loads(res_after.body)["properties"]) == len(
+            json.loads(res_before.body)["properties"]
+        ) + 1
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_servient_start_stop():
     """The servient and contained ExposedThings can be started and stopped."""
 
@@ -261,3 +312,66 @@ def test_clients_config():
     )
 
     assert servient.clients[Protocols.HTTP].connect_timeout == connect_timeout
+
+
+@pytest.mark.asyncio
+async def test_shutdown_clients():
+    """Shutting down a Servient shuts down all its Protocol Binding clients."""
+
+    servient = Servient(catalogue_port=None)
+
+    with contextlib.ExitStack() as stack:
+        mocks_shutdown = [
+            stack.enter_context(patch.object(client, "shutdown", wraps=client.shutdown))
+            for client in servient.clients.values()
+        ]
+
+        await servient.shutdown()
+
+    assert all(mock_shutdown.call_count == 1 for mock_shutdown in mocks_shutdown)
+
+
+def test_enable_exposed_things():
+    """Multiple ExposedThings can be enabled at once and only
+    the Forms of the affected ExposedThings are regenerated."""
+
+    ws_server = WebsocketServer(port=find_free_port())
+
+    servient = Servient(hostname="localhost", catalogue_port=None)
+    servient.add_server(ws_server)
+
+    wot = WoT(servient=servient)
+
+    exposed_things = [
+        wot.produce(
+            json.dumps(
+                {
+                    "id": uuid.uuid4().urn,
+                    "title": Faker().sentence(),
+                    "properties": {"status": {"type": "string"}},
+                }
+            )
+        )
+        for _ in range(3)
+    ]
+
+    def prop_forms(exp_thing):
+        return exp_thing.thing.properties["status"].forms
+
+    exposed_things[0].expose()
+    forms_first = list(prop_forms(exposed_things[0]))
+
+    assert len(forms_first)
+    assert not len(prop_forms(exposed_things[1]))
+
+    servient.enable_exposed_things([item.id for item in exposed_things[1:]])
+
+    assert all(len(prop_forms(item)) for item in exposed_things)
+    assert all(a is b for a, b in zip(forms_first, prop_forms(exposed_things[0])))
+    assert len(list(servient.enabled_exposed_things)) == len(exposed_things)
+    assert len(list(ws_server.exposed_things)) == len(exposed_things)
+
+    servient.disable_exposed_thing(exposed_things[1].id)
+
+    assert not len(prop_forms(exposed_things[1]))
+    assert all(a is b for a, b in zip(forms_first, prop_forms(exposed_things[0])))
@@ -4,8 +4,10 @@
 import copy
 import uuid
 
+import jsonschema
 import pytest
 from faker import Faker
+from mock import patch
 
 from tests.td_examples import TD_EXAMPLE
 from wotpy.protocols.enums import Protocols
@@ -13,7 +15,7 @@ from wotpy.wot.td import ThingDescription
 from wotpy.wot.form import Form
 from wotpy.wot.interaction import Action, Property, Event
 from wotpy.wot.thing import Thing
-from wotpy.wot.validation import InvalidDescription
+from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
 
 
 def test_validate():
@@ -30,15 +32,66 @@ def test_validate_err():
         lambda x: x.update({"actions": "hello-interactions"}) or x,
         lambda x: x.update({"events": {"overheating": {"forms": 0.5}}}) or x,
         lambda x: x.update({"events": {"Invalid Name": {}}}) or x,
-        lambda x: x.update({"events": {100: {"label": "Invalid Name"}}}) or x
     ]
 
+    validator_class = jsonschema.validators.validator_for(SCHEMA_THING)
+
     for update_func in update_funcs:
         td_err = update_func(copy.deepcopy(TD_EXAMPLE))
 
-        with pytest.raises(InvalidDescription):
+        with pytest.raises(InvalidDescription) as excinfo:
             ThingDescription.validate(doc=td_err)
 
+        best_error = jsonschema.exceptions.best_match(
+            validator_class(SCHEMA_THING).iter_errors(td_err)
+        )
+
+        assert str(excinfo.value) == str(best_error)
+
+    td_err = copy.deepcopy(TD_EXAMPLE)
+    td_err.update({"events": {100: {"label": "Invalid Name"}}})
+
+    with pytest.raises(InvalidDescription):
+        ThingDescription.validate(doc=td_err)
+
+
+def test_validate_cache():
+    """Documents that have already been validated are not validated again."""
+
+    doc = copy.deepcopy(TD_EXAMPLE)
+    doc.update({"id": uuid.uuid4().urn})
+
+    validator = ThingDescription._validator
+
+    with patch.object(ThingDescription, "_validator") as mock_validator:
+        mock_validator.iter_errors.side_effect = validator.iter_errors
+
+        ThingDescription.validate(doc=doc)
+        ThingDescription.validate(doc=copy.deepcopy(doc))
+
+        assert mock_validator.iter_errors.call_count == 1
+
+        doc_err = copy.deepcopy(doc)
+        doc_err.update({"properties": [1, 2, 3]})
+
+        for _ in range(2):
+            with pytest.raises(InvalidDescription):
+                ThingDescription.validate(doc=doc_err)
+
+        assert mock_validator.iter_errors.call_count == 3
+
+
+def test_from_thing_skips_validation():
+    """Documents built internally from Thing objects are not validated."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    with patch.object(ThingDescription, "validate") as mock_validate:
+        td = ThingDescription.from_thing(thing)
+
+        assert td.id == thing.id
+        assert not mock_validate.called
+
 
 def test_from_dict():
     """ThingDescription objects can be built from TD documents in dict format."""
@@ -157,3 +157,81 @@ def test_duplicated_forms():
 
     with pytest.raises(ValueError):
         interaction.add_form(form_06)
+
+
+def test_thing_fragment_cache():
+    """The cached ThingFragment is kept in sync with interactions, forms and writable fields."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+    interaction = Action(thing=thing, name="my_interaction")
+    thing.add_interaction(interaction)
+
+    assert thing.thing_fragment.to_dict()["actions"][interaction.name]["forms"] == []
+
+    form = Form(interaction=interaction, protocol=Protocols.HTTP, href="/href-01")
+    interaction.add_form(form)
+
+    forms = thing.thing_fragment.to_dict()["actions"][interaction.name]["forms"]
+    assert [item["href"] for item in forms] == [form.href]
+
+    interaction.remove_form(form)
+
+    assert thing.thing_fragment.to_dict()["actions"][interaction.name]["forms"] == []
+
+    url_name_original = thing.url_name
+    thing.title = "Updated title"
+
+    assert thing.thing_fragment.title == "Updated title"
+    assert thing.url_name != url_name_original
+    assert thing.url_name == slugify("{}-{}".format(thing.title, thing.uuid))
+
+    thing.remove_interaction(interaction.name)
+
+    assert interaction.name not in thing.thing_fragment.to_dict().get("actions", {})
+
+
+def test_thing_fragment_copy():
+    """Changes in the returned ThingFragment do not affect the cached document."""
+
+    thing = Thing(id=uuid.uuid4().urn, security=["nosec_sc"])
+    thing.thing_fragment.security.append("basic_sc")
+
+    assert thing.thing_fragment.security == ["nosec_sc"]
+
+
+def test_fragment_dict_shared():
+    """The cached fragment dict is shared until the Thing changes."""
+
+    thing = Thing(id=uuid.uuid4().urn, title=uuid.uuid4().hex)
+    fragment_dict = thing.fragment_dict
+
+    assert thing.fragment_dict is fragment_dict
+    assert ThingDescription.from_thing(thing).to_dict() == fragment_dict
+
+    thing.title = uuid.uuid4().hex
+
+    assert thing.fragment_dict is not fragment_dict
+    assert thing.fragment_dict["title"] == thing.title
+
+
+def test_find_interaction_fragment_init():
+    """Interactions declared in the ThingFragment are indexed by name and URL-safe name."""
+
+    names = ["prop_{:03d}".format(idx) for idx in range(50)]
+
+    thing = Thing(
+        id=uuid.uuid4().urn,
+        properties={name: {"type": "string"} for name in names},
+        actions={"My_Action": {}},
+    )
+
+    for name in names:
+        assert thing.find_interaction(name) is thing.properties[name]
+        assert thing.find_interaction(slugify(name)) is thing.properties[name]
+
+    assert thing.find_interaction("my-action") is thing.actions["My_Action"]
+
+    thing.remove_interaction("my-action")
+
+    assert thing.find_interaction("My_Action") is None
+    assert thing.find_interaction("my-action") is None
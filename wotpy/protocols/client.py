@@ -70,3 +70,9 @@ class BaseProtocolClient(object):
         Returns an Observable."""
 
         raise NotImplementedError()
+
+    async def shutdown(self):
+        """Closes the connections kept open by this client.
+        Clients that do not keep connections open do nothing."""
+
+        pass
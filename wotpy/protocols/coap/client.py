@@ -37,8 +37,86 @@ class CoAPClient(BaseProtocolClient):
     def __init__(self):
         self._logr = logging.getLogger(__name__)
         self._coap_client = None
+        self._coap_client_loop = None
         super(CoAPClient, self).__init__()
 
+    async def _get_coap_client(self):
+        """Returns the CoAP client context shared by all requests and subscriptions.
+        The context is created on first use or when the event loop has changed.
+        Concurrent requests are multiplexed over the context by message ID and token."""
+
+        loop = asyncio.get_running_loop()
+
+        if self._coap_client is not None and self._coap_client_loop is not loop:
+            self._discard_coap_client()
+
+        if self._coap_client is None:
+            self._logr.debug("Creating shared CoAP client context")
+            self._coap_client_loop = loop
+            self._coap_client = asyncio.ensure_future(
+                aiocoap.Context.create_client_context()
+            )
+
+        fut_client = self._coap_client
+
+        try:
+            return await asyncio.shield(fut_client)
+        except Exception:
+            if self._coap_client is fut_client:
+                self._coap_client = None
+
+            raise
+
+    async def _shutdown_coap_client(self, fut_client):
+        """Shuts down the CoAP client context resolved by the given Future."""
+
+        try:
+            coap_client = await fut_client
+            await coap_client.shutdown()
+        except Exception as ex:
+            self._logr.debug("Error shutting down CoAP client context: {}".format(ex))
+
+    def _discard_coap_client(self):
+        """Drops the shared CoAP client context and shuts it down on the event
+        loop that created it. Contexts created on a loop that has already been
+        closed cannot be shut down anymore."""
+
+        fut_client, self._coap_client = self._coap_client, None
+        loop, self._coap_client_loop = self._coap_client_loop, None
+
+        if fut_client is None:
+            return
+
+        if loop.is_closed():
+            self._logr.debug("Dropped CoAP client context of a closed event loop")
+            return
+
+        self._logr.debug("Shutting down replaced CoAP client context")
+
+        asyncio.run_coroutine_threadsafe(
+            self._shutdown_coap_client(fut_client), loop=loop
+        )
+
+    async def shutdown(self):
+        """Shuts down the shared CoAP client context.
+        A new context is created if the client is used again afterwards."""
+
+        if self._coap_client_loop is not asyncio.get_running_loop():
+            self._discard_coap_client()
+            return
+
+        fut_client, self._coap_client = self._coap_client, None
+
+        if fut_client is not None:
+            await self._shutdown_coap_client(fut_client)
+
+    @classmethod
+    def _cancel_observation(cls, request):
+        """Cancels the observation of the given request if it is still active."""
+
+        if request is not None and not request.observation.cancelled:
+            request.observation.cancel()
+
     @classmethod
     def _pick_coap_href(cls, td, forms, op=None):
         """Picks the most appropriate CoAP form href from the given list of forms."""
@@ -86,11 +164,7 @@ class CoAPClient(BaseProtocolClient):
 
             @handle_observer_finalization(observer)
             async def callback():
-                self._logr.debug(
-                    "Creating CoAP client for observation: {}".format(query)
-                )
-
-                coap_client = await aiocoap.Context.create_client_context()
+                coap_client = await self._get_coap_client()
 
                 try:
                     msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href, observe=0)
@@ -121,16 +195,14 @@ class CoAPClient(BaseProtocolClient):
                         "Terminated subscription callback for: {}".format(query)
                     )
                 finally:
-                    await coap_client.shutdown()
+                    self._cancel_observation(state["request"])
 
             def unsubscribe():
                 self._logr.debug("Unsubscribing from: {}".format(query))
 
                 state["unsubscribe_event"].set()
 
-                if state["request"] and not state["request"].observation.cancelled:
-                    self._logr.debug("Cancelling observation on: {}".format(query))
-                    state["request"].observation.cancel()
+                self._cancel_observation(state["request"])
 
             asyncio.create_task(callback())
 
@@ -157,6 +229,17 @@ class CoAPClient(BaseProtocolClient):
 
         return len(forms_coap) > 0
 
+    @classmethod
+    async def _wait_response(cls, request, timeout=None):
+        """Waits for the response of a request. The request is cancelled
+        (stopping its retransmissions) if the response does not arrive in time."""
+
+        try:
+            return await asyncio.wait_for(request.response, timeout=timeout)
+        except asyncio.TimeoutError as ex:
+            request.response.cancel()
+            raise ClientRequestTimeout from ex
+
     async def _invocation_create(self, coap_client, href, input_value, timeout=None):
         """Creates a new action invocation by sending a POST request."""
 
@@ -164,10 +247,7 @@ class CoAPClient(BaseProtocolClient):
         msg = aiocoap.Message(code=aiocoap.Code.POST, payload=payload, uri=href)
         request = coap_client.request(msg)
 
-        try:
-            response = await asyncio.wait_for(request.response, timeout=timeout)
-        except asyncio.TimeoutError as ex:
-            raise ClientRequestTimeout from ex
+        response = await self._wait_response(request, timeout=timeout)
 
         self._assert_success(response)
 
@@ -184,10 +264,7 @@ class CoAPClient(BaseProtocolClient):
         )
         request = coap_client.request(msg)
 
-        try:
-            response = await asyncio.wait_for(request.response, timeout=timeout)
-        except asyncio.TimeoutError as ex:
-            raise ClientRequestTimeout from ex
+        response = await self._wait_response(request, timeout=timeout)
 
         self._assert_success(response)
 
@@ -217,7 +294,8 @@ class CoAPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
+        coap_client = await self._get_coap_client()
+        request_obsv = None
 
         try:
             invocation_id = await self._invocation_create(
@@ -241,15 +319,12 @@ class CoAPClient(BaseProtocolClient):
                 )
                 invocation_status = json.loads(response_obsv.payload)
 
-            if not request_obsv.observation.cancelled:
-                request_obsv.observation.cancel()
-
             if invocation_status.get("error"):
                 raise Exception(invocation_status.get("error"))
             else:
                 return invocation_status.get("result")
         finally:
-            await coap_client.shutdown()
+            self._cancel_observation(request_obsv)
 
     async def write_property(self, td, name, value, timeout=None):
         """Updates the value of a Property on a remote Thing."""
@@ -261,21 +336,14 @@ class CoAPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
-
-        try:
-            payload = json.dumps({"value": value}).encode("utf-8")
-            msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
-            request = coap_client.request(msg)
+        coap_client = await self._get_coap_client()
+        payload = json.dumps({"value": value}).encode("utf-8")
+        msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+        request = coap_client.request(msg)
 
-            try:
-                response = await asyncio.wait_for(request.response, timeout=timeout)
-            except asyncio.TimeoutError as ex:
-                raise ClientRequestTimeout from ex
+        response = await self._wait_response(request, timeout=timeout)
 
-            self._assert_success(response)
-        finally:
-            await coap_client.shutdown()
+        self._assert_success(response)
 
     async def read_property(self, td, name, timeout=None):
         """Reads the value of a Property on a remote Thing."""
@@ -287,24 +355,17 @@ class CoAPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
-
-        try:
-            msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
-            request = coap_client.request(msg)
+        coap_client = await self._get_coap_client()
+        msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
+        request = coap_client.request(msg)
 
-            try:
-                response = await asyncio.wait_for(request.response, timeout=timeout)
-            except asyncio.TimeoutError as ex:
-                raise ClientRequestTimeout from ex
+        response = await self._wait_response(request, timeout=timeout)
 
-            self._assert_success(response)
+        self._assert_success(response)
 
-            prop_value = json.loads(response.payload).get("value")
+        prop_value = json.loads(response.payload).get("value")
 
-            return prop_value
-        finally:
-            await coap_client.shutdown()
+        return prop_value
 
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
@@ -35,14 +35,12 @@ def get_thing_action(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.actions[key]
-            for key in exposed_thing.actions
-            if exposed_thing.actions[key].url_name == url_name_action
-        )
-    except StopIteration:
-        raise aiocoap.error.NotFound("Action not found") from None
+    interaction = exposed_thing.thing.find_interaction(url_name_action)
+
+    if interaction is None or interaction.name not in exposed_thing.thing.actions:
+        raise aiocoap.error.NotFound("Action not found")
+
+    return exposed_thing.actions[interaction.name]
 
 
 class ActionResource(aiocoap.resource.ObservableResource):
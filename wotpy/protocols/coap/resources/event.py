@@ -34,14 +34,12 @@ def get_thing_event(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.events[key]
-            for key in exposed_thing.events
-            if exposed_thing.events[key].url_name == url_name_event
-        )
-    except StopIteration:
-        raise aiocoap.error.NotFound("Event not found") from None
+    interaction = exposed_thing.thing.find_interaction(url_name_event)
+
+    if interaction is None or interaction.name not in exposed_thing.thing.events:
+        raise aiocoap.error.NotFound("Event not found")
+
+    return exposed_thing.events[interaction.name]
 
 
 class EventResource(aiocoap.resource.ObservableResource):
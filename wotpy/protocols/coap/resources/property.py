@@ -44,14 +44,12 @@ def get_thing_property(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.properties[key]
-            for key in exposed_thing.properties
-            if exposed_thing.properties[key].url_name == url_name_prop
-        )
-    except StopIteration:
-        raise aiocoap.error.NotFound("Property not found") from None
+    interaction = exposed_thing.thing.find_interaction(url_name_prop)
+
+    if interaction is None or interaction.name not in exposed_thing.thing.properties:
+        raise aiocoap.error.NotFound("Property not found")
+
+    return exposed_thing.properties[interaction.name]
 
 
 class PropertyResource(aiocoap.resource.ObservableResource):
@@ -13,13 +13,15 @@ import urllib.parse as parse
 
 import tornado.httpclient
 from rx import Observable
-from tornado.simple_httpclient import HTTPTimeoutError
+from tornado.ioloop import IOLoop
+from tornado.simple_httpclient import HTTPTimeoutError, SimpleAsyncHTTPClient
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import ClientRequestTimeout, FormNotFoundException
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
 from wotpy.protocols.utils import is_scheme_form
+from wotpy.support import is_curl_supported
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import (
     EmittedEvent,
@@ -27,32 +29,170 @@ from wotpy.wot.events import (
     PropertyChangeEventInit,
 )
 
+TEXT_EVENT_STREAM = "text/event-stream"
+
+
+class StreamDisposedError(Exception):
+    """Exception raised when an observation request is
+    interrupted because its connection has been closed."""
+
+    pass
+
+
+class ObservationConnection(object):
+    """Dedicated HTTP client for the requests of one long-lived observation.
+    It is kept out of the shared client pool and may be closed at any time to
+    end the observation: the pending request returns at once and the underlying
+    connection is aborted when the next chunk arrives or the request times out."""
+
+    def __init__(self):
+        self._engine = SimpleAsyncHTTPClient(force_instance=True, max_clients=1)
+        self._event_closed = asyncio.Event()
+        self._num_requests = 0
+
+    @property
+    def closed(self):
+        """Returns True if the connection has been closed."""
+
+        return self._event_closed.is_set()
+
+    @property
+    def num_requests(self):
+        """Returns the number of requests fetched with this connection."""
+
+        return self._num_requests
+
+    def check_open(self):
+        """Raises StreamDisposedError if the connection has been closed.
+        Raising it from a streaming_callback aborts the request that
+        delivered the chunk and closes its connection."""
+
+        if self.closed:
+            raise StreamDisposedError()
+
+    async def fetch(self, http_request):
+        """Fetches the given request. Raises StreamDisposedError if
+        the connection is closed before the response is complete."""
+
+        self.check_open()
+        self._num_requests += 1
+
+        fut_fetch = asyncio.ensure_future(self._engine.fetch(http_request))
+        fut_closed = asyncio.ensure_future(self._event_closed.wait())
+
+        # Requests interrupted by close() finish later with an error
+        # that nobody awaits, so it is retrieved here.
+        fut_fetch.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+
+        try:
+            await asyncio.wait(
+                [fut_fetch, fut_closed], return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            fut_closed.cancel()
+
+        if not fut_fetch.done() or self.closed:
+            raise StreamDisposedError()
+
+        return fut_fetch.result()
+
+    def close(self):
+        """Closes the connection, interrupting any pending request."""
+
+        if self.closed:
+            return
+
+        self._event_closed.set()
+        self._engine.close()
+
+
+def parse_event_stream(buffer):
+    """Takes a buffer of Server-Sent Events bytes and returns a list
+    of (event, data) tuples for the complete events and the remaining buffer."""
+
+    blocks = buffer.replace(b"\r\n", b"\n").split(b"\n\n")
+    events = []
+
+    for block in blocks[:-1]:
+        event, data = "message", []
+
+        for line in block.decode().split("\n"):
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+
+        if len(data):
+            events.append((event, "\n".join(data)))
+
+    return events, blocks[-1]
+
 
 class HTTPClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the HTTP protocol."""
+    """Implementation of the protocol client interface for the HTTP protocol.
+    All requests share one HTTP client bounded by max_clients and max_per_host.
+    The default backend (SimpleAsyncHTTPClient) only bounds concurrency and opens
+    a new connection for each request; use_curl=True selects the curl backend,
+    which keeps connections alive and reuses them between requests.
+    Call shutdown() to close the shared client and the active observations."""
 
     JSON_HEADERS = {"Content-Type": "application/json"}
     DEFAULT_CON_TIMEOUT = 60
     DEFAULT_REQ_TIMEOUT = 60
+    DEFAULT_MAX_CLIENTS = 100
+    DEFAULT_MAX_PER_HOST = 10
 
     def __init__(
-        self, connect_timeout=DEFAULT_CON_TIMEOUT, request_timeout=DEFAULT_REQ_TIMEOUT
+        self,
+        connect_timeout=DEFAULT_CON_TIMEOUT,
+        request_timeout=DEFAULT_REQ_TIMEOUT,
+        max_clients=DEFAULT_MAX_CLIENTS,
+        max_per_host=DEFAULT_MAX_PER_HOST,
+        use_curl=False,
     ):
+        if use_curl and not is_curl_supported():
+            raise ValueError("The curl HTTP backend requires pycurl")
+
+        if max_clients is None or max_clients < 1:
+            raise ValueError("max_clients must be a positive number")
+
+        if max_per_host is None or max_per_host < 1:
+            raise ValueError("max_per_host must be a positive number")
+
         self._connect_timeout = connect_timeout
         self._request_timeout = request_timeout
+        self._max_clients = max_clients
+        self._max_per_host = max_per_host
+        self._use_curl = use_curl
+        self._engine = None
+        self._sem_clients = None
+        self._sem_hosts = {}
+        self._observation_conns = set()
+        self._num_observation_requests = 0
+        self._num_active = 0
+        self._num_waiting = 0
+        self._num_requests = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
         self._logr = logging.getLogger(__name__)
         super(HTTPClient, self).__init__()
 
     @classmethod
-    def pick_http_href(cls, td, forms, op=None):
-        """Picks the most appropriate HTTP form href from the given list of forms."""
+    def pick_http_href(cls, td, forms, op=None, subprotocol=None):
+        """Picks the most appropriate HTTP form href from the given list of forms.
+        Only forms with the given subprotocol are considered if one is given."""
 
         def is_op_form(form):
             try:
-                return op is None or op == form.op or op in form.op
+                is_op = op is None or op == form.op or op in form.op
             except TypeError:
                 return False
 
+            return is_op and (subprotocol is None or form.subprotocol == subprotocol)
+
         def find_href(scheme):
             try:
                 return next(
@@ -67,6 +207,19 @@ class HTTPClient(BaseProtocolClient):
 
         return form_https if form_https is not None else find_href(HTTPSchemes.HTTP)
 
+    @classmethod
+    def _parse_invocation_status(cls, status):
+        """Takes the status of an Action invocation returned by the server
+        and returns a tuple of (done, result or Exception)."""
+
+        if status.get("done") is False:
+            return (False, None)
+
+        if status.get("error") is not None:
+            return (True, Exception(status.get("error")))
+
+        return (True, status.get("result"))
+
     @property
     def protocol(self):
         """Protocol of this client instance.
@@ -86,6 +239,114 @@ class HTTPClient(BaseProtocolClient):
 
         return self._request_timeout
 
+    @property
+    def pool_stats(self):
+        """Returns a dict with the saturation and queue wait metrics of the
+        HTTP client shared by all the requests of this instance. Observations
+        run on their own connections and are counted separately."""
+
+        avg_wait = (
+            self._queue_wait_total / self._num_requests if self._num_requests else 0.0
+        )
+
+        return {
+            "max_clients": self._max_clients,
+            "max_per_host": self._max_per_host,
+            "active": self._num_active,
+            "waiting": self._num_waiting,
+            "saturation": self._num_active / self._max_clients,
+            "requests": self._num_requests,
+            "queue_wait_avg": avg_wait,
+            "queue_wait_max": self._queue_wait_max,
+            "observations": len(self._observation_conns),
+            "observation_requests": self._num_observation_requests
+            + sum(conn.num_requests for conn in self._observation_conns),
+        }
+
+    async def shutdown(self):
+        """Closes the shared HTTP client and the connections of the active
+        observations, which are completed. A new client is built if the
+        instance is used again afterwards."""
+
+        for conn in list(self._observation_conns):
+            self._observation_conns.discard(conn)
+            self._num_observation_requests += conn.num_requests
+            conn.close()
+
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+    def _build_engine(self):
+        """Builds a new HTTP client that is not shared with other instances."""
+
+        if self._use_curl:
+            from tornado.curl_httpclient import CurlAsyncHTTPClient
+
+            return CurlAsyncHTTPClient(
+                force_instance=True, max_clients=self._max_clients
+            )
+
+        return tornado.httpclient.AsyncHTTPClient(
+            force_instance=True, max_clients=self._max_clients
+        )
+
+    def _get_engine(self):
+        """Returns the HTTP client bound to the current loop.
+        The client and the concurrency limits are rebuilt when the loop changes."""
+
+        if self._engine is not None and self._engine.io_loop is IOLoop.current():
+            return self._engine
+
+        if self._engine is not None:
+            self._engine.close()
+
+        self._engine = self._build_engine()
+        self._sem_clients = asyncio.Semaphore(self._max_clients)
+        self._sem_hosts = {}
+
+        return self._engine
+
+    async def _fetch(self, http_request):
+        """Fetches the given request with the shared HTTP client. Requests wait
+        for a free slot in the global pool and in the pool of the target host."""
+
+        engine = self._get_engine()
+        sem_clients = self._sem_clients
+        host = parse.urlparse(http_request.url).netloc
+
+        if host not in self._sem_hosts:
+            self._sem_hosts[host] = asyncio.Semaphore(self._max_per_host)
+
+        sem_host = self._sem_hosts[host]
+
+        wait_ini = time.time()
+        self._num_waiting += 1
+
+        try:
+            await sem_host.acquire()
+
+            try:
+                await sem_clients.acquire()
+            except BaseException:
+                sem_host.release()
+                raise
+        finally:
+            self._num_waiting -= 1
+
+        wait_secs = time.time() - wait_ini
+        self._num_requests += 1
+        self._queue_wait_total += wait_secs
+        self._queue_wait_max = max(self._queue_wait_max, wait_secs)
+        self._num_active += 1
+
+        try:
+            return await engine.fetch(http_request)
+        finally:
+            self._num_active -= 1
+            sem_clients.release()
+            sem_host.release()
+
     def is_supported_interaction(self, td, name):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
@@ -113,66 +374,60 @@ class HTTPClient(BaseProtocolClient):
             raise FormNotFoundException()
 
         body = json.dumps({"input": input_value})
-        http_client = tornado.httpclient.AsyncHTTPClient()
+        headers = dict(self.JSON_HEADERS, Prefer="wait={}".format(req_timeout))
 
         try:
             http_request = tornado.httpclient.HTTPRequest(
                 href,
                 method="POST",
                 body=body,
-                headers=self.JSON_HEADERS,
+                headers=headers,
                 connect_timeout=con_timeout,
                 request_timeout=req_timeout,
             )
         except HTTPTimeoutError as ex:
             raise ClientRequestTimeout from ex
 
-        response = await http_client.fetch(http_request)
-        invocation_url = json.loads(response.body).get("invocation")
+        response = await self._fetch(http_request)
+        status = json.loads(response.body)
+        invocation_url = status.get("invocation")
 
-        async def check_invocation():
-            parsed = parse.urlparse(href)
+        if invocation_url is None:
+            done, result = self._parse_invocation_status(status)
+        else:
+            done, result = False, None
 
-            invoc_href = "{}://{}/{}".format(
-                parsed.scheme, parsed.netloc, invocation_url.lstrip("/")
-            )
+            parsed = parse.urlparse(href)
 
             invoc_http_req = tornado.httpclient.HTTPRequest(
-                invoc_href,
+                "{}://{}/{}".format(
+                    parsed.scheme, parsed.netloc, invocation_url.lstrip("/")
+                ),
                 method="GET",
                 connect_timeout=con_timeout,
                 request_timeout=req_timeout,
             )
 
+        while not done:
+            if timeout and (time.time() - now) > timeout:
+                raise ClientRequestTimeout
+
             self._logr.debug("Checking invocation: {}".format(invocation_url))
 
             try:
-                invoc_res = await http_client.fetch(invoc_http_req)
+                invoc_res = await self._fetch(invoc_http_req)
             except HTTPTimeoutError:
                 self._logr.debug(
-                    "Timeout checking invocation: {}".format(invocation_url)
+                    "Timeout checking invocation: {}".format(invocation_url)
                 )
-                return (False, None)
-
-            status = json.loads(invoc_res.body)
+                continue
 
-            if status.get("done") is False:
-                return (False, None)
+            done, result = self._parse_invocation_status(json.loads(invoc_res.body))
 
-            if status.get("error") is not None:
-                return (True, Exception(status.get("error")))
-            else:
-                return (True, status.get("result"))
+        if isinstance(result, Exception):
+            raise result
 
-        while True:
-            done, result = await check_invocation()
-
-            if done and isinstance(result, Exception):
-                raise result
-            elif done:
-                return result
-            elif timeout and (time.time() - now) > timeout:
-                raise ClientRequestTimeout
+        return result
 
     async def write_property(self, td, name, value, timeout=None):
         """Updates the value of a Property on a remote Thing.
@@ -186,7 +441,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
         body = json.dumps({"value": value})
 
         try:
@@ -201,7 +455,7 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError as ex:
             raise ClientRequestTimeout from ex
 
-        await http_client.fetch(http_request)
+        await self._fetch(http_request)
 
     async def read_property(self, td, name, timeout=None):
         """Reads the value of a Property on a remote Thing.
@@ -215,8 +469,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
-
         try:
             http_request = tornado.httpclient.HTTPRequest(
                 href,
@@ -227,81 +479,106 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError as ex:
             raise ClientRequestTimeout from ex
 
-        response = await http_client.fetch(http_request)
+        response = await self._fetch(http_request)
         result = json.loads(response.body)
         result = result.get("value", result)
 
         return result
 
-    def on_event(self, td, name):
-        """Subscribes to an event on a remote Thing.
-        Returns an Observable."""
+    async def _stream_events(self, href, conn, on_payload):
+        """Receives the payloads streamed as Server-Sent Events on the given href
+        until the connection is closed or the server reports an error."""
 
-        href = self.pick_http_href(td, td.get_event_forms(name))
+        stream = {"buffer": b"", "error": None}
 
-        if href is None:
-            raise FormNotFoundException()
+        def streaming_callback(chunk):
+            conn.check_open()
+            events, stream["buffer"] = parse_event_stream(stream["buffer"] + chunk)
 
-        def subscribe(observer):
-            """Subscription function to observe events using the HTTP protocol."""
+            for event, data in events:
+                payload = json.loads(data)
 
-            state = {"active": True}
+                if event == "error":
+                    stream["error"] = Exception(payload.get("error"))
+                else:
+                    on_payload(payload)
 
-            @handle_observer_finalization(observer)
-            async def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
-                http_request = tornado.httpclient.HTTPRequest(href, method="GET")
+        http_request = tornado.httpclient.HTTPRequest(
+            href,
+            method="GET",
+            headers={"Accept": TEXT_EVENT_STREAM},
+            connect_timeout=self._connect_timeout,
+            request_timeout=0,
+            streaming_callback=streaming_callback,
+        )
 
-                while state["active"]:
-                    try:
-                        response = await http_client.fetch(http_request)
-                        payload = json.loads(response.body).get("payload")
-                        observer.on_next(EmittedEvent(init=payload, name=name))
-                    except HTTPTimeoutError:
-                        pass
+        while not conn.closed:
+            stream["buffer"] = b""
 
-            def unsubscribe():
-                state["active"] = False
+            try:
+                await conn.fetch(http_request)
+            except StreamDisposedError:
+                return
 
-            asyncio.create_task(callback())
+            if stream["error"] is not None:
+                raise stream["error"]
 
-            return unsubscribe
+    async def _long_poll_events(self, href, conn, on_payload):
+        """Receives the payloads on the given href with one
+        long-polling request per item until the connection is closed."""
 
-        return Observable.create(subscribe)
+        http_request = tornado.httpclient.HTTPRequest(href, method="GET")
 
-    def on_property_change(self, td, name):
-        """Subscribes to property changes on a remote Thing.
-        Returns an Observable"""
+        while not conn.closed:
+            try:
+                response = await conn.fetch(http_request)
+                on_payload(json.loads(response.body))
+            except HTTPTimeoutError:
+                pass
+            except StreamDisposedError:
+                return
 
-        href = self.pick_http_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.OBSERVE_PROPERTY
+    def _build_observable(self, td, forms, op, on_payload):
+        """Builds an Observable that calls on_payload with the observer and every
+        payload received from the server. Server-Sent Events are used
+        if the forms advertise them, and long-polling otherwise."""
+
+        href_sse = self.pick_http_href(
+            td, forms, op=op, subprotocol=HTTPSubprotocols.SSE
         )
+        href = self.pick_http_href(td, forms, op=op)
 
         if href is None:
             raise FormNotFoundException()
 
         def subscribe(observer):
-            """Subscription function to observe property updates using the HTTP protocol."""
+            """Subscription function to observe payloads using the HTTP protocol."""
+
+            conn = ObservationConnection()
+            self._observation_conns.add(conn)
 
-            state = {"active": True}
+            def on_next(payload):
+                not conn.closed and on_payload(observer, payload)
 
             @handle_observer_finalization(observer)
             async def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
-                http_request = tornado.httpclient.HTTPRequest(href, method="GET")
-
-                while state["active"]:
-                    try:
-                        response = await http_client.fetch(http_request)
-                        value = json.loads(response.body)
-                        value = value.get("value", value)
-                        init = PropertyChangeEventInit(name=name, value=value)
-                        observer.on_next(PropertyChangeEmittedEvent(init=init))
-                    except HTTPTimeoutError:
-                        pass
+                try:
+                    if href_sse is not None:
+                        await self._stream_events(href_sse, conn, on_next)
+                    else:
+                        await self._long_poll_events(href, conn, on_next)
+                finally:
+                    close_conn()
+
+            def close_conn():
+                if conn in self._observation_conns:
+                    self._observation_conns.discard(conn)
+                    self._num_observation_requests += conn.num_requests
+
+                conn.close()
 
             def unsubscribe():
-                state["active"] = False
+                close_conn()
 
             asyncio.create_task(callback())
 
@@ -309,6 +586,32 @@ class HTTPClient(BaseProtocolClient):
 
         return Observable.create(subscribe)
 
+    def on_event(self, td, name):
+        """Subscribes to an event on a remote Thing.
+        Returns an Observable."""
+
+        def on_payload(observer, payload):
+            payload = payload.get("payload")
+            observer.on_next(EmittedEvent(init=payload, name=name))
+
+        return self._build_observable(td, td.get_event_forms(name), None, on_payload)
+
+    def on_property_change(self, td, name):
+        """Subscribes to property changes on a remote Thing.
+        Returns an Observable"""
+
+        def on_payload(observer, payload):
+            value = payload.get("value", payload)
+            init = PropertyChangeEventInit(name=name, value=value)
+            observer.on_next(PropertyChangeEmittedEvent(init=init))
+
+        return self._build_observable(
+            td,
+            td.get_property_forms(name),
+            InteractionVerbs.OBSERVE_PROPERTY,
+            on_payload,
+        )
+
     def on_td_change(self, url):
         """Subscribes to Thing Description changes on a remote Thing.
         Returns an Observable."""
@@ -13,3 +13,9 @@ class HTTPSchemes(EnumListMixin):
 
     HTTP = "http"
     HTTPS = "https"
+
+
+class HTTPSubprotocols(EnumListMixin):
+    """Enumeration of HTTP subprotocols advertised in Forms."""
+
+    SSE = "sse"
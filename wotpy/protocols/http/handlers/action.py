@@ -5,9 +5,7 @@
 Request handler for Action interactions.
 """
 
-import logging
-import pprint
-import time
+import asyncio
 import uuid
 
 from tornado.web import HTTPError, RequestHandler
@@ -22,63 +20,53 @@ class ActionInvokeHandler(RequestHandler):
         self._server = http_server
 
     async def post(self, thing_name, name):
-        """Invokes the action and returns the invocation result."""
+        """Invokes the action and returns the invocation result inline if the
+        client asked to wait and the action finishes within the server wait budget.
+        Returns the URL to check the status of the invocation otherwise."""
 
         exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
         input_value = handler_utils.get_argument(self, "input")
-        future_result = exposed_thing.actions[name].invoke(input_value)
-        invocation_id = uuid.uuid4().hex
-        self._server.pending_actions[invocation_id] = future_result
-        self.write({"invocation": "/invocation/{}".format(invocation_id)})
+        future_result = asyncio.ensure_future(
+            exposed_thing.actions[name].invoke(input_value)
+        )
 
+        wait_secs = handler_utils.get_preferred_wait(self)
 
-class PendingInvocationHandler(RequestHandler):
-    """Handler to check the status of pending action invocations."""
-
-    def initialize(self, http_server):
-        self._server = http_server
-        self._logr = logging.getLogger(__name__)
+        if wait_secs is not None:
+            wait_secs = min(wait_secs, self._server.action_wait)
 
-    def _clean_expired(self):
-        """Removes the Action invocations that are expired and
-        have already been checked by at least one client."""
+        if wait_secs:
+            await asyncio.wait([future_result], timeout=wait_secs)
 
-        now = time.time()
+        if future_result.done():
+            try:
+                self.write({"done": True, "result": future_result.result()})
+            except Exception as ex:
+                self.write({"done": True, "error": str(ex)})
 
-        expired_invocations = [
-            inv_id
-            for inv_id, tstamp in self._server.invocation_check_times.items()
-            if (now - tstamp) > self._server.action_ttl
-        ]
+            return
 
-        if len(expired_invocations):
-            self._logr.debug(
-                "Expired invocations: {}".format(pprint.pformat(expired_invocations))
-            )
+        invocation_id = uuid.uuid4().hex
+        self._server.pending_actions.add(invocation_id, future_result)
+        self.write({"invocation": "/invocation/{}".format(invocation_id)})
 
-        for invocation_id in expired_invocations:
-            self._server.invocation_check_times.pop(invocation_id)
-            fut_result = self._server.pending_actions.get(invocation_id, None)
 
-            if fut_result and fut_result.done():
-                self._logr.debug(
-                    "Removing completed invocation Future: {}".format(invocation_id)
-                )
+class PendingInvocationHandler(RequestHandler):
+    """Handler to check the status of pending action invocations."""
 
-                self._server.pending_actions.pop(invocation_id, None)
+    def initialize(self, http_server):
+        self._server = http_server
 
     async def get(self, invocation_id):
         """Checks and returns the status of the Future that represents an action invocation."""
 
-        if invocation_id not in self._server.pending_actions:
+        future_result = self._server.pending_actions.get(invocation_id)
+
+        if future_result is None:
             raise HTTPError(log_message="Unknown invocation: {}".format(invocation_id))
 
         try:
-            result = await self._server.pending_actions[invocation_id]
+            result = await future_result
             self.write({"done": True, "result": result})
         except Exception as ex:
             self.write({"done": True, "error": str(ex)})
-        finally:
-            self._logr.debug("Updating invocation check time: {}".format(invocation_id))
-            self._server.invocation_check_times[invocation_id] = time.time()
-            self._clean_expired()
@@ -5,47 +5,20 @@
 Request handler for Event interactions.
 """
 
-import asyncio
-import logging
+from wotpy.protocols.http.handlers.observer import BaseObserverHandler
 
-from tornado.web import RequestHandler
 
-import wotpy.protocols.http.handlers.utils as handler_utils
+class EventObserverHandler(BaseObserverHandler):
+    """Handler for Event subscription requests.
+    Returns the payload of the next emission (HTTP long-polling pattern)
+    or streams all emissions as Server-Sent Events."""
 
+    def get_interaction(self, exposed_thing, name):
+        """Returns the Event with the given name."""
 
-class EventObserverHandler(RequestHandler):
-    """Handler for Event subscription requests."""
+        return exposed_thing.events[name]
 
-    def initialize(self, http_server):
-        self._server = http_server
-        self._logr = logging.getLogger(__name__)
+    def build_payload(self, item):
+        """Returns the payload for an Event emission."""
 
-    async def get(self, thing_name, name):
-        """Subscribes to the given Event and waits for the next emission (HTTP long-polling pattern).
-        Returns the event emission payload and destroys the subscription afterwards."""
-
-        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
-        thing_event = exposed_thing.events[name]
-
-        future_next = asyncio.Future()
-
-        def on_next(item):
-            not future_next.done() and future_next.set_result(item.data)
-
-        def on_error(err):
-            self._logr.warning(
-                "Error on subscription to {}: {}".format(thing_event, err)
-            )
-            not future_next.done() and future_next.set_exception(err)
-
-        self.subscription = thing_event.subscribe(on_next=on_next, on_error=on_error)
-        event_payload = await future_next
-        self.write({"payload": event_payload})
-
-    def on_finish(self):
-        """Destroys the subscription to the observable when the request finishes."""
-
-        try:
-            self.subscription.dispose()
-        except AttributeError:
-            pass
+        return {"payload": item.data}
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Base request handler for subscriptions to Interaction emissions.
+"""
+
+import asyncio
+import json
+import logging
+
+from tornado.iostream import StreamClosedError
+from tornado.web import RequestHandler
+
+import wotpy.protocols.http.handlers.utils as handler_utils
+
+
+class BaseObserverHandler(RequestHandler):
+    """Base handler for subscriptions to the items emitted by an Interaction.
+    Responds with the next item (HTTP long-polling pattern) by default, or streams
+    every item over the same response as Server-Sent Events if the client
+    accepts text/event-stream."""
+
+    DEFAULT_STREAM_BUFFER = 100
+    DEFAULT_STREAM_KEEPALIVE_SECS = 15
+
+    def initialize(self, http_server):
+        self._server = http_server
+        self._future_next = None
+        self._stream_queue = None
+        self._logr = logging.getLogger(__name__)
+
+    def get_interaction(self, exposed_thing, name):
+        """Returns the observable Interaction with the given name."""
+
+        raise NotImplementedError
+
+    def build_payload(self, item):
+        """Returns the JSON-serializable payload for an emitted item."""
+
+        raise NotImplementedError
+
+    async def get(self, thing_name, name):
+        """Subscribes to the given Interaction and responds with its emissions."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        interaction = self.get_interaction(exposed_thing, name)
+
+        if handler_utils.accepts_event_stream(self):
+            await self._stream(interaction)
+        else:
+            await self._long_poll(interaction)
+
+    async def _long_poll(self, interaction):
+        """Waits for the next emission, responds with it and
+        destroys the subscription afterwards."""
+
+        future_next = asyncio.Future()
+        self._future_next = future_next
+
+        def on_next(item):
+            not future_next.done() and future_next.set_result(item)
+
+        def on_error(err):
+            self._logr.warning(
+                "Error on subscription to {}: {}".format(interaction, err)
+            )
+            not future_next.done() and future_next.set_exception(err)
+
+        self.subscription = interaction.subscribe(on_next=on_next, on_error=on_error)
+        item = await future_next
+
+        if item is not None:
+            self.write(self.build_payload(item))
+
+    def _put_stream_item(self, item):
+        """Adds an item to the stream buffer, dropping the oldest item if it is full."""
+
+        if self._stream_queue.full():
+            self._stream_queue.get_nowait()
+
+        self._stream_queue.put_nowait(item)
+
+    async def _stream(self, interaction):
+        """Writes every emission as a Server-Sent Event until the
+        client disconnects or the subscription raises an error.
+        Comments are sent periodically to detect closed connections."""
+
+        self._stream_queue = asyncio.Queue(maxsize=self.DEFAULT_STREAM_BUFFER)
+
+        def on_next(item):
+            self._put_stream_item(("data", self.build_payload(item)))
+
+        def on_error(err):
+            self._logr.warning(
+                "Error on subscription to {}: {}".format(interaction, err)
+            )
+            self._put_stream_item(("error", {"error": str(err)}))
+
+        self.set_header("Content-Type", handler_utils.TEXT_EVENT_STREAM)
+        self.set_header("Cache-Control", "no-cache")
+        self.subscription = interaction.subscribe(on_next=on_next, on_error=on_error)
+
+        try:
+            await self.flush()
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        self._stream_queue.get(), self.DEFAULT_STREAM_KEEPALIVE_SECS
+                    )
+                except asyncio.TimeoutError:
+                    self.write(":\n\n")
+                    await self.flush()
+                    continue
+
+                if item is None:
+                    return
+
+                event, payload = item
+                self.write(handler_utils.format_event(event, json.dumps(payload)))
+                await self.flush()
+
+                if event == "error":
+                    return
+        except StreamClosedError:
+            self._logr.debug("Stream closed by client: {}".format(interaction))
+
+    def on_connection_close(self):
+        """Stops waiting for emissions when the client disconnects."""
+
+        if self._future_next is not None and not self._future_next.done():
+            self._future_next.set_result(None)
+
+        if self._stream_queue is not None:
+            self._put_stream_item(None)
+
+        self.on_finish()
+
+    def on_finish(self):
+        """Destroys the subscription to the observable when the request finishes."""
+
+        try:
+            self.subscription.dispose()
+        except AttributeError:
+            pass
@@ -5,12 +5,10 @@
 Request handler for Property interactions.
 """
 
-import asyncio
-import logging
-
 from tornado.web import RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.protocols.http.handlers.observer import BaseObserverHandler
 
 
 class PropertyReadWriteHandler(RequestHandler):
@@ -34,39 +32,17 @@ class PropertyReadWriteHandler(RequestHandler):
         await exposed_thing.properties[name].write(value)
 
 
-class PropertyObserverHandler(RequestHandler):
-    """Handler for Property subscription requests."""
-
-    def initialize(self, http_server):
-        self._server = http_server
-        self._logr = logging.getLogger(__name__)
-
-    async def get(self, thing_name, name):
-        """Subscribes to Property updates and waits for the next event (HTTP long-polling pattern).
-        Returns the updated value and destroys the subscription."""
-
-        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
-        thing_property = exposed_thing.properties[name]
-
-        future_next = asyncio.Future()
-
-        def on_next(item):
-            not future_next.done() and future_next.set_result(item.data.value)
+class PropertyObserverHandler(BaseObserverHandler):
+    """Handler for Property subscription requests.
+    Returns the next updated value (HTTP long-polling pattern)
+    or streams all updates as Server-Sent Events."""
 
-        def on_error(err):
-            self._logr.warning(
-                "Error on subscription to {}: {}".format(thing_property, err)
-            )
-            not future_next.done() and future_next.set_exception(err)
+    def get_interaction(self, exposed_thing, name):
+        """Returns the Property with the given name."""
 
-        self.subscription = thing_property.subscribe(on_next=on_next, on_error=on_error)
-        updated_value = await future_next
-        self.write({"value": updated_value})
+        return exposed_thing.properties[name]
 
-    def on_finish(self):
-        """Destroys the subscription to the observable when the request finishes."""
+    def build_payload(self, item):
+        """Returns the payload for a Property update."""
 
-        try:
-            self.subscription.dispose()
-        except AttributeError:
-            pass
+        return {"value": item.data.value}
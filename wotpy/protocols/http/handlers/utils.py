@@ -10,6 +10,7 @@ import json
 from tornado.web import HTTPError
 
 APPLICATION_JSON = "application/json"
+TEXT_EVENT_STREAM = "text/event-stream"
 
 
 def get_exposed_thing(server, thing_name):
@@ -39,3 +40,38 @@ def get_argument(req_handler, name, default=None):
         raise HTTPError(log_message="Not a JSON object: {}".format(parsed_body))
 
     return parsed_body.get(name, default)
+
+
+def get_preferred_wait(req_handler):
+    """Returns the number of seconds that the client is willing to wait
+    for a response, as stated in the wait preference of the Prefer header (RFC 7240).
+    Returns None if the client did not state a wait preference."""
+
+    for preference in req_handler.request.headers.get_list("Prefer"):
+        for token in preference.split(","):
+            key, _, value = token.strip().partition("=")
+
+            if key.strip().lower() != "wait":
+                continue
+
+            try:
+                return max(float(value.strip()), 0.0)
+            except ValueError:
+                return None
+
+    return None
+
+
+def accepts_event_stream(req_handler):
+    """Returns True if the client accepts a Server-Sent Events response."""
+
+    return TEXT_EVENT_STREAM in req_handler.request.headers.get("Accept", "")
+
+
+def format_event(event, data):
+    """Formats a Server-Sent Event with the given type and data."""
+
+    lines = ["event: {}".format(event)]
+    lines.extend("data: {}".format(line) for line in data.split("\n"))
+
+    return "\n".join(lines) + "\n\n"
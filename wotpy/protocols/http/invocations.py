@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bounded store for the pending Action invocations of the HTTP server.
+"""
+
+import asyncio
+import collections
+import logging
+
+
+class PendingInvocationStore(object):
+    """Bounded store of Action invocation Futures indexed by invocation ID.
+    Invocations expire on a timer once a TTL has passed since they completed
+    or were last checked, and the least recently used invocation
+    is evicted when the store is full. Invocations that are discarded keep
+    running, but their errors are retrieved so that they are not logged."""
+
+    def __init__(self, ttl_secs, max_size=None):
+        self._ttl_secs = ttl_secs
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+        self._timers = {}
+        self._num_stored = 0
+        self._num_expired = 0
+        self._num_evicted = 0
+        self._logr = logging.getLogger(__name__)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, invocation_id):
+        return invocation_id in self._items
+
+    @property
+    def ttl(self):
+        """Returns the Time-To-Live (seconds) of completed invocations."""
+
+        return self._ttl_secs
+
+    @property
+    def max_size(self):
+        """Returns the maximum number of invocations kept in the store."""
+
+        return self._max_size
+
+    @property
+    def stats(self):
+        """Returns a dict with the counters of stored, expired and evicted invocations."""
+
+        return {
+            "size": len(self._items),
+            "stored": self._num_stored,
+            "expired": self._num_expired,
+            "evicted": self._num_evicted,
+        }
+
+    def add(self, invocation_id, future):
+        """Adds the Future of an invocation, evicting the least
+        recently used invocation if the store is full."""
+
+        self.pop(invocation_id)
+
+        while self._max_size and len(self._items) >= self._max_size:
+            evicted_id = next(iter(self._items))
+            self._logr.debug("Evicting invocation: {}".format(evicted_id))
+            self._discard(self.pop(evicted_id))
+            self._num_evicted += 1
+
+        self._items[invocation_id] = future
+        self._num_stored += 1
+
+        future.add_done_callback(lambda fut: self._schedule_expiry(invocation_id, fut))
+
+    def get(self, invocation_id):
+        """Returns the Future of an invocation (None if unknown) and marks it
+        as recently used, restarting its TTL if the invocation is completed."""
+
+        future = self._items.get(invocation_id, None)
+
+        if future is None:
+            return None
+
+        self._items.move_to_end(invocation_id)
+
+        if future.done():
+            self._schedule_expiry(invocation_id, future)
+
+        return future
+
+    def pop(self, invocation_id):
+        """Removes an invocation and returns its Future (None if unknown)."""
+
+        timer = self._timers.pop(invocation_id, None)
+
+        if timer is not None:
+            timer.cancel()
+
+        return self._items.pop(invocation_id, None)
+
+    def clear(self):
+        """Removes all the invocations and cancels the expiry timers."""
+
+        for invocation_id in list(self._items.keys()):
+            self._discard(self.pop(invocation_id))
+
+    @classmethod
+    def _discard(cls, future):
+        """Retrieves the error of a Future that is no longer reachable from the store
+        once it is done, so that it is not reported as never retrieved."""
+
+        future.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+
+    def _schedule_expiry(self, invocation_id, future):
+        """(Re)starts the expiry timer of a completed invocation."""
+
+        if self._items.get(invocation_id, None) is not future:
+            return
+
+        timer = self._timers.pop(invocation_id, None)
+
+        if timer is not None:
+            timer.cancel()
+
+        self._timers[invocation_id] = asyncio.get_event_loop().call_later(
+            self._ttl_secs, self._expire, invocation_id
+        )
+
+    def _expire(self, invocation_id):
+        """Removes an invocation once its TTL has passed."""
+
+        self._timers.pop(invocation_id, None)
+
+        future = self._items.pop(invocation_id, None)
+
+        if future is not None:
+            self._logr.debug("Expired invocation: {}".format(invocation_id))
+            self._discard(future)
+            self._num_expired += 1
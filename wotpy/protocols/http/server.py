@@ -10,7 +10,7 @@ import tornado.web
 
 from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import InteractionVerbs, Protocols
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
 from wotpy.protocols.http.handlers.action import (
     ActionInvokeHandler,
     PendingInvocationHandler,
@@ -20,6 +20,7 @@ from wotpy.protocols.http.handlers.property import (
     PropertyObserverHandler,
     PropertyReadWriteHandler,
 )
+from wotpy.protocols.http.invocations import PendingInvocationStore
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.form import Form
@@ -29,15 +30,25 @@ class HTTPServer(BaseProtocolServer):
     """HTTP binding server implementation."""
 
     DEFAULT_PORT = 80
-
-    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_ttl_secs=300):
+    DEFAULT_ACTION_WAIT_SECS = 0.5
+    DEFAULT_ACTION_MAX_PENDING = 1000
+
+    def __init__(
+        self,
+        port=DEFAULT_PORT,
+        ssl_context=None,
+        action_ttl_secs=300,
+        action_wait_secs=DEFAULT_ACTION_WAIT_SECS,
+        action_max_pending=DEFAULT_ACTION_MAX_PENDING,
+    ):
         super(HTTPServer, self).__init__(port=port)
         self._server = None
         self._app = self._build_app()
         self._ssl_context = ssl_context
-        self._action_ttl_secs = action_ttl_secs
-        self._pending_actions = {}
-        self._invocation_check_times = {}
+        self._action_wait_secs = action_wait_secs
+        self._pending_actions = PendingInvocationStore(
+            ttl_secs=action_ttl_secs, max_size=action_max_pending
+        )
 
     @property
     def protocol(self):
@@ -68,19 +79,20 @@ class HTTPServer(BaseProtocolServer):
     def action_ttl(self):
         """Returns the Action invocations Time-To-Live (seconds)."""
 
-        return self._action_ttl_secs
+        return self._pending_actions.ttl
 
     @property
-    def pending_actions(self):
-        """Dict of pending action invocations represented as Futures."""
+    def action_wait(self):
+        """Returns the maximum time (seconds) that an Action invocation request
+        may be held to return the result inline instead of an invocation URL."""
 
-        return self._pending_actions
+        return self._action_wait_secs
 
     @property
-    def invocation_check_times(self):
-        """Dict that contains the timestamp of the last time an invocation was checked by a client.."""
+    def pending_actions(self):
+        """Bounded store of pending action invocations represented as Futures."""
 
-        return self._invocation_check_times
+        return self._pending_actions
 
     def _build_app(self):
         """Builds and returns the Tornado application for the WebSockets server."""
@@ -144,7 +156,16 @@ class HTTPServer(BaseProtocolServer):
             op=[InteractionVerbs.OBSERVE_PROPERTY],
         )
 
-        return [form_read_write, form_observe]
+        form_observe_sse = Form(
+            interaction=proprty,
+            protocol=self.protocol,
+            href=href_observe,
+            content_type=MediaTypes.EVENT_STREAM,
+            op=[InteractionVerbs.OBSERVE_PROPERTY],
+            subprotocol=HTTPSubprotocols.SSE,
+        )
+
+        return [form_read_write, form_observe, form_observe_sse]
 
     def _build_forms_action(self, action, hostname):
         """Builds and returns the HTTP Form instances for the given Action interaction."""
@@ -186,7 +207,16 @@ class HTTPServer(BaseProtocolServer):
             op=[InteractionVerbs.SUBSCRIBE_EVENT],
         )
 
-        return [form_observe]
+        form_observe_sse = Form(
+            interaction=event,
+            protocol=self.protocol,
+            href=href_observe,
+            content_type=MediaTypes.EVENT_STREAM,
+            op=[InteractionVerbs.SUBSCRIBE_EVENT],
+            subprotocol=HTTPSubprotocols.SSE,
+        )
+
+        return [form_observe, form_observe_sse]
 
     def build_forms(self, hostname, interaction):
         """Builds and returns a list with all Form that are
@@ -230,3 +260,4 @@ class HTTPServer(BaseProtocolServer):
 
         self._server.stop()
         self._server = None
+        self._pending_actions.clear()
@@ -6,6 +6,7 @@ Classes that contain the client logic for the MQTT protocol.
 """
 
 import asyncio
+import collections
 import copy
 import json
 import logging
@@ -21,11 +22,12 @@ from slugify import slugify
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import ClientRequestTimeout, FormNotFoundException
-from wotpy.protocols.mqtt.enums import MQTTSchemes
+from wotpy.protocols.mqtt.enums import MQTTSchemes, MQTTSubprotocols
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.handlers.digest import DigestPublisher
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.mqtt.utils import MQTTBrokerURL, aiomqtt_read_loop
-from wotpy.protocols.refs import ConnRefCounter
+from wotpy.protocols.refs import ConnRefCounter, IdleConnPool
 from wotpy.protocols.utils import is_scheme_form
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import (
@@ -36,7 +38,13 @@ from wotpy.wot.events import (
 
 
 class MQTTClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the MQTT protocol."""
+    """Implementation of the protocol client interface for the MQTT protocol.
+    Connections are closed after the last request by default, so every request
+    subscribes to its reply topic again. Persistent reply subscriptions are
+    opt-in: clients built with idle_timeout_secs > 0 keep connections idle in
+    the pool for that long, and reply topic subscriptions last as long as the
+    connection, so requests within that time only publish and wait for the reply.
+    Call shutdown() to disconnect the idle connections."""
 
     DELIVER_TERMINATE_LOOP_SLEEP_SECS = 0.1
     SLEEP_SECS_DELIVER_ERR = 1.0
@@ -44,7 +52,9 @@ class MQTTClient(BaseProtocolClient):
     DEFAULT_DELIVER_TIMEOUT_SECS = 1
     DEFAULT_MSG_WAIT_TIMEOUT_SECS = 5
     DEFAULT_MSG_TTL_SECS = 15
+    DEFAULT_MSG_BUFFER_SIZE = 1000
     DEFAULT_STOP_LOOP_TIMEOUT_SECS = 60
+    DEFAULT_IDLE_TIMEOUT_SECS = 0
 
     DEFAULT_CLIENT_CONFIG = {"clean_session": False}
 
@@ -56,22 +66,65 @@ class MQTTClient(BaseProtocolClient):
         timeout_default=None,
         aiomqtt_config=None,
         stop_loop_timeout_secs=DEFAULT_STOP_LOOP_TIMEOUT_SECS,
+        idle_timeout_secs=DEFAULT_IDLE_TIMEOUT_SECS,
+        max_conns=None,
+        msg_buffer_size=DEFAULT_MSG_BUFFER_SIZE,
     ):
         self._deliver_timeout_secs = deliver_timeout_secs
         self._msg_wait_timeout_secs = msg_wait_timeout_secs
         self._msg_ttl_secs = msg_ttl_secs
+        self._msg_buffer_size = msg_buffer_size
         self._timeout_default = timeout_default
         self._aiomqtt_config = aiomqtt_config
         self._stop_loop_timeout_secs = stop_loop_timeout_secs
         self._lock_client = asyncio.Lock()
         self._deliver_stop_events = {}
-        self._msg_conditions = {}
         self._clients = {}
         self._messages = {}
+        self._msg_index = {}
+        self._msg_waiters = {}
         self._topics = {}
+        self._digests = {}
         self._ref_counter = ConnRefCounter()
+        self._pool = IdleConnPool(linger_secs=idle_timeout_secs, max_conns=max_conns)
+        self._unhealthy_clients = set()
+        self._num_subscribes = 0
         self._logr = logging.getLogger(__name__)
 
+    @property
+    def pool_stats(self):
+        """Dict with the hit, miss and eviction counters of the connection pool."""
+
+        return self._pool.stats
+
+    @property
+    def message_stats(self):
+        """Dict with the number of reply topic buffers, buffered messages (total
+        and in the largest buffer), indexed messages, waiters and the number
+        of SUBSCRIBE requests sent to the brokers."""
+
+        buffers = [
+            buffer
+            for topic_buffers in self._messages.values()
+            for buffer in topic_buffers.values()
+        ]
+
+        waiters = [
+            fut
+            for broker_waiters in self._msg_waiters.values()
+            for key_waiters in broker_waiters.values()
+            for fut in key_waiters
+        ]
+
+        return {
+            "topics": len(buffers),
+            "buffered": sum(len(buffer) for buffer in buffers),
+            "max_buffered": max([len(buffer) for buffer in buffers] or [0]),
+            "indexed": sum(len(index) for index in self._msg_index.values()),
+            "waiters": len(waiters),
+            "subscribes": self._num_subscribes,
+        }
+
     def _build_client_config(self, broker_url):
         """Returns the config dict for a new MQTT client instance."""
 
@@ -92,27 +145,54 @@ class MQTTClient(BaseProtocolClient):
 
         return config
 
-    async def _new_message(self, broker_url, msg):
-        """Adds the message to the internal queue and notifies all topic listeners."""
+    @classmethod
+    def _correlation_id(cls, data):
+        """Returns the ID that correlates a reply message with its request.
+        Action results carry the invocation ID and write ACKs carry the ACK code."""
 
-        if broker_url not in self._msg_conditions:
-            raise Exception("Unknown broker in conditions")
+        if not isinstance(data, dict):
+            return None
 
-        topic = msg.topic.value
+        return data.get("id", data.get("ack", None))
+
+    def _trim_messages(self, broker_url, topic, now):
+        """Removes the messages that have expired according to the
+        TTL from the head of the ring buffer of the given topic."""
+
+        buffer = self._messages[broker_url][topic]
+        index = self._msg_index[broker_url]
+
+        while len(buffer) and (now - buffer[0]["time"]) >= self._msg_ttl_secs:
+            self._unindex_message(index, topic, buffer.popleft())
+
+    @classmethod
+    def _unindex_message(cls, index, topic, message_dict):
+        """Removes a message that has left the ring buffer from the ID index."""
+
+        key = (topic, message_dict["correlation_id"])
 
-        if not self._msg_conditions.get(broker_url, {}).get(topic, None):
-            raise Exception("Unknown topic")
+        if index.get(key, None) is message_dict:
+            index.pop(key)
 
-        if broker_url not in self._messages:
-            self._messages[broker_url] = {}
+    async def _new_message(self, broker_url, msg):
+        """Wakes up the listeners that are waiting for the message.
+        Correlated replies that no waiter has claimed yet are kept in the
+        ring buffer of their topic and indexed by correlation ID."""
+
+        topic = msg.topic.value
 
-        if topic not in self._messages[broker_url]:
-            self._messages[broker_url][topic] = []
+        if topic not in self._messages.get(broker_url, {}):
+            raise Exception("Unknown topic: {}".format(topic))
+
+        now = time.time()
+        data = json.loads(msg.payload.decode())
+        correlation_id = self._correlation_id(data)
 
         message_dict = {
             "id": uuid.uuid4().hex,
-            "data": json.loads(msg.payload.decode()),
-            "time": time.time(),
+            "data": data,
+            "time": now,
+            "correlation_id": correlation_id,
         }
 
         self._logr.debug(
@@ -122,12 +202,28 @@ class MQTTClient(BaseProtocolClient):
             pprint.pformat(message_dict),
         )
 
-        self._messages[broker_url][topic].append(message_dict)
+        waiters = self._msg_waiters.get(broker_url, {})
+        futs_correlated = []
+
+        if correlation_id is not None:
+            futs_correlated = waiters.pop((topic, correlation_id), [])
+
+        for fut in futs_correlated + waiters.pop((topic, None), []):
+            not fut.done() and fut.set_result(message_dict)
+
+        if correlation_id is None or len(futs_correlated):
+            return
+
+        self._trim_messages(broker_url, topic, now)
 
-        async with self._msg_conditions[broker_url][topic]:
-            self._msg_conditions[broker_url][topic].notify_all()
+        buffer = self._messages[broker_url][topic]
+        index = self._msg_index[broker_url]
 
-        self._clean_messages(broker_url)
+        if len(buffer) == buffer.maxlen:
+            self._unindex_message(index, topic, buffer.popleft())
+
+        buffer.append(message_dict)
+        index[(topic, correlation_id)] = message_dict
 
     async def _reconnect_client(self, broker_url):
         """Reconnects an existing client that has been disconnected."""
@@ -155,6 +251,8 @@ class MQTTClient(BaseProtocolClient):
             )
         )
 
+        self._num_subscribes += len(topics)
+
         await asyncio.gather(
             *[
                 self._clients[broker_url].subscribe(topic=topic, qos=qos)
@@ -174,6 +272,8 @@ class MQTTClient(BaseProtocolClient):
                 )
                 await asyncio.sleep(self.SLEEP_SECS_DELIVER_ERR)
                 await self._reconnect_client(broker_url)
+                await self._subscribe_client(broker_url)
+                self._unhealthy_clients.discard(broker_url)
             except Exception as ex_reconn:
                 self._logr.warning(
                     "Error reconnecting: {}".format(ex_reconn), exc_info=True
@@ -191,6 +291,7 @@ class MQTTClient(BaseProtocolClient):
 
             async def anext_ex_handler(ex: Exception):
                 self._logr.warning("Error delivering message: {}".format(ex))
+                self._unhealthy_clients.add(broker_url)
                 await reconnect()
 
             async def message_handler(message: aiomqtt.Message):
@@ -252,15 +353,45 @@ class MQTTClient(BaseProtocolClient):
 
         self._deliver_stop_events.pop(broker_url)
 
+    async def shutdown(self):
+        """Disconnects the idle clients kept connected by the pool.
+        Clients still referenced by pending requests are not affected."""
+
+        async with self._lock_client:
+            for broker_url in self._pool.pop_all():
+                if not self._ref_counter.has_any(broker_url):
+                    await self._close_client(broker_url)
+
     async def _init_client(self, broker_url, ref_id):
-        """Initializes and connects a client to the given broker URL."""
+        """Initializes and connects a client to the given broker URL.
+        Connected clients (including idle ones kept by the pool) are reused
+        unless their delivery loop has lost the connection, in which case they are replaced.
+        """
 
         async with self._lock_client:
             self._ref_counter.increase(broker_url, ref_id)
+            self._pool.acquire(broker_url)
 
-            if broker_url in self._clients:
+            is_healthy = broker_url not in self._unhealthy_clients
+
+            if broker_url in self._clients and is_healthy:
+                self._pool.record_hit()
                 return
 
+            self._pool.record_miss()
+
+            if broker_url in self._clients:
+                self._logr.debug("Replacing unhealthy client: {}".format(broker_url))
+                await self._close_client(broker_url)
+
+            while self._pool.is_full(len(self._clients)):
+                idle_url = self._pool.pop_oldest()
+
+                if idle_url is None:
+                    break
+
+                await self._close_client(idle_url)
+
             config = self._build_client_config(broker_url=broker_url)
 
             self._logr.debug(
@@ -275,9 +406,9 @@ class MQTTClient(BaseProtocolClient):
             await self._start_deliver_loop(broker_url)
 
     async def _disconnect_client(self, broker_url, ref_id):
-        """Decreases the reference counter for the client on the given broker and cleans
-        all resources when the client does not have any more references pointing to it.
-        """
+        """Decreases the reference counter for the client on the given broker.
+        Clients without references are kept idle in the pool until
+        the linger time expires, and disconnected afterwards."""
 
         async with self._lock_client:
             self._ref_counter.decrease(broker_url, ref_id)
@@ -285,49 +416,78 @@ class MQTTClient(BaseProtocolClient):
             if self._ref_counter.has_any(broker_url):
                 return
 
-            try:
-                self._logr.debug(
-                    "Stopping message delivery loop: {}".format(broker_url)
-                )
-                await self._stop_deliver_loop(broker_url)
-            except Exception as ex:
-                self._logr.warning(
-                    "Error stopping deliver loop: {}".format(ex), exc_info=True
+            is_pooled = (
+                broker_url in self._clients
+                and broker_url not in self._unhealthy_clients
+                and self._pool.can_keep(len(self._clients))
+                and self._pool.release(
+                    broker_url,
+                    lambda: asyncio.ensure_future(self._close_idle_client(broker_url)),
                 )
+            )
 
-            try:
-                self._logr.info("Disconnecting MQTT client: {}".format(broker_url))
-                await self._clients[broker_url].__aexit__(
-                    exc_type=None, exc=None, tb=None
-                )
-            except Exception as ex:
-                self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
+            if not is_pooled:
+                await self._close_client(broker_url)
+
+    async def _close_idle_client(self, broker_url):
+        """Disconnects a pooled client once its linger time has expired."""
+
+        async with self._lock_client:
+            if self._ref_counter.has_any(broker_url) or self._pool.is_idle(broker_url):
+                return
+
+            await self._close_client(broker_url)
+
+    async def _close_client(self, broker_url):
+        """Stops the message delivery loop, disconnects the
+        client and cleans all resources related to the broker."""
 
-            self._clients.pop(broker_url, None)
-            self._messages.pop(broker_url, None)
-            self._msg_conditions.pop(broker_url, None)
-            self._topics.pop(broker_url, None)
+        self._pool.discard(broker_url)
+
+        try:
+            self._logr.debug("Stopping message delivery loop: {}".format(broker_url))
+            await self._stop_deliver_loop(broker_url)
+        except Exception as ex:
+            self._logr.warning(
+                "Error stopping deliver loop: {}".format(ex), exc_info=True
+            )
+
+        try:
+            self._logr.info("Disconnecting MQTT client: {}".format(broker_url))
+            await self._clients[broker_url].__aexit__(exc_type=None, exc=None, tb=None)
+        except Exception as ex:
+            self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
+
+        self._clients.pop(broker_url, None)
+        self._messages.pop(broker_url, None)
+        self._msg_index.pop(broker_url, None)
+        self._msg_waiters.pop(broker_url, None)
+        self._topics.pop(broker_url, None)
+        self._unhealthy_clients.discard(broker_url)
 
     async def _subscribe(self, broker_url, topic, qos):
-        """Subscribes to a topic."""
+        """Subscribes to a topic.
+        Subscriptions persist for as long as the client is connected
+        (they are renewed on reconnection), so repeated calls are no-ops."""
 
         async with self._lock_client:
             if broker_url not in self._clients:
                 return
 
-            self._logr.debug("Subscribing to topic: {}".format(topic))
-
-            if broker_url not in self._msg_conditions:
-                self._msg_conditions[broker_url] = {}
+            self._msg_index.setdefault(broker_url, {})
+            topic_buffers = self._messages.setdefault(broker_url, {})
 
-            if topic not in self._msg_conditions[broker_url]:
-                self._msg_conditions[broker_url][topic] = asyncio.Condition()
+            if topic not in topic_buffers:
+                topic_buffers[topic] = collections.deque(maxlen=self._msg_buffer_size)
 
-            if broker_url not in self._topics:
-                self._topics[broker_url] = set()
+            topics = self._topics.setdefault(broker_url, set())
 
-            self._topics[broker_url].add((topic, qos))
+            if (topic, qos) in topics:
+                return
 
+            self._logr.debug("Subscribing to topic: {}".format(topic))
+            topics.add((topic, qos))
+            self._num_subscribes += 1
             await self._clients[broker_url].subscribe(topic=topic, qos=qos)
 
     async def _publish(self, broker_url, topic, payload, qos):
@@ -341,66 +501,79 @@ class MQTTClient(BaseProtocolClient):
                 topic=topic, payload=payload, qos=qos
             )
 
-    def _topic_messages(self, broker_url, topic, from_time=None, ignore_ids=None):
-        """Returns a generator that yields the messages in the
-        delivered messages queue for the given topic."""
+    def _add_waiter(self, broker_url, topic, correlation_id=None):
+        """Registers a Future that is resolved with the next message in the topic.
+        If a correlation ID is given only the matching message resolves it."""
 
-        if broker_url not in self._messages:
-            return
+        if topic not in self._messages.get(broker_url, {}):
+            raise Exception("Unknown topic: {}".format(topic))
 
-        if topic not in self._messages[broker_url]:
-            return
+        fut = asyncio.get_running_loop().create_future()
+        waiters = self._msg_waiters.setdefault(broker_url, {})
+        waiters.setdefault((topic, correlation_id), []).append(fut)
 
-        for msg in self._messages[broker_url][topic]:
-            is_on_time = from_time is None or msg["time"] >= from_time
-            is_ignored = ignore_ids is not None and msg["id"] in ignore_ids
+        return fut
 
-            if is_on_time and not is_ignored:
-                yield msg["id"], msg["data"], msg["time"]
+    def _remove_waiter(self, broker_url, topic, correlation_id, fut):
+        """Removes a Future registered to wait for a message."""
 
-    def _clean_messages(self, broker_url):
-        """Removes the messages that have expired according to the TTL."""
+        key = (topic, correlation_id)
+        waiters = self._msg_waiters.get(broker_url, {})
+        key_waiters = waiters.get(key, [])
 
-        if broker_url not in self._messages:
-            return
+        if fut in key_waiters:
+            key_waiters.remove(fut)
 
-        now = time.time()
+        if key in waiters and not len(key_waiters):
+            waiters.pop(key)
 
-        self._messages[broker_url] = {
-            topic: [
-                msg
-                for msg in self._messages[broker_url][topic]
-                if (now - msg["time"]) < self._msg_ttl_secs
-            ]
-            for topic in self._messages[broker_url]
-        }
+    def _pop_indexed_message(self, broker_url, topic, correlation_id):
+        """Removes and returns the buffered message with the given
+        correlation ID from the index, or None if it has not arrived yet."""
 
-    def _next_match(self, broker_url, topic, func):
-        """Returns the first message match in the internal messages queue or None."""
+        index = self._msg_index.get(broker_url, {})
 
-        return next(
-            (item for item in self._topic_messages(broker_url, topic) if func(item)),
-            None,
-        )
+        return index.pop((topic, correlation_id), None)
 
-    async def _wait_on_message(self, broker_url, topic):
-        """Waits for the arrival of a message in the given topic."""
+    async def _publish_and_wait(
+        self, publish_args, reply_broker_url, reply_topic, correlation_id, timeout
+    ):
+        """Publishes a request and waits for the reply message on a reply topic
+        that the client is already subscribed to. Replies with a correlation ID
+        that arrive while publishing are found in the index; otherwise a waiter
+        is registered. Uncorrelated replies always need a waiter before publishing."""
 
-        if broker_url not in self._msg_conditions:
-            raise Exception("Unknown broker")
+        timeout = timeout if timeout else self._msg_wait_timeout_secs
+        fut = None
 
-        if not self._msg_conditions.get(broker_url, {}).get(topic, None):
-            raise Exception("Unknown topic")
+        if correlation_id is None:
+            fut = self._add_waiter(reply_broker_url, reply_topic)
 
-        async with self._msg_conditions[broker_url][topic]:
-            await asyncio.wait_for(
-                self._msg_conditions[broker_url][topic].wait(),
-                timeout=self._msg_wait_timeout_secs,
-            )
+        try:
+            await self._publish(**publish_args)
+
+            if fut is None:
+                message_dict = self._pop_indexed_message(
+                    reply_broker_url, reply_topic, correlation_id
+                )
+
+                if message_dict is not None:
+                    return message_dict
+
+                fut = self._add_waiter(reply_broker_url, reply_topic, correlation_id)
+
+            return await asyncio.wait_for(fut, timeout=timeout)
+        except asyncio.TimeoutError as ex:
+            self._logr.warning("Timeout waiting for reply on: {}".format(reply_topic))
+            raise ClientRequestTimeout from ex
+        finally:
+            if fut is not None:
+                self._remove_waiter(reply_broker_url, reply_topic, correlation_id, fut)
 
     @classmethod
-    def _pick_mqtt_href(cls, td, forms, op=None):
-        """Picks the most appropriate MQTT form href from the given list of forms."""
+    def _pick_mqtt_href(cls, td, forms, op=None, subprotocol=None):
+        """Picks the most appropriate MQTT form href from the given list of forms.
+        Only forms with the given subprotocol (none by default) are considered."""
 
         def is_op_form(form):
             try:
@@ -412,7 +585,9 @@ class MQTTClient(BaseProtocolClient):
             (
                 form.href
                 for form in forms
-                if is_scheme_form(form, td.base, MQTTSchemes.MQTT) and is_op_form(form)
+                if is_scheme_form(form, td.base, MQTTSchemes.MQTT)
+                and is_op_form(form)
+                and getattr(form, "subprotocol", None) == subprotocol
             ),
             None,
         )
@@ -483,37 +658,25 @@ class MQTTClient(BaseProtocolClient):
 
             input_data = {"id": uuid.uuid4().hex, "input": input_value}
 
-            input_payload = json.dumps(input_data).encode()
-
-            await self._publish(broker_url, topic_invoke, input_payload, qos_publish)
-
-            ini = time.time()
-
-            while True:
-                self._logr.debug("Checking invocation topic: {}".format(topic_result))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout invoking Action: {}".format(topic_result)
-                    )
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_url,
-                    topic_result,
-                    lambda item: item[1].get("id") == input_data.get("id"),
-                )
-
-                if not msg_match:
-                    await self._wait_on_message(broker_url, topic_result)
-                    continue
+            msg_reply = await self._publish_and_wait(
+                publish_args={
+                    "broker_url": broker_url,
+                    "topic": topic_invoke,
+                    "payload": json.dumps(input_data).encode(),
+                    "qos": qos_publish,
+                },
+                reply_broker_url=broker_url,
+                reply_topic=topic_result,
+                correlation_id=input_data.get("id"),
+                timeout=timeout,
+            )
 
-                msg_id, msg_data, msg_time = msg_match
+            msg_data = msg_reply["data"]
 
-                if msg_data.get("error", None) is not None:
-                    raise Exception(msg_data.get("error"))
-                else:
-                    return msg_data.get("result")
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+            else:
+                return msg_data.get("result")
         finally:
             await self._disconnect_client(broker_url, ref_id)
 
@@ -554,32 +717,24 @@ class MQTTClient(BaseProtocolClient):
 
             write_data = {"action": "write", "value": value, "ack": uuid.uuid4().hex}
 
-            write_payload = json.dumps(write_data).encode()
-
-            await self._publish(broker_url, topic_write, write_payload, qos_publish)
+            publish_args = {
+                "broker_url": broker_url,
+                "topic": topic_write,
+                "payload": json.dumps(write_data).encode(),
+                "qos": qos_publish,
+            }
 
             if not wait_ack:
+                await self._publish(**publish_args)
                 return
 
-            ini = time.time()
-
-            while True:
-                self._logr.debug("Checking write ACK topic: {}".format(topic_ack))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning("Timeout writing Property: {}".format(topic_ack))
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_url,
-                    topic_ack,
-                    lambda item: item[1].get("ack") == write_data.get("ack"),
-                )
-
-                if msg_match:
-                    break
-
-                await self._wait_on_message(broker_url, topic_ack)
+            await self._publish_and_wait(
+                publish_args=publish_args,
+                reply_broker_url=broker_url,
+                reply_topic=topic_ack,
+                correlation_id=write_data.get("ack"),
+                timeout=timeout,
+            )
         finally:
             await self._disconnect_client(broker_url, ref_id)
 
@@ -600,17 +755,20 @@ class MQTTClient(BaseProtocolClient):
             td, forms, op=InteractionVerbs.OBSERVE_PROPERTY
         )
 
-        if href_read is None or href_obsv is None:
+        if href_read is None:
             raise FormNotFoundException()
 
         parsed_href_read = self._parse_href(href_read)
-        parsed_href_obsv = self._parse_href(href_obsv)
-
         topic_read = parsed_href_read["topic"]
-        topic_obsv = parsed_href_obsv["topic"]
-
         broker_read = parsed_href_read["broker_url"]
-        broker_obsv = parsed_href_obsv["broker_url"]
+
+        if href_obsv is not None:
+            parsed_href_obsv = self._parse_href(href_obsv)
+            topic_obsv = parsed_href_obsv["topic"]
+            broker_obsv = parsed_href_obsv["broker_url"]
+        else:
+            topic_obsv = PropertyMQTTHandler.to_updates_topic(topic_read)
+            broker_obsv = broker_read
 
         try:
             await self._init_client(broker_read, ref_id)
@@ -620,35 +778,20 @@ class MQTTClient(BaseProtocolClient):
 
             await self._subscribe(broker_obsv, topic_obsv, qos_subscribe)
 
-            read_time = time.time()
-            read_payload = json.dumps({"action": "read"}).encode()
-
-            await self._publish(broker_read, topic_read, read_payload, qos_publish)
-
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking property update topic: {}".format(topic_obsv)
-                )
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout reading Property: {}".format(topic_obsv)
-                    )
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_obsv, topic_obsv, lambda item: item[2] >= read_time
-                )
-
-                if not msg_match:
-                    await self._wait_on_message(broker_obsv, topic_obsv)
-                    continue
-
-                msg_id, msg_data, msg_time = msg_match
+            msg_reply = await self._publish_and_wait(
+                publish_args={
+                    "broker_url": broker_read,
+                    "topic": topic_read,
+                    "payload": json.dumps({"action": "read"}).encode(),
+                    "qos": qos_publish,
+                },
+                reply_broker_url=broker_obsv,
+                reply_topic=topic_obsv,
+                correlation_id=None,
+                timeout=timeout,
+            )
 
-                return msg_data.get("value")
+            return msg_reply["data"].get("value")
         finally:
             await self._disconnect_client(broker_read, ref_id)
 
@@ -728,6 +871,18 @@ class MQTTClient(BaseProtocolClient):
 
         href = self._pick_mqtt_href(td, forms, op=InteractionVerbs.OBSERVE_PROPERTY)
 
+        href_digest = self._pick_mqtt_href(
+            td,
+            forms,
+            op=InteractionVerbs.OBSERVE_PROPERTY,
+            subprotocol=MQTTSubprotocols.DIGEST,
+        )
+
+        href_read = self._pick_mqtt_href(td, forms, op=InteractionVerbs.READ_PROPERTY)
+
+        if href is None and href_digest is not None and href_read is not None:
+            return self._on_property_change_digest(href_read, href_digest, name, qos)
+
         if href is None:
             raise FormNotFoundException()
 
@@ -750,6 +905,68 @@ class MQTTClient(BaseProtocolClient):
 
         return Observable.create(subscribe)
 
+    def _get_digest_observable(self, broker_url, topic, qos):
+        """Returns the Observable of the update lists published on a digest topic.
+        The Observable is shared by all the Property observations on the same topic,
+        so that there is a single broker subscription for each digest topic."""
+
+        key = (broker_url, topic)
+
+        if key in self._digests:
+            return self._digests[key]
+
+        def next_item_builder(msg_data):
+            return msg_data.get(DigestPublisher.KEY_UPDATES, [])
+
+        subscribe = self._build_subscribe(
+            broker_url=broker_url,
+            topic=topic,
+            next_item_builder=next_item_builder,
+            qos=qos,
+        )
+
+        def remove_digest():
+            if self._digests.get(key, None) is observable:
+                self._digests.pop(key)
+
+        observable = (
+            Observable.create(subscribe)
+            .finally_action(remove_digest)
+            .publish()
+            .ref_count()
+        )
+
+        self._digests[key] = observable
+
+        return observable
+
+    def _on_property_change_digest(self, href_read, href_digest, name, qos):
+        """Subscribes to the servient digest topic and emits the updates
+        of the Property identified by the given requests href."""
+
+        topic_read = self._parse_href(href_read)["topic"]
+        thing_url_name, prop_url_name = topic_read.split("/")[-2:]
+        parsed_href = self._parse_href(href_digest)
+
+        digest = self._get_digest_observable(
+            broker_url=parsed_href["broker_url"], topic=parsed_href["topic"], qos=qos
+        )
+
+        def subscribe(observer):
+            def on_next(updates):
+                for update in updates:
+                    if update[0] == thing_url_name and update[1] == prop_url_name:
+                        init = PropertyChangeEventInit(name=name, value=update[2])
+                        observer.on_next(PropertyChangeEmittedEvent(init=init))
+
+            return digest.subscribe(
+                on_next=on_next,
+                on_error=observer.on_error,
+                on_completed=observer.on_completed,
+            )
+
+        return Observable.create(subscribe)
+
     def on_event(self, td, name, qos=0):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
@@ -14,6 +14,12 @@ class MQTTSchemes(EnumListMixin):
     MQTT = "mqtt"
 
 
+class MQTTSubprotocols(EnumListMixin):
+    """Enumeration of MQTT subprotocols advertised in Forms."""
+
+    DIGEST = "digest"
+
+
 class MQTTCommandCodes(EnumListMixin):
     """Enumeration of MQTT packet types."""
 
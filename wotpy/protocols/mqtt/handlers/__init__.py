@@ -9,8 +9,12 @@ Entities that handle the MQTT operations needed to support each of the Interacti
 
     wotpy.protocols.mqtt.handlers.action
     wotpy.protocols.mqtt.handlers.base
+    wotpy.protocols.mqtt.handlers.coalesce
+    wotpy.protocols.mqtt.handlers.digest
     wotpy.protocols.mqtt.handlers.event
     wotpy.protocols.mqtt.handlers.ping
     wotpy.protocols.mqtt.handlers.property
+    wotpy.protocols.mqtt.handlers.routes
     wotpy.protocols.mqtt.handlers.subs
+    wotpy.protocols.mqtt.handlers.watcher
 """
@@ -10,7 +10,9 @@ import time
 from json import JSONDecodeError
 
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.handlers.routes import InteractionRoutes
 from wotpy.utils.utils import to_json_obj
+from wotpy.wot.enums import InteractionTypes
 
 
 class ActionMQTTHandler(BaseMQTTHandler):
@@ -19,10 +21,15 @@ class ActionMQTTHandler(BaseMQTTHandler):
     KEY_INPUT = "input"
     KEY_INVOCATION_ID = "id"
 
-    def __init__(self, mqtt_server, qos=2):
+    def __init__(self, mqtt_server, qos=2, shared_group=None):
         super(ActionMQTTHandler, self).__init__(mqtt_server)
 
         self._qos = qos
+        self._shared_group = shared_group
+
+        self._routes = InteractionRoutes(
+            interaction_type=InteractionTypes.ACTION, server=self.mqtt_server
+        )
 
     @property
     def topic_wildcard_invocation(self):
@@ -55,7 +62,23 @@ class ActionMQTTHandler(BaseMQTTHandler):
     def topics(self):
         """List of topics that this MQTT handler wants to subscribe to."""
 
-        return [(self.topic_wildcard_invocation, self._qos)]
+        topic = self.build_shared_topic(
+            self.topic_wildcard_invocation, self._shared_group
+        )
+
+        return [(topic, self._qos)]
+
+    async def init(self):
+        """Initializes the MQTT handler.
+        Called when the MQTT runner starts."""
+
+        self._routes.start()
+
+    async def teardown(self):
+        """Destroys the MQTT handler.
+        Called when the MQTT runner stops."""
+
+        self._routes.dispose()
 
     async def handle_message(self, msg):
         """Listens to all Property request topics and responds to read and write requests."""
@@ -74,23 +97,13 @@ class ActionMQTTHandler(BaseMQTTHandler):
         if len(topic_split) != splits_expected_len:
             return
 
-        thing_url_name, action_url_name = topic_split[-2], topic_split[-1]
+        route = self._routes.find(topic_split[-2], topic_split[-1])
 
-        try:
-            exp_thing = next(
-                item
-                for item in self.mqtt_server.exposed_things
-                if item.url_name == thing_url_name
-            )
-
-            action = next(
-                exp_thing.thing.actions[key]
-                for key in exp_thing.thing.actions
-                if exp_thing.thing.actions[key].url_name == action_url_name
-            )
-        except StopIteration:
+        if route is None:
             return
 
+        exp_thing, action = route
+
         input_value = parsed_msg.get(self.KEY_INPUT, None)
 
         data = {"id": parsed_msg.get(self.KEY_INVOCATION_ID, None), "timestamp": now_ms}
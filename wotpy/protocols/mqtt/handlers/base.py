@@ -9,11 +9,14 @@ from asyncio import Queue
 
 
 class BaseMQTTHandler(object):
-    """Base class for all MQTT handlers."""
+    """Base class for all MQTT handlers.
+    The queue of outgoing messages is unbounded unless a queue_size is given."""
 
-    def __init__(self, mqtt_server):
+    SHARED_SUBSCRIPTION_PREFIX = "$share"
+
+    def __init__(self, mqtt_server, queue_size=None):
         self._mqtt_server = mqtt_server
-        self._queue = Queue()
+        self._queue = Queue(maxsize=queue_size or 0)
 
     @property
     def servient_id(self):
@@ -34,6 +37,16 @@ class BaseMQTTHandler(object):
 
         return None
 
+    @classmethod
+    def build_shared_topic(cls, topic, shared_group=None):
+        """Returns the topic filter to subscribe to the given topic as a member of
+        a shared subscription group (the topic itself if there is no group)."""
+
+        if not shared_group:
+            return topic
+
+        return "{}/{}/{}".format(cls.SHARED_SUBSCRIPTION_PREFIX, shared_group, topic)
+
     @property
     def queue(self):
         """Asynchronous queue where the handler leaves messages
@@ -41,6 +54,13 @@ class BaseMQTTHandler(object):
 
         return self._queue
 
+    def ordering_key(self, msg):
+        """Returns a key that groups the messages that must be handled in arrival order.
+        Messages with the same key are handled one at a time; a key of None means
+        that the message may be handled concurrently with any other message."""
+
+        return None
+
     async def handle_message(self, msg):
         """Called each time the runner receives a message for one of the handler topics."""
 
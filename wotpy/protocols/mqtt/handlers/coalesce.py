@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Per-topic buffer that coalesces the messages published by MQTT handlers.
+"""
+
+import asyncio
+import logging
+
+
+class CoalescingPublisher(object):
+    """Puts messages in the queue of an MQTT handler with a minimum interval
+    between publications on the same topic. Messages that arrive before the
+    interval has passed replace the message pending for that topic,
+    so that only the latest value is published. Messages that find
+    the (bounded) handler queue full are dropped and counted."""
+
+    def __init__(self, queue, min_interval_ms=None, retain=False):
+        self._queue = queue
+        self._min_interval_ms = min_interval_ms
+        self._retain = retain
+        self._pending = {}
+        self._timers = {}
+        self._last_put = {}
+        self._num_published = 0
+        self._num_merged = 0
+        self._num_dropped = 0
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def min_interval_ms(self):
+        """Returns the minimum interval (ms) between publications on the same topic."""
+
+        return self._min_interval_ms
+
+    @property
+    def retain(self):
+        """Returns True if messages are published with the retain flag."""
+
+        return self._retain
+
+    @property
+    def stats(self):
+        """Returns a dict with the counters of published, merged and dropped messages."""
+
+        return {
+            "pending": len(self._pending),
+            "published": self._num_published,
+            "merged": self._num_merged,
+            "dropped": self._num_dropped,
+        }
+
+    def publish(self, message):
+        """Puts the message in the queue or keeps it as the latest
+        pending message for its topic if the interval has not passed."""
+
+        if self._retain:
+            message = dict(message, retain=True)
+
+        topic = message["topic"]
+
+        if not self._min_interval_ms:
+            self._put(message)
+            return
+
+        if topic in self._pending:
+            self._pending[topic] = message
+            self._num_merged += 1
+            return
+
+        loop = asyncio.get_event_loop()
+        interval_secs = self._min_interval_ms / 1000.0
+        last_put = self._last_put.get(topic, None)
+
+        if last_put is None or loop.time() - last_put >= interval_secs:
+            self._last_put[topic] = loop.time()
+            self._put(message)
+            return
+
+        self._pending[topic] = message
+
+        self._timers[topic] = loop.call_later(
+            last_put + interval_secs - loop.time(), self._flush, topic
+        )
+
+    def clear(self):
+        """Discards the pending messages and cancels the publication timers."""
+
+        for timer in self._timers.values():
+            timer.cancel()
+
+        self._timers = {}
+        self._pending = {}
+        self._last_put = {}
+
+    def _flush(self, topic):
+        """Puts the pending message of the given topic in the queue."""
+
+        self._timers.pop(topic, None)
+        message = self._pending.pop(topic, None)
+
+        if message is None:
+            return
+
+        self._last_put[topic] = asyncio.get_event_loop().time()
+        self._put(message)
+
+    def _put(self, message):
+        """Puts a message in the queue, dropping it if the queue is full."""
+
+        try:
+            self._queue.put_nowait(message)
+            self._num_published += 1
+        except asyncio.QueueFull:
+            self._logr.debug("Dropped message: {}".format(message["topic"]))
+            self._num_dropped += 1
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Publisher that batches Property updates in a single servient-level digest message.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from wotpy.utils.utils import to_json_obj
+
+
+class DigestPublisher(object):
+    """Accumulates the Property updates of all ExposedThings during a time window
+    and puts a single message in the queue of an MQTT handler when the window ends.
+    The message payload contains the list of updates as
+    [thing_url_name, property_url_name, value, timestamp] arrays."""
+
+    KEY_UPDATES = "updates"
+    DEFAULT_MAX_UPDATES = 1000
+
+    def __init__(self, queue, topic, window_ms, qos=0, max_updates=None):
+        self._queue = queue
+        self._topic = topic
+        self._window_ms = window_ms
+        self._qos = qos
+        self._max_updates = max_updates or self.DEFAULT_MAX_UPDATES
+        self._updates = []
+        self._timer = None
+        self._num_updates = 0
+        self._num_batches = 0
+        self._num_dropped = 0
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def topic(self):
+        """Returns the topic where the digest messages are published."""
+
+        return self._topic
+
+    @property
+    def stats(self):
+        """Returns a dict with the counters of batched updates and published digests."""
+
+        return {
+            "pending": len(self._updates),
+            "updates": self._num_updates,
+            "batches": self._num_batches,
+            "dropped": self._num_dropped,
+        }
+
+    def add(self, thing_url_name, prop_url_name, value):
+        """Adds a Property update to the current digest. The digest is
+        published when the window ends or the maximum size is reached."""
+
+        now_ms = int(time.time() * 1000)
+        self._updates.append(
+            [thing_url_name, prop_url_name, to_json_obj(value), now_ms]
+        )
+        self._num_updates += 1
+
+        if len(self._updates) >= self._max_updates:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(
+                self._window_ms / 1000.0, self.flush
+            )
+
+    def flush(self):
+        """Puts the digest with the accumulated updates in the queue."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._updates:
+            return
+
+        updates, self._updates = self._updates, []
+
+        message = {
+            "topic": self._topic,
+            "data": json.dumps({self.KEY_UPDATES: updates}).encode(),
+            "qos": self._qos,
+        }
+
+        try:
+            self._queue.put_nowait(message)
+            self._num_batches += 1
+        except asyncio.QueueFull:
+            self._logr.debug("Dropped digest of {} updates".format(len(updates)))
+            self._num_dropped += len(updates)
+
+    def clear(self):
+        """Discards the accumulated updates and cancels the publication timer."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._updates = []
@@ -18,16 +18,15 @@ from wotpy.wot.enums import InteractionTypes
 
 
 class EventMQTTHandler(BaseMQTTHandler):
-    """MQTT handler for Event subscriptions."""
+    """MQTT handler for Event subscriptions.
+    Event subscriptions are updated on ExposedThing and TD change notifications
+    and, if callback_ms is given, by a periodic full resync every callback_ms."""
 
-    DEFAULT_CALLBACK_MS = 2000
     DEFAULT_JITTER = 0.2
 
     def __init__(self, mqtt_server, qos=0, callback_ms=None):
         super(EventMQTTHandler, self).__init__(mqtt_server)
 
-        callback_ms = self.DEFAULT_CALLBACK_MS if callback_ms is None else callback_ms
-
         self._qos = qos
         self._callback_ms = callback_ms
         self._subs = {}
@@ -38,12 +37,16 @@ class EventMQTTHandler(BaseMQTTHandler):
             on_next_builder=self._build_on_next,
         )
 
-        async def refresh_subs():
-            self._interaction_subscriber.refresh()
+        self._periodic_refresh_subs = None
 
-        self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
-            refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER
-        )
+        if self._callback_ms:
+
+            async def refresh_subs():
+                self._interaction_subscriber.refresh()
+
+            self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
+                refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER
+            )
 
     def build_event_topic(self, thing, event):
         """Returns the MQTT topic for Event emissions."""
@@ -52,16 +55,22 @@ class EventMQTTHandler(BaseMQTTHandler):
 
     async def init(self):
         """Initializes the MQTT handler.
-        Called when the MQTT runner starts."""
+        Called when the MQTT runner starts.
+        Subscriptions are updated as ExposedThings and their TDs change;
+        the optional periodic callback adds a full resync on top of that."""
+
+        self._interaction_subscriber.start()
 
-        self._interaction_subscriber.refresh()
-        self._periodic_refresh_subs.start()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.start()
 
     async def teardown(self):
         """Destroys the MQTT handler.
         Called when the MQTT runner stops."""
 
-        self._periodic_refresh_subs.stop()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.stop()
+
         self._interaction_subscriber.dispose()
 
     def _build_on_next(self, exp_thing, event):
@@ -7,51 +7,104 @@ MQTT handler for Property reads, writes and subscriptions to value updates.
 
 import json
 import time
-from asyncio import QueueFull
 from json import JSONDecodeError
 
 import tornado.ioloop
 
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.handlers.coalesce import CoalescingPublisher
+from wotpy.protocols.mqtt.handlers.digest import DigestPublisher
+from wotpy.protocols.mqtt.handlers.routes import InteractionRoutes
 from wotpy.protocols.mqtt.handlers.subs import InteractionsSubscriber
 from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import InteractionTypes
 
 
 class PropertyMQTTHandler(BaseMQTTHandler):
-    """MQTT handler for Property reads, writes and subscriptions to value updates."""
+    """MQTT handler for Property reads, writes and subscriptions to value updates.
+    Subscriptions to observable Properties follow the ExposedThing and TD change
+    notifications of the server; a positive callback_ms adds a periodic resync."""
 
     KEY_ACTION = "action"
     KEY_VALUE = "value"
     KEY_ACK = "ack"
     ACTION_READ = "read"
     ACTION_WRITE = "write"
-    DEFAULT_CALLBACK_MS = 2000
     DEFAULT_JITTER = 0.2
 
-    def __init__(self, mqtt_server, qos_observe=0, qos_rw=1, callback_ms=None):
-        super(PropertyMQTTHandler, self).__init__(mqtt_server)
-
-        callback_ms = self.DEFAULT_CALLBACK_MS if callback_ms is None else callback_ms
+    def __init__(
+        self,
+        mqtt_server,
+        qos_observe=0,
+        qos_rw=1,
+        callback_ms=None,
+        min_interval_ms=None,
+        retain=False,
+        shared_group=None,
+        digest_ms=None,
+        queue_size=None,
+    ):
+        super(PropertyMQTTHandler, self).__init__(mqtt_server, queue_size=queue_size)
 
         self._qos_observe = qos_observe
         self._qos_rw = qos_rw
         self._callback_ms = callback_ms
+        self._shared_group = shared_group
         self._subs = {}
 
+        self._updates_publisher = CoalescingPublisher(
+            queue=self.queue, min_interval_ms=min_interval_ms, retain=retain
+        )
+
+        self._digest_publisher = None
+
+        if digest_ms:
+            self._digest_publisher = DigestPublisher(
+                queue=self.queue,
+                topic=self.topic_digest,
+                window_ms=digest_ms,
+                qos=self._qos_observe,
+            )
+
         self._interaction_subscriber = InteractionsSubscriber(
             interaction_type=InteractionTypes.PROPERTY,
             server=self.mqtt_server,
             on_next_builder=self._build_on_next,
         )
 
-        async def refresh_subs():
-            self._interaction_subscriber.refresh()
-
-        self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
-            refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER
+        self._routes = InteractionRoutes(
+            interaction_type=InteractionTypes.PROPERTY, server=self.mqtt_server
         )
 
+        self._periodic_refresh_subs = None
+
+        if self._callback_ms:
+
+            async def refresh_subs():
+                self._interaction_subscriber.refresh()
+
+            self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
+                refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER
+            )
+
+    @property
+    def updates_stats(self):
+        """Counters of the Property updates published, merged and dropped."""
+
+        return self._updates_publisher.stats
+
+    @property
+    def digest_stats(self):
+        """Counters of the Property updates batched in digests (None if disabled)."""
+
+        return self._digest_publisher.stats if self._digest_publisher else None
+
+    @property
+    def topic_digest(self):
+        """Topic for the digests that batch the Property updates of all Things."""
+
+        return "{}/property/digest".format(self.servient_id)
+
     @property
     def topic_wildcard_requests(self):
         """Wildcard topic to subscribe to all Property requests."""
@@ -65,6 +118,20 @@ class PropertyMQTTHandler(BaseMQTTHandler):
             self.servient_id, thing.url_name, prop.url_name
         )
 
+    @classmethod
+    def to_updates_topic(cls, requests_topic):
+        """Takes a Property requests topic and returns the related updates topic."""
+
+        topic_split = requests_topic.split("/")
+
+        servient_id, thing_name, prop_name = (
+            topic_split[-5],
+            topic_split[-2],
+            topic_split[-1],
+        )
+
+        return "{}/property/updates/{}/{}".format(servient_id, thing_name, prop_name)
+
     @classmethod
     def to_write_ack_topic(cls, requests_topic):
         """Takes a Property requests topic and returns the related write ACK topic."""
@@ -87,7 +154,17 @@ class PropertyMQTTHandler(BaseMQTTHandler):
     def topics(self):
         """List of topics that this MQTT handler wants to subscribe to."""
 
-        return [(self.topic_wildcard_requests, self._qos_rw)]
+        topic = self.build_shared_topic(
+            self.topic_wildcard_requests, self._shared_group
+        )
+
+        return [(topic, self._qos_rw)]
+
+    def ordering_key(self, msg):
+        """Requests for the same Property (same topic) are handled in arrival order
+        to ensure that consecutive writes are applied in the order they were sent."""
+
+        return msg.topic.value
 
     async def handle_message(self, msg):
         """Listens to all Property request topics and responds to read and write requests."""
@@ -109,23 +186,13 @@ class PropertyMQTTHandler(BaseMQTTHandler):
         if len(topic_split) != splits_expected_len:
             return
 
-        thing_url_name, prop_url_name = topic_split[-2], topic_split[-1]
+        route = self._routes.find(topic_split[-2], topic_split[-1])
 
-        try:
-            exp_thing = next(
-                item
-                for item in self.mqtt_server.exposed_things
-                if item.url_name == thing_url_name
-            )
-
-            prop = next(
-                exp_thing.thing.properties[key]
-                for key in exp_thing.thing.properties
-                if exp_thing.thing.properties[key].url_name == prop_url_name
-            )
-        except StopIteration:
+        if route is None:
             return
 
+        exp_thing, prop = route
+
         if action == self.ACTION_READ:
             value = await exp_thing.properties[prop.name].read()
             topic = self.build_property_updates_topic(exp_thing.thing, prop)
@@ -161,17 +228,30 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
     async def init(self):
         """Initializes the MQTT handler.
-        Called when the MQTT runner starts."""
+        Called when the MQTT runner starts.
+        Subscriptions are updated as ExposedThings and their TDs change;
+        the optional periodic callback adds a full resync on top of that."""
+
+        self._routes.start()
+        self._interaction_subscriber.start()
 
-        self._interaction_subscriber.refresh()
-        self._periodic_refresh_subs.start()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.start()
 
     async def teardown(self):
         """Destroys the MQTT handler.
         Called when the MQTT runner stops."""
 
-        self._periodic_refresh_subs.stop()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.stop()
+
         self._interaction_subscriber.dispose()
+        self._updates_publisher.clear()
+
+        if self._digest_publisher is not None:
+            self._digest_publisher.clear()
+
+        self._routes.dispose()
 
     def _build_update_message(self, topic, value):
         """Builds an MQTT message to publish an update for a Property value."""
@@ -187,15 +267,23 @@ class PropertyMQTTHandler(BaseMQTTHandler):
         }
 
     def _build_on_next(self, exp_thing, prop):
-        """Builds the on_next function to use when subscribing to the given Property."""
+        """Builds the on_next function to use when subscribing to the given Property.
+        Updates are published on the digest topic instead if digests are enabled."""
+
+        if self._digest_publisher is not None:
+            thing_url_name, prop_url_name = exp_thing.url_name, prop.url_name
+
+            def on_next_digest(item):
+                self._digest_publisher.add(
+                    thing_url_name, prop_url_name, item.data.value
+                )
+
+            return on_next_digest
 
         topic = self.build_property_updates_topic(exp_thing, prop)
 
         def on_next(item):
-            try:
-                msg = self._build_update_message(topic, item.data.value)
-                self.queue.put_nowait(msg)
-            except QueueFull:
-                pass
+            msg = self._build_update_message(topic, item.data.value)
+            self._updates_publisher.publish(msg)
 
         return on_next
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Routing table that maps the URL names in MQTT request topics to the
+Interactions of the ExposedThings contained by a Protocol Binding server.
+"""
+
+from wotpy.protocols.mqtt.handlers.watcher import ExposedThingsWatcher
+from wotpy.wot.enums import InteractionTypes, TDChangeType
+
+
+class InteractionRoutes(object):
+    """Index of the Interactions of one kind keyed by (Thing URL name, Interaction URL name).
+    Once started, the index is updated incrementally when ExposedThings are
+    added to or removed from the server and when their Thing Descriptions change.
+    Changes are received through the ExposedThingsWatcher shared by the server."""
+
+    def __init__(self, interaction_type, server):
+        self._interaction_type = interaction_type
+        self._td_change_type = ExposedThingsWatcher.td_change_type(interaction_type)
+        self._watcher = server.exposed_things_watcher
+        self._listener = None
+        self._routes = {}
+        self._thing_keys = {}
+
+    def __len__(self):
+        return len(self._routes)
+
+    def _interaction_attr_name(self):
+        """Returns the attribute name of the Thing interactions
+        dict for the current type of interactions."""
+
+        return {
+            InteractionTypes.PROPERTY: "properties",
+            InteractionTypes.ACTION: "actions",
+            InteractionTypes.EVENT: "events",
+        }.get(self._interaction_type)
+
+    def _unindex_exposed_thing(self, exp_thing):
+        """Removes all the routes of the given ExposedThing."""
+
+        for key in self._thing_keys.pop(exp_thing, set()):
+            self._routes.pop(key, None)
+
+    def _index_exposed_thing(self, exp_thing):
+        """(Re)builds the routes of the given ExposedThing.
+        This is called again when the Thing title (and thus the URL name) changes."""
+
+        self._unindex_exposed_thing(exp_thing)
+
+        thing_url_name = exp_thing.thing.url_name
+        interactions = getattr(exp_thing.thing, self._interaction_attr_name())
+        keys = set()
+
+        for intrc in interactions.values():
+            key = (thing_url_name, intrc.url_name)
+            self._routes[key] = (exp_thing, intrc)
+            keys.add(key)
+
+        self._thing_keys[exp_thing] = keys
+
+    def start(self):
+        """Indexes all the ExposedThings in the server and
+        starts listening for changes in the set of ExposedThings."""
+
+        if self._listener is not None:
+            return
+
+        self._listener = self._watcher.add_listener(
+            td_change_types=[self._td_change_type, TDChangeType.THING],
+            on_change=self._index_exposed_thing,
+            on_remove=self._unindex_exposed_thing,
+        )
+
+    def dispose(self):
+        """Stops listening for changes and clears the routing table."""
+
+        if self._listener is not None:
+            self._watcher.remove_listener(self._listener)
+            self._listener = None
+
+        self._routes = {}
+        self._thing_keys = {}
+
+    def find(self, thing_url_name, interaction_url_name):
+        """Returns the (ExposedThing, Interaction) tuple for the
+        given pair of URL names or None if there is no route."""
+
+        return self._routes.get((thing_url_name, interaction_url_name), None)
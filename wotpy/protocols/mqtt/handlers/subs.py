@@ -9,12 +9,18 @@ all the ExposedThings contained by a Protocol Binding server.
 import logging
 from functools import partial
 
-from wotpy.wot.enums import InteractionTypes
+from wotpy.protocols.mqtt.handlers.watcher import ExposedThingsWatcher
+from wotpy.wot.enums import InteractionTypes, TDChangeType
 
 
 class InteractionsSubscriber(object):
     """Class that subscribes to all the Interactions of one kind for
-    all the ExposedThings contained by a Protocol Binding server."""
+    all the ExposedThings contained by a Protocol Binding server.
+    Once started, subscriptions are updated incrementally when ExposedThings are
+    added to or removed from the server and when their Thing Descriptions change.
+    The subscriptions of a Thing are rebuilt when its URL name changes
+    (e.g. after updating the title), as the topics depend on it.
+    Changes are received through the ExposedThingsWatcher shared by the server."""
 
     def __init__(self, interaction_type, server, on_next_builder):
         if interaction_type not in [InteractionTypes.PROPERTY, InteractionTypes.EVENT]:
@@ -24,11 +30,17 @@ class InteractionsSubscriber(object):
         self._server = server
         self._on_next_builder = on_next_builder
         self._subs = {}
+        self._url_names = {}
+        self._td_change_type = ExposedThingsWatcher.td_change_type(interaction_type)
+        self._watcher = server.exposed_things_watcher
+        self._listener = None
         self._logr = logging.getLogger(__name__)
 
     def _dispose_exposed_thing_subs(self, exp_thing):
         """Disposes of all currently active subscriptions for the given ExposedThing."""
 
+        self._url_names.pop(exp_thing, None)
+
         if exp_thing not in self._subs:
             return
 
@@ -61,6 +73,13 @@ class InteractionsSubscriber(object):
     def _refresh_exposed_thing_subs(self, exp_thing):
         """Refresh the subscriptions for the given ExposedThing."""
 
+        url_name = exp_thing.thing.url_name
+
+        if self._url_names.get(exp_thing, url_name) != url_name:
+            self._dispose_exposed_thing_subs(exp_thing)
+
+        self._url_names[exp_thing] = url_name
+
         if exp_thing not in self._subs:
             self._subs[exp_thing] = {}
 
@@ -98,14 +117,32 @@ class InteractionsSubscriber(object):
                 on_next=on_next, on_error=on_error_partial
             )
 
+    def start(self):
+        """Subscribes to all the ExposedThings in the server
+        and starts listening for changes in the set of ExposedThings."""
+
+        if self._listener is not None:
+            return
+
+        self._listener = self._watcher.add_listener(
+            td_change_types=[self._td_change_type, TDChangeType.THING],
+            on_change=self._refresh_exposed_thing_subs,
+            on_remove=self._dispose_exposed_thing_subs,
+        )
+
     def dispose(self):
-        """Disposes of all the currently active subscriptions."""
+        """Stops listening for changes and disposes of all the active subscriptions."""
+
+        if self._listener is not None:
+            self._watcher.remove_listener(self._listener)
+            self._listener = None
 
         for exp_thing in list(self._subs.keys()):
             self._dispose_exposed_thing_subs(exp_thing)
 
     def refresh(self):
-        """Refresh all subscriptions for the entire set of ExposedThings."""
+        """Refresh all subscriptions for the entire set of ExposedThings.
+        This full resync is not needed once the subscriber has been started."""
 
         things_expected = set(self._server.exposed_things)
         things_current = set(self._subs.keys())
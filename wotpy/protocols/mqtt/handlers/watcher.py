@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Class that watches the set of ExposedThings contained by a Protocol Binding
+server and the Thing Description changes of each of them.
+"""
+
+from wotpy.wot.enums import InteractionTypes, TDChangeMethod, TDChangeType
+
+
+class ExposedThingsWatcherListener(object):
+    """Set of callbacks registered in an ExposedThingsWatcher.
+    The on_change callback receives the ExposedThing when it is added and on every
+    TD change of the given types. The on_remove callback receives the ExposedThing
+    when it is removed from the server or the listener is removed from the watcher."""
+
+    def __init__(self, td_change_types, on_change, on_remove):
+        self.td_change_types = set(td_change_types)
+        self.on_change = on_change
+        self.on_remove = on_remove
+
+
+class ExposedThingsWatcher(object):
+    """Notifies its listeners when ExposedThings are added to or removed from
+    a server and when the Thing Description of a watched ExposedThing changes.
+    A single watcher may be shared by all the consumers of a server, so that
+    there is only one subscription for each ExposedThing. The watcher is
+    active while there is at least one listener."""
+
+    TD_CHANGE_TYPES = {
+        InteractionTypes.PROPERTY: TDChangeType.PROPERTY,
+        InteractionTypes.ACTION: TDChangeType.ACTION,
+        InteractionTypes.EVENT: TDChangeType.EVENT,
+    }
+
+    def __init__(self, server):
+        self._server = server
+        self._listeners = []
+        self._td_change_subs = {}
+        self._server_sub = None
+
+    @classmethod
+    def td_change_type(cls, interaction_type):
+        """Returns the TDChangeType for the given type of interactions."""
+
+        if interaction_type not in cls.TD_CHANGE_TYPES:
+            raise ValueError("Invalid interaction type: {}".format(interaction_type))
+
+        return cls.TD_CHANGE_TYPES[interaction_type]
+
+    @property
+    def exposed_things(self):
+        """Returns the list of ExposedThings currently watched."""
+
+        return list(self._td_change_subs.keys())
+
+    @property
+    def num_listeners(self):
+        """Returns the number of listeners registered in this watcher."""
+
+        return len(self._listeners)
+
+    def _on_td_change(self, exp_thing, item):
+        """Notifies a TD change to the listeners interested in its type."""
+
+        for listener in list(self._listeners):
+            if item.data.td_change_type in listener.td_change_types:
+                listener.on_change(exp_thing)
+
+    def _watch_exposed_thing(self, exp_thing):
+        """Notifies the given ExposedThing and listens for its TD changes."""
+
+        for listener in list(self._listeners):
+            listener.on_change(exp_thing)
+
+        if exp_thing in self._td_change_subs:
+            return
+
+        self._td_change_subs[exp_thing] = exp_thing.on_td_change().subscribe(
+            on_next=lambda item: self._on_td_change(exp_thing, item)
+        )
+
+    def _unwatch_exposed_thing(self, exp_thing):
+        """Stops listening for TD changes of the given ExposedThing and notifies its removal."""
+
+        td_change_sub = self._td_change_subs.pop(exp_thing, None)
+
+        if td_change_sub is not None:
+            td_change_sub.dispose()
+
+        for listener in list(self._listeners):
+            listener.on_remove(exp_thing)
+
+    def _on_exposed_thing_change(self, item):
+        """Watches or unwatches ExposedThings when they are added or removed."""
+
+        method, exp_thing = item
+
+        if method == TDChangeMethod.ADD:
+            self._watch_exposed_thing(exp_thing)
+        elif method == TDChangeMethod.REMOVE:
+            self._unwatch_exposed_thing(exp_thing)
+
+    def _start(self):
+        """Watches all the ExposedThings in the server and
+        starts listening for changes in the set of ExposedThings."""
+
+        self._server_sub = self._server.on_exposed_thing_change().subscribe(
+            on_next=self._on_exposed_thing_change
+        )
+
+        for exp_thing in list(self._server.exposed_things):
+            self._watch_exposed_thing(exp_thing)
+
+    def _stop(self):
+        """Stops listening for changes in the set of
+        ExposedThings and in their Thing Descriptions."""
+
+        if self._server_sub is not None:
+            self._server_sub.dispose()
+            self._server_sub = None
+
+        for td_change_sub in self._td_change_subs.values():
+            td_change_sub.dispose()
+
+        self._td_change_subs = {}
+
+    def add_listener(self, td_change_types, on_change, on_remove):
+        """Registers a new listener and notifies it of all the ExposedThings
+        in the server. Returns the listener to be able to remove it later."""
+
+        listener = ExposedThingsWatcherListener(
+            td_change_types=td_change_types, on_change=on_change, on_remove=on_remove
+        )
+
+        self._listeners.append(listener)
+
+        if self._server_sub is None:
+            self._start()
+            return listener
+
+        for exp_thing in self.exposed_things:
+            listener.on_change(exp_thing)
+
+        return listener
+
+    def remove_listener(self, listener):
+        """Removes a listener, notifying it of the removal of all the watched
+        ExposedThings. The watcher stops when there are no listeners left."""
+
+        if listener not in self._listeners:
+            return
+
+        self._listeners.remove(listener)
+
+        for exp_thing in self.exposed_things:
+            listener.on_remove(exp_thing)
+
+        if not self._listeners:
+            self._stop()
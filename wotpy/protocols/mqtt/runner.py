@@ -6,23 +6,89 @@ Base class for MQTT handlers.
 """
 
 import asyncio
+import collections
 import copy
 import logging
 import uuid
 from asyncio import Queue
+from functools import partial
 
 import aiomqtt
 
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
 from wotpy.protocols.mqtt.utils import MQTTBrokerURL, aiomqtt_read_loop
 
 
+class MQTTTopicRouter(object):
+    """Routes MQTT messages to the handlers that subscribed to a matching topic filter.
+    Filters are indexed by their literal prefix (the levels before the first wildcard),
+    so messages are only matched against the filters that share a prefix.
+    Shared subscription filters ($share/<group>/<filter>) are matched by <filter>."""
+
+    def __init__(self):
+        self._routes = {}
+
+    @classmethod
+    def _strip_shared_prefix(cls, topic_filter):
+        """Returns the topic filter without the shared subscription prefix."""
+
+        levels = topic_filter.split("/", 2)
+
+        if len(levels) == 3 and levels[0] == BaseMQTTHandler.SHARED_SUBSCRIPTION_PREFIX:
+            return levels[2]
+
+        return topic_filter
+
+    @classmethod
+    def _literal_prefix(cls, topic_filter):
+        """Returns the levels of a topic filter that precede the first wildcard."""
+
+        prefix = []
+
+        for level in topic_filter.split("/"):
+            if level in ("+", "#"):
+                break
+
+            prefix.append(level)
+
+        return tuple(prefix)
+
+    def add(self, topic_filter, handler):
+        """Adds a route from the given topic filter to the given handler."""
+
+        topic_filter = self._strip_shared_prefix(topic_filter)
+        prefix = self._literal_prefix(topic_filter)
+        self._routes.setdefault(prefix, []).append((topic_filter, handler))
+
+    def route(self, topic):
+        """Returns the list of handlers that should receive a message with the given topic."""
+
+        topic = topic if isinstance(topic, aiomqtt.Topic) else aiomqtt.Topic(topic)
+        levels = topic.value.split("/")
+        handlers = []
+
+        for idx in range(len(levels) + 1):
+            for topic_filter, handler in self._routes.get(tuple(levels[:idx]), []):
+                if handler not in handlers and topic.matches(topic_filter):
+                    handlers.append(handler)
+
+        return handlers
+
+
 class MQTTHandlerRunner(object):
     """Class that wraps an MQTT handler. It handles connections to the
-    MQTT broker, delivers messages, and runs the handler in a loop."""
+    MQTT broker, delivers messages, and runs the handler in a loop.
+
+    Backpressure policy: the broker read loop never waits for the handlers.
+    Incoming messages go to a bounded buffer, and messages that arrive while
+    the buffer is full are dropped (whatever their QoS) and logged as warnings.
+    Messages that must wait for a previous message with the same ordering key
+    are parked in a per-key queue without taking a concurrency slot; the
+    dispatcher stops reading the buffer when too many messages are parked."""
 
-    DEFAULT_TIMEOUT_LOOPS_SECS = 0.1
     DEFAULT_SLEEP_ERR_RECONN = 2.0
     DEFAULT_MSGS_BUF_SIZE = 500
+    DEFAULT_CONCURRENCY = 20
 
     DEFAULT_CLIENT_CONFIG = {"clean_session": False}
 
@@ -31,14 +97,13 @@ class MQTTHandlerRunner(object):
         broker_url,
         mqtt_handler,
         messages_buffer_size=DEFAULT_MSGS_BUF_SIZE,
-        timeout_loops=DEFAULT_TIMEOUT_LOOPS_SECS,
         sleep_error_reconnect=DEFAULT_SLEEP_ERR_RECONN,
         aiomqtt_config=None,
+        concurrency=DEFAULT_CONCURRENCY,
     ):
         self._broker_url = broker_url
-        self._mqtt_handler = mqtt_handler
+        self._mqtt_handlers = [mqtt_handler]
         self._messages_buffer = Queue(maxsize=messages_buffer_size)
-        self._timeout_loops_secs = timeout_loops
         self._sleep_error_reconnect = sleep_error_reconnect
         self._aiomqtt_config = aiomqtt_config
         self._client = None
@@ -48,15 +113,66 @@ class MQTTHandlerRunner(object):
         self._event_stop_request = asyncio.Event()
         self._logr = logging.getLogger(__name__)
         self._run_loop_task = None
+        self._concurrency = concurrency
+        self._messages_buffer_size = messages_buffer_size
+        self._sem_inflight = None
+        self._tasks_inflight = set()
+        self._ordering_queues = {}
+        self._sem_parked = None
+        self._num_parked = 0
+        self._num_dropped = 0
+        self._reset_dispatch_state()
+
+    @property
+    def name(self):
+        """Name used to identify this runner in the log messages."""
+
+        return self._mqtt_handlers[0].__class__.__name__
+
+    @property
+    def mqtt_handlers(self):
+        """List of MQTT handlers that are run by this runner."""
+
+        return list(self._mqtt_handlers)
+
+    @property
+    def concurrency(self):
+        """Maximum number of messages that are handled concurrently."""
+
+        return self._concurrency
+
+    @property
+    def num_inflight(self):
+        """Number of messages that are currently being handled."""
+
+        return len(self._tasks_inflight)
+
+    @property
+    def num_parked(self):
+        """Number of messages waiting for a previous message with the same ordering key."""
+
+        return self._num_parked
+
+    @property
+    def num_dropped(self):
+        """Number of messages that were dropped because the internal buffer was full."""
+
+        return self._num_dropped
+
+    def _reset_dispatch_state(self):
+        """Resets the concurrency slots and the ordering queues.
+        Tasks from a previous run are no longer tracked after a reset."""
+
+        self._sem_inflight = asyncio.Semaphore(self._concurrency)
+        self._sem_parked = asyncio.Semaphore(self._messages_buffer_size)
+        self._tasks_inflight = set()
+        self._ordering_queues = {}
+        self._num_parked = 0
 
     def _log(self, level, msg, **kwargs):
         """Helper function to wrap all log messages."""
 
-        self._logr.log(
-            level,
-            "{} - {}".format(self._mqtt_handler.__class__.__name__, msg),
-            **kwargs
-        )
+        self._logr.log(level, "{} - {}".format(self.name, msg), **kwargs)
 
     def _build_client_config(self):
         """Returns the config dict for a new MQTT client instance."""
@@ -77,6 +193,21 @@ class MQTTHandlerRunner(object):
 
         return config
 
+    def _build_topics(self):
+        """Returns the list of (topic, qos) tuples that the handlers want to subscribe to."""
+
+        topics = []
+
+        for handler in self._mqtt_handlers:
+            topics.extend(handler.topics if handler.topics else [])
+
+        return topics
+
+    def _route(self, message):
+        """Returns the list of handlers that should process the given message."""
+
+        return self._mqtt_handlers
+
     async def _connect(self):
         """MQTT connection helper function."""
 
@@ -85,15 +216,15 @@ class MQTTHandlerRunner(object):
         aiomqtt_client = aiomqtt.Client(**config)
         await aiomqtt_client.__aenter__()
 
-        if self._mqtt_handler.topics:
-            self._log(
-                logging.DEBUG, "Subscribing to: {}".format(self._mqtt_handler.topics)
-            )
+        topics = self._build_topics()
+
+        if topics:
+            self._log(logging.DEBUG, "Subscribing to: {}".format(topics))
 
             await asyncio.gather(
                 *[
                     aiomqtt_client.subscribe(topic=topic, qos=qos)
-                    for topic, qos in self._mqtt_handler.topics
+                    for topic, qos in topics
                 ]
             )
 
@@ -136,7 +267,8 @@ class MQTTHandlerRunner(object):
             await self._disconnect()
 
     async def _deliver_messages(self):
-        """Receives messages from the MQTT broker and puts them in the internal buffer."""
+        """Receives messages from the MQTT broker and puts them in the internal buffer.
+        Returns when a stop is requested."""
 
         async def anext_ex_handler(ex: Exception):
             self._log(
@@ -155,13 +287,20 @@ class MQTTHandlerRunner(object):
                 )
 
         async def message_handler(message: aiomqtt.Message):
+            # The read loop never waits for the handlers: messages
+            # that do not fit in the buffer are dropped.
+
             try:
-                await asyncio.wait_for(
-                    self._messages_buffer.put(message),
-                    timeout=self._timeout_loops_secs,
+                self._messages_buffer.put_nowait(message)
+            except asyncio.QueueFull:
+                self._num_dropped += 1
+
+                self._log(
+                    logging.WARNING,
+                    "Full messages buffer: dropped message on {} ({} dropped)".format(
+                        message.topic, self._num_dropped
+                    ),
                 )
-            except asyncio.TimeoutError:
-                self._log(logging.DEBUG, "Full messages buffer")
 
         await aiomqtt_read_loop(
             stop_event=self._event_stop_request,
@@ -170,35 +309,106 @@ class MQTTHandlerRunner(object):
             message_handler=message_handler,
         )
 
+    async def _handle_message(self, handler, message):
+        """Passes a message to an MQTT handler."""
+
+        try:
+            self._log(logging.DEBUG, "Handling message: {}".format(message.payload))
+            await handler.handle_message(message)
+        except Exception as ex:
+            self._log(
+                logging.WARNING, "MQTT handler error: {}".format(ex), exc_info=True
+            )
+
+    def _start_task(self, handler, message, ordering_key):
+        """Creates the task that handles a message.
+        The caller must hold a concurrency slot for the task."""
+
+        task = asyncio.create_task(self._handle_message(handler, message))
+        self._tasks_inflight.add(task)
+        task.add_done_callback(partial(self._on_handle_done, ordering_key))
+
+    def _on_handle_done(self, ordering_key, task):
+        """Callback for the completion of a message handling task.
+        The concurrency slot is handed over to the next parked message
+        with the same ordering key, or released if there is none."""
+
+        if task not in self._tasks_inflight:
+            return
+
+        self._tasks_inflight.discard(task)
+
+        parked = self._ordering_queues.get(ordering_key, None)
+
+        if parked:
+            handler, message = parked.popleft()
+            self._num_parked -= 1
+            self._sem_parked.release()
+            self._start_task(handler, message, ordering_key)
+            return
+
+        self._ordering_queues.pop(ordering_key, None)
+        self._sem_inflight.release()
+
+    async def _dispatch_message(self, handler, message):
+        """Handles a message as soon as there is a free concurrency slot, or parks it
+        if a previous message with the same ordering key has not been handled yet."""
+
+        try:
+            ordering_key = handler.ordering_key(message)
+        except Exception as ex:
+            self._log(logging.WARNING, "Ordering key error: {}".format(ex))
+            ordering_key = None
+
+        # The ordering state is only modified after the slot waits so that
+        # a cancellation of the dispatcher (e.g. on stop) leaves nothing behind.
+
+        if ordering_key is not None:
+            ordering_key = (handler, ordering_key)
+
+            if ordering_key in self._ordering_queues:
+                await self._sem_parked.acquire()
+
+                if ordering_key in self._ordering_queues:
+                    self._ordering_queues[ordering_key].append((handler, message))
+                    self._num_parked += 1
+                    return
+
+                self._sem_parked.release()
+
+        await self._sem_inflight.acquire()
+
+        if ordering_key is not None:
+            self._ordering_queues[ordering_key] = collections.deque()
+
+        self._start_task(handler, message, ordering_key)
+
     async def _handle_messages(self):
-        """Gets messages from the internal buffer and
-        passes them to the MQTT handler to be processed."""
+        """Gets messages from the internal buffer and passes them to the MQTT handlers
+        to be processed. Up to a maximum number of messages are handled concurrently,
+        while messages that share an ordering key are handled in arrival order.
+        Runs until cancelled."""
 
-        while not self._event_stop_request.is_set():
-            try:
-                message = await asyncio.wait_for(
-                    self._messages_buffer.get(), timeout=self._timeout_loops_secs
-                )
-                self._log(logging.DEBUG, "Handling message: {}".format(message.payload))
-                await self._mqtt_handler.handle_message(message)
-            except asyncio.TimeoutError:
-                pass
-            except Exception as ex:
-                self._log(
-                    logging.WARNING, "MQTT handler error: {}".format(ex), exc_info=True
-                )
+        while True:
+            message = await self._messages_buffer.get()
+            handlers = self._route(message)
 
-    async def _publish_queued_messages(self):
-        """Gets the pending messages from the handler queue and publishes them on the broker."""
+            if not handlers:
+                self._log(logging.DEBUG, "Unrouted message: {}".format(message.topic))
+
+            for handler in handlers:
+                await self._dispatch_message(handler, message)
+
+    async def _publish_queued_messages(self, handler):
+        """Gets the pending messages from the handler queue and
+        publishes them on the broker. Runs until cancelled."""
 
         message = None
 
-        while not self._event_stop_request.is_set():
+        while True:
             try:
                 if message is None:
-                    message = await asyncio.wait_for(
-                        self._mqtt_handler.queue.get(), timeout=self._timeout_loops_secs
-                    )
+                    message = await handler.queue.get()
                 else:
                     self._log(logging.WARNING, "Republish attempt: {}".format(message))
 
@@ -210,8 +420,8 @@ class MQTTHandlerRunner(object):
                 )
 
                 message = None
-            except asyncio.TimeoutError:
-                pass
+            except asyncio.CancelledError:
+                raise
             except Exception as ex:
                 self._log(
                     logging.WARNING,
@@ -223,23 +433,32 @@ class MQTTHandlerRunner(object):
     async def _run_loop(self):
         """Adds the callback that will start the infinite loop
         to listen and handle the messages published in the topics
-        that are of interest to this MQTT client."""
+        that are of interest to this MQTT client.
+        The loops wait on their queues and are cancelled when a stop is requested."""
 
-        try:
-            async with self._lock_run:
-                self._log(logging.DEBUG, "Entering MQTT runner loop")
+        async with self._lock_run:
+            self._log(logging.DEBUG, "Entering MQTT runner loop")
 
-                await asyncio.gather(
-                    self._deliver_messages(),
-                    self._handle_messages(),
-                    self._publish_queued_messages(),
-                )
-        except asyncio.TimeoutError:
-            self._log(
-                logging.WARNING,
-                "Cannot start MQTT handler loop while another is already running",
+            tasks = [asyncio.create_task(self._handle_messages())]
+
+            tasks.extend(
+                [
+                    asyncio.create_task(self._publish_queued_messages(handler))
+                    for handler in self._mqtt_handlers
+                ]
             )
 
+            try:
+                await self._deliver_messages()
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+                while self._tasks_inflight:
+                    await asyncio.wait(list(self._tasks_inflight))
+
     async def start(self):
         """Starts listening for published messages."""
 
@@ -249,7 +468,7 @@ class MQTTHandlerRunner(object):
             self._event_stop_request.clear()
 
         await self.connect(force_reconnect=True)
-        await self._mqtt_handler.init()
+        await asyncio.gather(*[handler.init() for handler in self._mqtt_handlers])
         self._run_loop_task = asyncio.create_task(self._run_loop())
 
     async def stop(self, run_loop_timeout=60.0):
@@ -260,11 +479,44 @@ class MQTTHandlerRunner(object):
         async with self._lock_run:
             pass
 
-        await self._mqtt_handler.teardown()
+        await asyncio.gather(*[handler.teardown() for handler in self._mqtt_handlers])
 
         try:
             await asyncio.wait_for(self._run_loop_task, timeout=run_loop_timeout)
         except asyncio.TimeoutError:
             self._log(logging.WARNING, "MQTT handler loop did not finish in time")
 
+        self._reset_dispatch_state()
+
         await self.disconnect()
+
+
+class MQTTMultiplexedRunner(MQTTHandlerRunner):
+    """Runner that shares a single MQTT broker connection between multiple handlers.
+    Incoming messages are dispatched to the handlers by a topic router."""
+
+    def __init__(self, broker_url, mqtt_handlers, **kwargs):
+        super(MQTTMultiplexedRunner, self).__init__(
+            broker_url=broker_url, mqtt_handler=None, **kwargs
+        )
+
+        self._mqtt_handlers = list(mqtt_handlers)
+        self._router = MQTTTopicRouter()
+
+        for handler in self._mqtt_handlers:
+            for topic, _qos in handler.topics if handler.topics else []:
+                self._router.add(topic, handler)
+
+    @property
+    def name(self):
+        """Name used to identify this runner in the log messages."""
+
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join(handler.__class__.__name__ for handler in self._mqtt_handlers),
+        )
+
+    def _route(self, message):
+        """Returns the list of handlers that should process the given message."""
+
+        return self._router.route(message.topic)
@@ -11,18 +11,22 @@ from slugify import slugify
 
 from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import InteractionVerbs, Protocols
+from wotpy.protocols.mqtt.enums import MQTTSubprotocols
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.event import EventMQTTHandler
 from wotpy.protocols.mqtt.handlers.ping import PingMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
-from wotpy.protocols.mqtt.runner import MQTTHandlerRunner
+from wotpy.protocols.mqtt.handlers.watcher import ExposedThingsWatcher
+from wotpy.protocols.mqtt.runner import MQTTHandlerRunner, MQTTMultiplexedRunner
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.form import Form
 
 
 class MQTTServer(BaseProtocolServer):
-    """MQTT binding server implementation."""
+    """MQTT binding server implementation.
+    property_callback_ms and event_callback_ms enable a periodic
+    resync of the Property and Event subscriptions (None disables it)."""
 
     DEFAULT_SERVIENT_ID = "wotpy"
 
@@ -32,26 +36,73 @@ class MQTTServer(BaseProtocolServer):
         property_callback_ms=None,
         event_callback_ms=None,
         servient_id=None,
+        concurrency=None,
+        multiplexed=False,
+        property_min_interval_ms=None,
+        property_retain=False,
+        shared_group=None,
+        property_digest_ms=None,
+        property_queue_size=None,
     ):
         super(MQTTServer, self).__init__(port=None)
         self._broker_url = broker_url
         self._server_lock = asyncio.Lock()
         self._servient_id = servient_id
+        self._property_digest_ms = property_digest_ms
+        self._exposed_things_watcher = ExposedThingsWatcher(server=self)
 
-        def build_runner(handler):
-            return MQTTHandlerRunner(broker_url=self._broker_url, mqtt_handler=handler)
+        concurrency = (
+            MQTTHandlerRunner.DEFAULT_CONCURRENCY
+            if concurrency is None
+            else concurrency
+        )
 
-        self._handler_runners = [
-            build_runner(PingMQTTHandler(mqtt_server=self)),
-            build_runner(
-                PropertyMQTTHandler(mqtt_server=self, callback_ms=property_callback_ms)
-            ),
-            build_runner(
-                EventMQTTHandler(mqtt_server=self, callback_ms=event_callback_ms)
+        handlers = [
+            PingMQTTHandler(mqtt_server=self),
+            PropertyMQTTHandler(
+                mqtt_server=self,
+                callback_ms=property_callback_ms,
+                min_interval_ms=property_min_interval_ms,
+                retain=property_retain,
+                shared_group=shared_group,
+                digest_ms=property_digest_ms,
+                queue_size=property_queue_size,
             ),
-            build_runner(ActionMQTTHandler(mqtt_server=self)),
+            EventMQTTHandler(mqtt_server=self, callback_ms=event_callback_ms),
+            ActionMQTTHandler(mqtt_server=self, shared_group=shared_group),
         ]
 
+        if multiplexed:
+            self._handler_runners = [
+                MQTTMultiplexedRunner(
+                    broker_url=self._broker_url,
+                    mqtt_handlers=handlers,
+                    concurrency=concurrency,
+                )
+            ]
+        else:
+            self._handler_runners = [
+                MQTTHandlerRunner(
+                    broker_url=self._broker_url,
+                    mqtt_handler=handler,
+                    concurrency=concurrency,
+                )
+                for handler in handlers
+            ]
+
+    @property
+    def multiplexed(self):
+        """True if all the MQTT handlers share a single broker connection."""
+
+        return len(self._handler_runners) == 1
+
+    @property
+    def exposed_things_watcher(self):
+        """Watcher of the ExposedThings of this server and their TD changes.
+        It is shared by all the MQTT handlers of the server."""
+
+        return self._exposed_things_watcher
+
     @property
     def servient_id(self):
         """Servient ID that is used to avoid topic collisions
@@ -111,7 +162,23 @@ class MQTTServer(BaseProtocolServer):
             op=InteractionVerbs.OBSERVE_PROPERTY,
         )
 
-        return [form_read, form_write, form_observe]
+        if not self._property_digest_ms:
+            return [form_read, form_write, form_observe]
+
+        href_digest = "{}/{}/property/digest".format(
+            self._broker_url.rstrip("/"), self.servient_id
+        )
+
+        form_observe_digest = Form(
+            interaction=proprty,
+            protocol=self.protocol,
+            href=href_digest,
+            content_type=MediaTypes.JSON,
+            op=InteractionVerbs.OBSERVE_PROPERTY,
+            subprotocol=MQTTSubprotocols.DIGEST,
+        )
+
+        return [form_read, form_write, form_observe_digest]
 
     def _build_forms_action(self, action):
         """Builds and returns the MQTT Form instances for the given Action interaction."""
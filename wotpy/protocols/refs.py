@@ -1,3 +1,5 @@
+import asyncio
+import collections
 import logging
 
 
@@ -39,3 +41,128 @@ class ConnRefCounter(object):
         """Returns True if the connection has any references pointing to it."""
 
         return conn_id in self._counter and len(self._counter[conn_id])
+
+
+class IdleConnPool(object):
+    """Keeps the connections that do not have any references pointing to them
+    open for a limited time (linger) so that they can be reused by later requests.
+    Lingering is disabled unless a positive linger time is given.
+    Also keeps the pool hit and miss counters."""
+
+    def __init__(self, linger_secs=None, max_conns=None):
+        self._linger_secs = linger_secs
+        self._max_conns = max_conns
+        self._idle = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def linger_secs(self):
+        """Time (seconds) that idle connections are kept open."""
+
+        return self._linger_secs
+
+    @property
+    def max_conns(self):
+        """Maximum number of open connections (None for unlimited)."""
+
+        return self._max_conns
+
+    @property
+    def stats(self):
+        """Dict with the pool hit, miss and eviction counters and the number of idle connections."""
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "idle": len(self._idle)
+        }
+
+    def record_hit(self):
+        """Increases the counter of requests that reused an open connection."""
+
+        self._hits += 1
+
+    def record_miss(self):
+        """Increases the counter of requests that had to open a new connection."""
+
+        self._misses += 1
+
+    def is_idle(self, conn_id):
+        """Returns True if the connection is idle in the pool."""
+
+        return conn_id in self._idle
+
+    def is_full(self, num_conns):
+        """Returns True if the given number of open connections has reached the limit."""
+
+        return self._max_conns is not None and num_conns >= self._max_conns
+
+    def can_keep(self, num_conns):
+        """Returns True if an idle connection may be kept open
+        while the given number of connections are open."""
+
+        return self._max_conns is None or num_conns <= self._max_conns
+
+    def acquire(self, conn_id):
+        """Takes a connection out of the idle set to be reused."""
+
+        self.discard(conn_id)
+
+    def discard(self, conn_id):
+        """Removes a connection from the idle set (if present) and cancels its close timer."""
+
+        handle = self._idle.pop(conn_id, None)
+
+        if handle is not None:
+            handle.cancel()
+
+    def pop_all(self):
+        """Takes all the connections out of the idle set, cancelling their
+        close timers, and returns their IDs so that they can be closed."""
+
+        conn_ids = list(self._idle.keys())
+
+        for conn_id in conn_ids:
+            self.discard(conn_id)
+
+        return conn_ids
+
+    def release(self, conn_id, close_cb):
+        """Adds a connection to the idle set. The close_cb callback is called
+        if the connection has not been acquired again when the linger time expires.
+        Returns False if the connection should be closed right away instead."""
+
+        if not self._linger_secs or self._linger_secs <= 0:
+            return False
+
+        self.acquire(conn_id)
+
+        def expire():
+            if self._idle.get(conn_id, None) is not handle:
+                return
+
+            self._logr.debug("Idle connection expired: {}".format(conn_id))
+            self._idle.pop(conn_id)
+            close_cb()
+
+        handle = asyncio.get_event_loop().call_later(self._linger_secs, expire)
+        self._idle[conn_id] = handle
+
+        return True
+
+    def pop_oldest(self):
+        """Takes the least recently released connection out of
+        the idle set to be evicted. Returns None if there are no idle connections."""
+
+        if not len(self._idle):
+            return None
+
+        conn_id, handle = self._idle.popitem(last=False)
+        handle.cancel()
+        self._evictions += 1
+
+        return conn_id
@@ -7,6 +7,9 @@ Class that represents the abstract server interface.
 
 from abc import ABCMeta, abstractmethod
 
+from rx.subjects import Subject
+
+from wotpy.wot.enums import TDChangeMethod
 from wotpy.wot.exposed.thing_set import ExposedThingSet
 
 
@@ -20,6 +23,7 @@ class BaseProtocolServer(object):
         self._port = port
         self._codecs = []
         self._exposed_thing_set = ExposedThingSet()
+        self._exposed_thing_changes = Subject()
 
     @property
     @abstractmethod
@@ -60,15 +64,24 @@ class BaseProtocolServer(object):
 
         self._codecs.append(codec)
 
+    def on_exposed_thing_change(self):
+        """Returns an Observable that emits (method, exposed_thing) tuples when an ExposedThing
+        is added to or removed from this server. The method is an item of TDChangeMethod."""
+
+        return self._exposed_thing_changes.as_observable()
+
     def add_exposed_thing(self, exposed_thing):
         """Adds the given ExposedThing to this server."""
 
         self._exposed_thing_set.add(exposed_thing)
+        self._exposed_thing_changes.on_next((TDChangeMethod.ADD, exposed_thing))
 
     def remove_exposed_thing(self, thing_id):
         """Removes the given ExposedThing from this server."""
 
+        exposed_thing = self._exposed_thing_set.find_by_thing_id(thing_id)
         self._exposed_thing_set.remove(thing_id)
+        self._exposed_thing_changes.on_next((TDChangeMethod.REMOVE, exposed_thing))
 
     def get_exposed_thing(self, name):
         """Finds and returns an ExposedThing contained in this server by name.
@@ -14,8 +14,12 @@ from rx import Observable
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import Protocols
-from wotpy.protocols.exceptions import ClientRequestTimeout, FormNotFoundException
-from wotpy.protocols.refs import ConnRefCounter
+from wotpy.protocols.exceptions import (
+    ClientRequestTimeout,
+    FormNotFoundException,
+    ProtocolClientException,
+)
+from wotpy.protocols.refs import ConnRefCounter, IdleConnPool
 from wotpy.protocols.utils import is_scheme_form, pick_form
 from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketSchemes
 from wotpy.protocols.ws.messages import (
@@ -24,6 +28,7 @@ from wotpy.protocols.ws.messages import (
     WebsocketMessageException,
     WebsocketMessageRequest,
     WebsocketMessageResponse,
+    parse_ws_message,
 )
 from wotpy.wot.events import (
     EmittedEvent,
@@ -37,27 +42,70 @@ class WebsocketClient(BaseProtocolClient):
 
     SLEEP_AFTER_ERR_SECS = 1.0
     RECEIVE_LOOP_TERMINATE_SLEEP_SECS = 0.1
-
-    def __init__(self, receive_timeout_secs=1.0, ping_interval=2000):
+    DEFAULT_IDLE_TIMEOUT_SECS = 0
+
+    def __init__(
+        self,
+        receive_timeout_secs=1.0,
+        ping_interval=2000,
+        idle_timeout_secs=DEFAULT_IDLE_TIMEOUT_SECS,
+        max_conns=None,
+    ):
         self._receive_timeout_secs = receive_timeout_secs
         self._ping_interval = ping_interval
         self._conns = {}
+        self._closed_conns = set()
         self._ref_counter = ConnRefCounter()
+        self._pool = IdleConnPool(linger_secs=idle_timeout_secs, max_conns=max_conns)
         self._lock_conn = asyncio.Lock()
-        self._msg_conditions = {}
-        self._messages = {}
+        self._pending_requests = {}
         self._receive_stop_events = {}
+        self._subscriptions = {}
+        self._subscription_requests = {}
         self._logr = logging.getLogger(__name__)
 
+    @property
+    def pool_stats(self):
+        """Dict with the hit, miss and eviction counters of the connection pool."""
+
+        return self._pool.stats
+
+    async def shutdown(self):
+        """Closes the idle connections kept open by the pool.
+        Connections still referenced by pending requests are not affected."""
+
+        async with self._lock_conn:
+            for ws_url in self._pool.pop_all():
+                if not self._ref_counter.has_any(ws_url):
+                    await self._close_conn(ws_url)
+
     async def _init_conn(self, ws_url, ref_id):
-        """Initializes and connects the WebSockets connection."""
+        """Initializes and connects the WebSockets connection.
+        Open connections (including idle ones kept by the pool) are reused
+        unless they have been closed, in which case they are replaced."""
 
         async with self._lock_conn:
             self._ref_counter.increase(ws_url, ref_id)
+            self._pool.acquire(ws_url)
 
-            if ws_url in self._conns:
+            if ws_url in self._conns and ws_url not in self._closed_conns:
+                self._pool.record_hit()
                 return
 
+            self._pool.record_miss()
+
+            if ws_url in self._conns:
+                self._logr.debug("Replacing closed connection <{}>".format(ws_url))
+                await self._close_conn(ws_url)
+
+            while self._pool.is_full(len(self._conns)):
+                idle_url = self._pool.pop_oldest()
+
+                if idle_url is None:
+                    break
+
+                await self._close_conn(idle_url)
+
             self._logr.debug("Connecting to <{}>".format(ws_url))
 
             self._conns[ws_url] = await tornado.websocket.websocket_connect(
@@ -71,7 +119,9 @@ class WebsocketClient(BaseProtocolClient):
             asyncio.create_task(_start_receive_loop())
 
     async def _stop_conn(self, ws_url, ref_id):
-        """Disconnects the WebSockets connection."""
+        """Releases a reference to the WebSockets connection.
+        Connections without references are kept idle in the pool
+        until the linger time expires, and closed afterwards."""
 
         async with self._lock_conn:
             self._ref_counter.decrease(ws_url, ref_id)
@@ -79,79 +129,189 @@ class WebsocketClient(BaseProtocolClient):
             if self._ref_counter.has_any(ws_url):
                 return
 
-            try:
-                if self._conns.get(ws_url, None) is not None:
-                    self._logr.debug("Disconnecting WS client: {}".format(ws_url))
-                    self._conns[ws_url].close()
-            except Exception as ex:
-                self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
+            is_pooled = (
+                ws_url in self._conns
+                and ws_url not in self._closed_conns
+                and self._pool.can_keep(len(self._conns))
+                and self._pool.release(
+                    ws_url, lambda: asyncio.ensure_future(self._close_idle_conn(ws_url))
+                )
+            )
+
+            if not is_pooled:
+                await self._close_conn(ws_url)
+
+    async def _close_idle_conn(self, ws_url):
+        """Closes a pooled connection once its linger time has expired."""
+
+        async with self._lock_conn:
+            if self._ref_counter.has_any(ws_url) or self._pool.is_idle(ws_url):
+                return
+
+            await self._close_conn(ws_url)
+
+    async def _close_conn(self, ws_url):
+        """Disconnects the WebSockets connection and cleans all related resources."""
+
+        self._pool.discard(ws_url)
+
+        try:
+            if self._conns.get(ws_url, None) is not None:
+                self._logr.debug("Disconnecting WS client: {}".format(ws_url))
+                self._conns[ws_url].close()
+        except Exception as ex:
+            self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
 
-            if ws_url in self._receive_stop_events:
-                self._logr.debug("Stopping message read loop: {}".format(ws_url))
+        if ws_url in self._receive_stop_events:
+            self._logr.debug("Stopping message read loop: {}".format(ws_url))
 
-                self._receive_stop_events[ws_url].set()
+            self._receive_stop_events[ws_url].set()
 
-                while self._receive_stop_events[ws_url].is_set():
-                    await asyncio.sleep(self.RECEIVE_LOOP_TERMINATE_SLEEP_SECS)
+            while self._receive_stop_events[ws_url].is_set():
+                await asyncio.sleep(self.RECEIVE_LOOP_TERMINATE_SLEEP_SECS)
 
-                self._receive_stop_events.pop(ws_url)
+            self._receive_stop_events.pop(ws_url)
 
-            self._conns.pop(ws_url, None)
-            self._messages.pop(ws_url, None)
-            self._msg_conditions.pop(ws_url, None)
+        self._conns.pop(ws_url, None)
+        self._closed_conns.discard(ws_url)
+        self._fail_pending_requests(ws_url, Exception("WS connection closed"))
+        self._subscriptions.pop(ws_url, None)
+        self._subscription_requests.pop(ws_url, None)
+
+    @property
+    def num_pending_requests(self):
+        """Number of requests that are waiting for a response (in-flight gauge)."""
+
+        return sum(len(pending) for pending in self._pending_requests.values())
 
     async def _send_message(self, ws_url, msg_req):
-        """Sends a WebSockets message and returns the condition
-        that will be notified when the response arrives."""
+        """Sends a WebSockets message and returns the Future
+        that will be resolved with the response message.
+        The Future is registered before sending to avoid missing fast responses.
+        Raises ProtocolClientException if there is no connection to the URL."""
 
         if ws_url not in self._conns:
-            self._logr.warning("<{}> is not an active connection".format(ws_url))
+            raise ProtocolClientException(
+                "<{}> is not an active connection".format(ws_url)
+            )
+
+        pending = self._pending_requests.setdefault(ws_url, {})
+
+        if msg_req.id in pending:
+            self._logr.warning("Pending request already exists")
+
+        future_res = asyncio.get_event_loop().create_future()
+        pending[msg_req.id] = future_res
+
+        try:
+            await self._conns[ws_url].write_message(msg_req.to_json())
+        except Exception:
+            pending.pop(msg_req.id, None)
+            raise
+
+        return future_res
+
+    def _fail_pending_requests(self, ws_url, ex):
+        """Removes all pending requests on a WebSockets connection
+        and resolves their Futures with the given error."""
+
+        for future_res in self._pending_requests.pop(ws_url, {}).values():
+            if not future_res.done():
+                future_res.set_exception(ex)
+
+    def _close_subscriptions(self, ws_url, ex):
+        """Passes the given error to all the subscriptions on a WebSockets connection."""
+
+        subscriptions = self._subscriptions.pop(ws_url, {})
+
+        for observer, _on_next in subscriptions.values():
+            observer.on_error(ex)
+
+    def _route_emitted_item(self, ws_url, msg):
+        """Passes an emitted item to the observer of the subscription it belongs to."""
+
+        subscription = self._subscriptions.get(ws_url, {}).get(msg.subscription_id)
+
+        if subscription is None:
+            self._logr.debug("Unknown subscription: {}".format(msg.subscription_id))
+            return
+
+        observer, on_next = subscription
+
+        try:
+            on_next(observer, msg)
+        except Exception as ex:
+            observer.on_error(ex)
+
+    def _route_subscription_error(self, ws_url, msg):
+        """Passes a subscription error to the observer of the related subscription."""
+
+        sub_id = isinstance(msg.data, dict) and msg.data.get("subscription")
+        subscription = self._subscriptions.get(ws_url, {}).pop(sub_id, None)
+
+        if subscription is not None:
+            observer, _on_next = subscription
+            observer.on_error(Exception(msg.message))
+
+    def _resolve_pending_request(self, ws_url, msg_res):
+        """Resolves the Future of the pending request that matches the response ID."""
+
+        future_res = self._pending_requests.get(ws_url, {}).get(msg_res.id, None)
+
+        if future_res is None or future_res.done():
+            self._logr.debug("Unexpected response: {}".format(msg_res.id))
             return
 
-        if ws_url not in self._msg_conditions:
-            self._msg_conditions[ws_url] = {}
+        future_res.set_result(msg_res)
 
-        if msg_req.id in self._msg_conditions[ws_url]:
-            self._logr.warning("Message condition already exists")
+    def _register_subscription(self, ws_url, msg_res):
+        """Adds the subscription created by a request to the routing table.
+        Called from the receive loop so that no emitted items are lost."""
 
-        await self._conns[ws_url].write_message(msg_req.to_json())
+        subscription = self._subscription_requests.get(ws_url, {}).pop(msg_res.id, None)
 
-        msg_condition = asyncio.Condition()
-        self._msg_conditions[ws_url][msg_req.id] = msg_condition
+        if subscription is None or not isinstance(msg_res, WebsocketMessageResponse):
+            return
 
-        return msg_condition
+        self._subscriptions.setdefault(ws_url, {})[msg_res.result] = subscription
 
     async def _receive_loop(self, ws_url):
-        """Starts the WebSockets message receiving loop."""
+        """Starts the WebSockets message receiving loop.
+        Responses are matched to the requests by message ID and
+        emitted items are routed to the subscriptions by subscription ID."""
 
         if ws_url not in self._conns:
             self._logr.warning("<{}> is not an active connection".format(ws_url))
             return
 
-        if ws_url not in self._messages:
-            self._messages[ws_url] = {}
-
         while not self._receive_stop_events[ws_url].is_set():
             try:
                 raw_res = await self._conns[ws_url].read_message()
 
                 self._logr.debug("Read message: {}".format(raw_res))
 
+                if raw_res is None and self._receive_stop_events[ws_url].is_set():
+                    break
+
                 if raw_res is None:
                     self._logr.debug("Cannot read message: Closed WS connection")
+                    self._closed_conns.add(ws_url)
+                    self._close_subscriptions(ws_url, Exception("WS connection closed"))
+                    self._fail_pending_requests(
+                        ws_url, Exception("WS connection closed")
+                    )
                     await asyncio.sleep(self.SLEEP_AFTER_ERR_SECS)
                     continue
 
-                msg_res = self._parse_msg_response(raw_res)
-
-                if msg_res:
-                    self._messages[ws_url][msg_res.id] = msg_res
-                    conditions = self._msg_conditions.get(ws_url, None)
+                msg = self._parse_msg(raw_res)
 
-                    if conditions and msg_res.id in conditions:
-                        async with conditions[msg_res.id]:
-                            self._logr.debug("Notifying: {}".format(msg_res.id))
-                            conditions[msg_res.id].notify_all()
+                if isinstance(msg, WebsocketMessageEmittedItem):
+                    self._route_emitted_item(ws_url, msg)
+                elif isinstance(msg, WebsocketMessageError) and msg.id is None:
+                    self._route_subscription_error(ws_url, msg)
+                elif msg is not None:
+                    self._register_subscription(ws_url, msg)
+                    self._resolve_pending_request(ws_url, msg)
             except Exception as ex:
                 self._logr.warning("Error in read loop: {}".format(ex), exc_info=True)
                 await asyncio.sleep(self.SLEEP_AFTER_ERR_SECS)
@@ -159,45 +319,24 @@ class WebsocketClient(BaseProtocolClient):
         self._receive_stop_events[ws_url].clear()
 
     @classmethod
-    def _parse_msg_response(cls, raw_msg):
-        """Returns a parsed WS Response message instance if
-        the raw message format is valid and has the given ID.
-        Raises Exception if the WS message is an error."""
-
-        try:
-            return WebsocketMessageResponse.from_raw(raw_msg)
-        except WebsocketMessageException:
-            pass
-
-        try:
-            return WebsocketMessageError.from_raw(raw_msg)
-        except WebsocketMessageException:
-            pass
-
-        return None
-
-    @classmethod
-    def _parse_emitted_item(cls, raw_msg, sub_id):
-        """Returns a parsed WS Emitted Item message instance if
-        the raw message format is valid and has the given ID.
-        Raises Exception if the WS message is an error."""
+    def _parse_msg(cls, raw_msg):
+        """Returns a parsed WS Response, Error or Emitted Item message
+        instance if the raw message format is valid, or None otherwise."""
 
         try:
-            msg = WebsocketMessageEmittedItem.from_raw(raw_msg)
-
-            if msg.subscription_id == sub_id:
-                return msg
-        except WebsocketMessageException:
-            pass
-
-        try:
-            err = WebsocketMessageError.from_raw(raw_msg)
-            err_sub_id = err.data and err.data.get("subscription")
-
-            if err_sub_id == sub_id:
-                raise Exception(err.message)
+            msg = parse_ws_message(raw_msg)
         except WebsocketMessageException:
-            pass
+            return None
+
+        if isinstance(
+            msg,
+            (
+                WebsocketMessageResponse,
+                WebsocketMessageError,
+                WebsocketMessageEmittedItem,
+            ),
+        ):
+            return msg
 
         return None
 
@@ -208,73 +347,78 @@ class WebsocketClient(BaseProtocolClient):
 
         return Protocols.WEBSOCKETS
 
+    async def _dispose_subscription(self, ws_url, sub_id):
+        """Removes a subscription from the routing table and
+        disposes it on the server over the shared connection."""
+
+        self._subscriptions.get(ws_url, {}).pop(sub_id, None)
+
+        msg_req = WebsocketMessageRequest(
+            method=WebsocketMethods.DISPOSE,
+            params={"subscription": sub_id},
+            msg_id=uuid.uuid4().hex,
+        )
+
+        await self._request(ws_url, msg_req, timeout=self._receive_timeout_secs)
+
     def _build_subscribe(self, ws_url, msg_req, on_next):
         """Builds the subscribe function that is passed
-        as an argument on the creation of an Observable."""
+        as an argument on the creation of an Observable.
+        All subscriptions to the same URL share the same WebSockets connection."""
 
         def subscribe(observer):
-            """Connect to the WS server and start passing the received events to the Observer."""
+            """Sends the subscription request over the shared connection and
+            starts passing the received events to the Observer."""
 
-            future_sub_id = asyncio.Future()
-            future_ws_conn = asyncio.Future()
+            ref_id = uuid.uuid4().hex
+            state = {"sub_id": None, "disposed": False}
 
-            def on_error(ex):
-                observer.on_error(ex)
+            # Each subscription needs its own message ID on the shared connection
 
-            def on_next_event(raw_msg):
-                sub_id = future_sub_id.result()
+            msg_sub = WebsocketMessageRequest(
+                method=msg_req.method,
+                params=msg_req.params,
+                msg_id=uuid.uuid4().hex,
+                validate=False,
+            )
 
-                try:
-                    msg_item = self._parse_emitted_item(raw_msg, sub_id)
-                except Exception as ex:
-                    return on_error(ex)
+            async def start():
+                await self._init_conn(ws_url, ref_id)
 
-                if msg_item is None:
-                    return
+                self._subscription_requests.setdefault(ws_url, {})[msg_sub.id] = (
+                    observer,
+                    on_next,
+                )
 
                 try:
-                    on_next(observer, msg_item)
-                except Exception as ex:
-                    return on_error(ex)
-
-            def parse_subscription_id(raw_msg):
-                msg_res = self._parse_msg_response(raw_msg)
+                    state["sub_id"] = await self._request(ws_url, msg_sub)
+                finally:
+                    self._subscription_requests.get(ws_url, {}).pop(msg_sub.id, None)
 
-                if isinstance(msg_res, WebsocketMessageError):
-                    return on_error(Exception(msg_res.message))
+            def on_started(ft):
+                if not ft.cancelled() and ft.exception() is not None:
+                    observer.on_error(ft.exception())
 
-                if msg_res is None:
-                    return
-
-                sub_id = msg_res.result
-                future_sub_id.set_result(sub_id)
+            task_start = asyncio.ensure_future(start())
+            task_start.add_done_callback(on_started)
 
-            def on_msg(raw_msg):
-                if raw_msg is None:
-                    return on_error(Exception("WS connection closed"))
+            async def stop():
+                await asyncio.wait([task_start])
 
-                if future_sub_id.done():
-                    on_next_event(raw_msg)
-                else:
-                    parse_subscription_id(raw_msg)
-
-            def on_conn(ft):
                 try:
-                    ws_conn = ft.result()
+                    if state["sub_id"] is not None:
+                        await self._dispose_subscription(ws_url, state["sub_id"])
                 except Exception as ex:
-                    return on_error(ex)
-
-                future_ws_conn.set_result(ws_conn)
-                ws_conn.write_message(msg_req.to_json())
-
-            tornado.websocket.websocket_connect(
-                ws_url, callback=on_conn, on_message_callback=on_msg
-            )
+                    self._logr.debug("Error disposing: {}".format(ex))
+                finally:
+                    await self._stop_conn(ws_url, ref_id)
 
             def unsubscribe():
-                if future_ws_conn.done():
-                    ws_conn = future_ws_conn.result()
-                    ws_conn.close()
+                if state["disposed"]:
+                    return
+
+                state["disposed"] = True
+                asyncio.ensure_future(stop())
 
             return unsubscribe
 
@@ -298,22 +442,25 @@ class WebsocketClient(BaseProtocolClient):
 
         return len(forms_wss) or len(forms_ws)
 
-    def _return_message(self, ws_url, msg_id):
-        """Raises the error or return Exception from the message
-        in the internal collection matching the given ID."""
+    async def _request(self, ws_url, msg_req, timeout=None):
+        """Sends a request over the WebSockets connection and waits for the response.
+        Returns the response result or raises the response error.
+        The pending request is removed on completion, error or timeout."""
 
-        if ws_url not in self._messages:
-            raise Exception("Unknown WS connection")
+        try:
+            future_res = await self._send_message(ws_url, msg_req)
 
-        if msg_id not in self._messages[ws_url]:
-            raise Exception("Unknown message ID")
+            try:
+                msg_res = await asyncio.wait_for(future_res, timeout=timeout)
+            except asyncio.TimeoutError as ex:
+                raise ClientRequestTimeout from ex
+        finally:
+            self._pending_requests.get(ws_url, {}).pop(msg_req.id, None)
 
-        msg = self._messages[ws_url][msg_id]
+        if isinstance(msg_res, WebsocketMessageError):
+            raise Exception(msg_res.message)
 
-        if isinstance(msg, WebsocketMessageError):
-            raise Exception(msg.message)
-        else:
-            return msg.result
+        return msg_res.result
 
     async def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
@@ -339,15 +486,7 @@ class WebsocketClient(BaseProtocolClient):
                 msg_id=uuid.uuid4().hex,
             )
 
-            condition = await self._send_message(ws_url, msg_req)
-
-            async with condition:
-                try:
-                    await asyncio.wait_for(condition.wait(), timeout=timeout)
-                except asyncio.TimeoutError as ex:
-                    raise ClientRequestTimeout from ex
-
-            return self._return_message(ws_url, msg_req.id)
+            return await self._request(ws_url, msg_req, timeout=timeout)
         finally:
             await self._stop_conn(ws_url, ref_id)
 
@@ -375,15 +514,7 @@ class WebsocketClient(BaseProtocolClient):
                 msg_id=uuid.uuid4().hex,
             )
 
-            condition = await self._send_message(ws_url, msg_req)
-
-            async with condition:
-                try:
-                    await asyncio.wait_for(condition.wait(), timeout=timeout)
-                except asyncio.TimeoutError as ex:
-                    raise ClientRequestTimeout from ex
-
-            return self._return_message(ws_url, msg_req.id)
+            return await self._request(ws_url, msg_req, timeout=timeout)
         finally:
             await self._stop_conn(ws_url, ref_id)
 
@@ -411,15 +542,7 @@ class WebsocketClient(BaseProtocolClient):
                 msg_id=uuid.uuid4().hex,
             )
 
-            condition = await self._send_message(ws_url, msg_req)
-
-            async with condition:
-                try:
-                    await asyncio.wait_for(condition.wait(), timeout=timeout)
-                except asyncio.TimeoutError as ex:
-                    raise ClientRequestTimeout from ex
-
-            return self._return_message(ws_url, msg_req.id)
+            return await self._request(ws_url, msg_req, timeout=timeout)
         finally:
             await self._stop_conn(ws_url, ref_id)
 
@@ -7,7 +7,7 @@ Class that handles incoming WebSockets messages.
 
 import uuid
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 from rx.concurrency import IOLoopScheduler
 from tornado import websocket, gen
 
@@ -19,13 +19,13 @@ from wotpy.protocols.ws.messages import \
     WebsocketMessageResponse, \
     WebsocketMessageEmittedItem
 from wotpy.protocols.ws.schemas import \
-    SCHEMA_PARAMS_READ_PROPERTY, \
-    SCHEMA_PARAMS_WRITE_PROPERTY, \
-    SCHEMA_PARAMS_DISPOSE, \
-    SCHEMA_PARAMS_INVOKE_ACTION, \
-    SCHEMA_PARAMS_ON_PROPERTY_CHANGE, \
-    SCHEMA_PARAMS_ON_TD_CHANGE, \
-    SCHEMA_PARAMS_ON_EVENT
+    VALIDATOR_PARAMS_READ_PROPERTY, \
+    VALIDATOR_PARAMS_WRITE_PROPERTY, \
+    VALIDATOR_PARAMS_DISPOSE, \
+    VALIDATOR_PARAMS_INVOKE_ACTION, \
+    VALIDATOR_PARAMS_ON_PROPERTY_CHANGE, \
+    VALIDATOR_PARAMS_ON_TD_CHANGE, \
+    VALIDATOR_PARAMS_ON_EVENT
 
 
 # noinspection PyAbstractClass
@@ -130,7 +130,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_READ_PROPERTY)
+            VALIDATOR_PARAMS_READ_PROPERTY.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -151,7 +151,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_WRITE_PROPERTY)
+            VALIDATOR_PARAMS_WRITE_PROPERTY.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -172,7 +172,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_INVOKE_ACTION)
+            VALIDATOR_PARAMS_INVOKE_ACTION.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -194,7 +194,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_ON_PROPERTY_CHANGE)
+            VALIDATOR_PARAMS_ON_PROPERTY_CHANGE.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -215,7 +215,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_ON_TD_CHANGE)
+            VALIDATOR_PARAMS_ON_TD_CHANGE.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -236,7 +236,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_ON_EVENT)
+            VALIDATOR_PARAMS_ON_EVENT.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
@@ -257,7 +257,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_DISPOSE)
+            VALIDATOR_PARAMS_DISPOSE.validate(params)
         except ValidationError as ex:
             self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
             return
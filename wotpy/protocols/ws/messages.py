@@ -7,37 +7,62 @@ Classes that represent JSON-RPC messages exchanged over WebSockets.
 
 import json
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 
 from wotpy.protocols.ws.enums import WebsocketErrors
 from wotpy.protocols.ws.schemas import \
-    SCHEMA_REQUEST, \
-    SCHEMA_RESPONSE, \
-    SCHEMA_EMITTED_ITEM, \
-    SCHEMA_ERROR, \
+    VALIDATOR_REQUEST, \
+    VALIDATOR_RESPONSE, \
+    VALIDATOR_EMITTED_ITEM, \
+    VALIDATOR_ERROR, \
     JSON_RPC_VERSION
 from wotpy.utils.utils import to_json_obj
 
 
+def _decode_raw(raw_msg):
+    """Decodes a raw WebSockets message.
+    Raises WebsocketMessageException if the message is not valid JSON."""
+
+    try:
+        return json.loads(raw_msg)
+    except (TypeError, ValueError) as ex:
+        raise WebsocketMessageException(str(ex))
+
+
+def message_class_for(msg):
+    """Takes a decoded WebSockets message and returns the message class
+    that matches its shape, or None if the shape is unknown."""
+
+    if not isinstance(msg, dict):
+        return None
+
+    if "method" in msg:
+        return WebsocketMessageRequest
+
+    if "error" in msg:
+        return WebsocketMessageError
+
+    if "result" in msg:
+        return WebsocketMessageResponse
+
+    if "subscription" in msg:
+        return WebsocketMessageEmittedItem
+
+    return None
+
+
 def parse_ws_message(raw_msg):
     """Takes a raw WebSockets message and attempts
-    to parse it to create a message instance."""
+    to parse it to create a message instance.
+    The message is decoded once and the message class is selected by its shape."""
 
-    msg_klasses = [
-        WebsocketMessageRequest,
-        WebsocketMessageError,
-        WebsocketMessageResponse,
-        WebsocketMessageEmittedItem
-    ]
+    msg = _decode_raw(raw_msg)
+    klass = message_class_for(msg)
 
-    for klass in msg_klasses:
-        try:
-            msg_instance = klass.from_raw(raw_msg)
-            return msg_instance
-        except WebsocketMessageException:
-            pass
+    if klass is None:
+        raise WebsocketMessageException("Invalid message: {}".format(raw_msg))
 
-    raise WebsocketMessageException("Invalid message: {}".format(raw_msg))
+    return klass.from_dict(msg)
 
 
 class WebsocketMessageException(Exception):
@@ -55,26 +80,36 @@ class WebsocketMessageRequest(object):
         """Builds a new WebsocketMessageRequest instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_dict(_decode_raw(raw_msg))
+
+    @classmethod
+    def from_dict(cls, msg):
+        """Builds a new WebsocketMessageRequest instance from a decoded message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_REQUEST)
+            VALIDATOR_REQUEST.validate(msg)
 
             return WebsocketMessageRequest(
                 method=msg["method"],
                 params=msg["params"],
-                msg_id=msg.get("id", None))
+                msg_id=msg.get("id", None),
+                validate=False)
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, method, params, msg_id=None):
+    def __init__(self, method, params, msg_id=None, validate=True):
         self.method = method
         self.params = params
         self.msg_id = msg_id
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_REQUEST)
+            VALIDATOR_REQUEST.validate(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -108,24 +143,34 @@ class WebsocketMessageResponse(object):
         """Builds a new WebsocketMessageResponse instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_dict(_decode_raw(raw_msg))
+
+    @classmethod
+    def from_dict(cls, msg):
+        """Builds a new WebsocketMessageResponse instance from a decoded message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_RESPONSE)
+            VALIDATOR_RESPONSE.validate(msg)
 
             return WebsocketMessageResponse(
                 result=msg["result"],
-                msg_id=msg.get("id", None))
+                msg_id=msg.get("id", None),
+                validate=False)
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, result, msg_id=None):
+    def __init__(self, result, msg_id=None, validate=True):
         self.result = result
         self.msg_id = msg_id
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_RESPONSE)
+            VALIDATOR_RESPONSE.validate(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -158,28 +203,38 @@ class WebsocketMessageError(object):
         """Builds a new WebsocketMessageError instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_dict(_decode_raw(raw_msg))
+
+    @classmethod
+    def from_dict(cls, msg):
+        """Builds a new WebsocketMessageError instance from a decoded message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_ERROR)
+            VALIDATOR_ERROR.validate(msg)
 
             return WebsocketMessageError(
                 message=msg["error"]["message"],
                 code=msg["error"]["code"],
                 data=msg["error"].get("data", None),
-                msg_id=msg.get("id", None))
+                msg_id=msg.get("id", None),
+                validate=False)
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, message, code=WebsocketErrors.INTERNAL_ERROR, data=None, msg_id=None):
+    def __init__(self, message, code=WebsocketErrors.INTERNAL_ERROR, data=None, msg_id=None, validate=True):
         self.message = message
         self.msg_id = msg_id
         self.code = code
         self.data = data
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_ERROR)
+            VALIDATOR_ERROR.validate(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -216,26 +271,36 @@ class WebsocketMessageEmittedItem(object):
         """Builds a new WebsocketMessageEmittedItem instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_dict(_decode_raw(raw_msg))
+
+    @classmethod
+    def from_dict(cls, msg):
+        """Builds a new WebsocketMessageEmittedItem instance from a decoded message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_EMITTED_ITEM)
+            VALIDATOR_EMITTED_ITEM.validate(msg)
 
             return WebsocketMessageEmittedItem(
                 subscription_id=msg["subscription"],
                 name=msg["name"],
-                data=msg["data"])
+                data=msg["data"],
+                validate=False)
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, subscription_id, name, data):
+    def __init__(self, subscription_id, name, data, validate=True):
         self.subscription_id = subscription_id
         self.name = name
         self.data = to_json_obj(data)
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_EMITTED_ITEM)
+            VALIDATOR_EMITTED_ITEM.validate(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     def to_dict(self):
         """Returns this message as a dict."""
@@ -6,6 +6,7 @@ Schemas following the JSON Schema specification used to validate the shape of We
 """
 
 from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.utils.utils import build_schema_validator
 
 JSON_RPC_VERSION = "2.0"
 
@@ -191,3 +192,17 @@ SCHEMA_PARAMS_DISPOSE = {
         "subscription"
     ]
 }
+
+# Validators are built once at import time to avoid checking the schemas on each message
+
+VALIDATOR_REQUEST = build_schema_validator(SCHEMA_REQUEST)
+VALIDATOR_RESPONSE = build_schema_validator(SCHEMA_RESPONSE)
+VALIDATOR_ERROR = build_schema_validator(SCHEMA_ERROR)
+VALIDATOR_EMITTED_ITEM = build_schema_validator(SCHEMA_EMITTED_ITEM)
+VALIDATOR_PARAMS_READ_PROPERTY = build_schema_validator(SCHEMA_PARAMS_READ_PROPERTY)
+VALIDATOR_PARAMS_WRITE_PROPERTY = build_schema_validator(SCHEMA_PARAMS_WRITE_PROPERTY)
+VALIDATOR_PARAMS_INVOKE_ACTION = build_schema_validator(SCHEMA_PARAMS_INVOKE_ACTION)
+VALIDATOR_PARAMS_ON_PROPERTY_CHANGE = build_schema_validator(SCHEMA_PARAMS_ON_PROPERTY_CHANGE)
+VALIDATOR_PARAMS_ON_TD_CHANGE = build_schema_validator(SCHEMA_PARAMS_ON_TD_CHANGE)
+VALIDATOR_PARAMS_ON_EVENT = build_schema_validator(SCHEMA_PARAMS_ON_EVENT)
+VALIDATOR_PARAMS_DISPOSE = build_schema_validator(SCHEMA_PARAMS_DISPOSE)
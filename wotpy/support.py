@@ -96,3 +96,14 @@ def is_dnssd_supported():
     """Returns True if DNS-SD is supported in this platform."""
 
     return is_supported(FEATURE_DNSSD)
+
+
+def is_curl_supported():
+    """Returns True if the optional curl HTTP client backend can be used."""
+
+    try:
+        import pycurl  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
@@ -9,6 +9,7 @@ import json
 import socket
 from functools import wraps
 
+import jsonschema
 import tornado.gen
 
 
@@ -67,6 +68,16 @@ def to_json_obj(obj):
         raise ValueError("Object {} is not JSON serializable".format(obj)) from None
 
 
+def build_schema_validator(schema):
+    """Checks the given JSON schema and returns a validator instance for it.
+    The validator can be reused to avoid checking the schema on each validation."""
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+
+    return validator_class(schema)
+
+
 def get_main_ipv4_address():
     """Returns the main IPv4 address of the current machine in a portable fashion.
     Attribution to the answer provided by Jamieson Becker on:
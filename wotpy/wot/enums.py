@@ -18,12 +18,13 @@ class DiscoveryMethod(EnumListMixin):
 
 
 class TDChangeType(EnumListMixin):
-    """Represents the change type, whether has it been
-    applied on properties, Actions or Events."""
+    """Represents the change type, whether has it been applied
+    on properties, Actions, Events or the Thing metadata."""
 
     PROPERTY = "property"
     ACTION = "action"
     EVENT = "event"
+    THING = "thing"
 
 
 class TDChangeMethod(EnumListMixin):
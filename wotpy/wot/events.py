@@ -92,7 +92,7 @@ class ThingDescriptionChangeEventInit(object):
     Args:
         td_change_type (str): An item of enumeration :py:class:`.TDChangeType`.
         method (str): An item of enumeration :py:class:`.TDChangeMethod`.
-        name (str): Name of the Interaction.
+        name (str): Name of the Interaction (or of the Thing attribute for Thing changes).
         data: An instance of :py:class:`.ThingPropertyInit`, :py:class:`.ThingActionInit`
             or :py:class:`.ThingEventInit` (or ``None`` if the change did not add a new interaction).
         description (dict): A dict that represents a TD serialized to JSON-LD.
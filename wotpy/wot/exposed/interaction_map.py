@@ -23,14 +23,15 @@ class ExposedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next(
-            (
-                key
-                for key in self.interaction_dict.keys()
-                if slugify(key) == slugify(name)
-            ),
-            None,
-        )
+        interaction = self._exposed_thing.thing.find_interaction(slugify(name))
+
+        if (
+            interaction is None
+            or self.interaction_dict.get(interaction.name) is not interaction
+        ):
+            return None
+
+        return interaction.name
 
     def __getitem__(self, name):
         """Lazily build and return an object that implements the Interaction interface."""
@@ -7,6 +7,7 @@ Classes that represent Things exposed by a servient.
 
 import asyncio
 import concurrent.futures
+import weakref
 from asyncio import Future
 
 from rx import Observable
@@ -75,7 +76,8 @@ class ExposedThing(object):
             self.HandlerKeys.INVOKE_ACTION: {},
         }
 
-        self._events_stream = Subject()
+        self._event_subjects = {}
+        self._add_thing_change_callback()
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.id)
@@ -93,14 +95,51 @@ class ExposedThing(object):
         return getattr(self.thing, name)
 
     def __setattr__(self, name, value):
-        """Setter for ThingFragment attributes."""
+        """Setter for ThingFragment attributes.
+        Updating an attribute emits a Thing Description change event."""
 
         name_camel = to_camel(name)
 
         if name_camel not in Thing.THING_FRAGMENT_WRITABLE_FIELDS:
             return super(ExposedThing, self).__setattr__(name, value)
 
-        return self._thing.__setattr__(name, value)
+        self._thing.__setattr__(name, value)
+
+    def _add_thing_change_callback(self):
+        """Registers a change callback in the Thing that only holds a weak reference
+        to this ExposedThing. The callback is removed when this object is collected."""
+
+        thing = self._thing
+
+        def on_collect(_):
+            thing.remove_change_callback(callback)
+
+        ref_on_change = weakref.WeakMethod(self._on_thing_change, on_collect)
+
+        def callback(name):
+            on_change = ref_on_change()
+
+            if on_change is not None:
+                on_change(name)
+
+        thing.add_change_callback(callback)
+
+    def _on_thing_change(self, name):
+        """Emits a Thing Description change event when an attribute is updated,
+        either through this ExposedThing or directly on the Thing.
+        The Thing Description is only serialized if there are subscribers."""
+
+        if DefaultThingEvent.DESCRIPTION_CHANGE not in self._event_subjects:
+            return
+
+        event_data = ThingDescriptionChangeEventInit(
+            td_change_type=TDChangeType.THING,
+            method=TDChangeMethod.CHANGE,
+            name=name,
+            description=ThingDescription.from_thing(self.thing).to_dict(),
+        )
+
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def _set_property_value(self, prop, value):
         """Sets a Property value."""
@@ -131,6 +170,45 @@ class ExposedThing(object):
 
         return interaction_handler or self._handlers_global[handler_type]
 
+    def _emit(self, emitted_event):
+        """Pushes an emitted event only to the subscribers interested in it.
+        Subscribers are keyed by event name and property changes
+        are additionally keyed by the name of the property."""
+
+        keys = [emitted_event.name]
+
+        if emitted_event.name == DefaultThingEvent.PROPERTY_CHANGE:
+            keys.append((emitted_event.name, getattr(emitted_event.data, "name", None)))
+
+        for key in keys:
+            subject = self._event_subjects.get(key, None)
+
+            if subject is not None:
+                subject.on_next(emitted_event)
+
+    def _observe(self, key):
+        """Returns an Observable for the events routed under the given key.
+        The Subject for the key is removed when its last subscriber is disposed."""
+
+        def subscribe(observer):
+            subject = self._event_subjects.get(key, None)
+
+            if subject is None:
+                subject = Subject()
+                self._event_subjects[key] = subject
+
+            disposable = subject.subscribe(observer)
+
+            def unsubscribe():
+                disposable.dispose()
+
+                if not subject.observers and self._event_subjects.get(key) is subject:
+                    self._event_subjects.pop(key)
+
+            return unsubscribe
+
+        return Observable.create(subscribe)
+
     def _find_interaction(self, name):
         """Raises ValueError if the given interaction does not exist in this Thing."""
 
@@ -250,7 +328,7 @@ class ExposedThing(object):
             await self._default_update_property_handler(name, value)
 
         event_init = PropertyChangeEventInit(name=name, value=value)
-        self._events_stream.on_next(PropertyChangeEmittedEvent(init=event_init))
+        self._emit(PropertyChangeEmittedEvent(init=event_init))
 
     async def invoke_action(self, name, input_value=None):
         """Invokes an Action with the given parameters and yields with the invocation result."""
@@ -270,7 +348,7 @@ class ExposedThing(object):
 
         event_init = ActionInvocationEventInit(action_name=name, return_value=result)
         emitted_event = ActionInvocationEmittedEvent(init=event_init)
-        self._events_stream.on_next(emitted_event)
+        self._emit(emitted_event)
 
         return result
 
@@ -281,10 +359,7 @@ class ExposedThing(object):
         if name not in self.thing.events:
             return Observable.throw(Exception("Unknown event"))
 
-        def event_filter(item):
-            return item.name == name
-
-        return self._events_stream.filter(event_filter)
+        return self._observe(name)
 
     def on_property_change(self, name):
         """Returns an Observable for the Property specified in the name argument,
@@ -298,22 +373,13 @@ class ExposedThing(object):
         if not interaction.observable:
             return Observable.throw(Exception("Property is not observable"))
 
-        def property_change_filter(item):
-            return (
-                item.name == DefaultThingEvent.PROPERTY_CHANGE
-                and item.data.name == name
-            )
-
-        return self._events_stream.filter(property_change_filter)
+        return self._observe((DefaultThingEvent.PROPERTY_CHANGE, name))
 
     def on_td_change(self):
         """Returns an Observable, allowing subscribing to and unsubscribing
         from notifications to the Thing Description."""
 
-        def td_change_filter(item):
-            return item.name == DefaultThingEvent.DESCRIPTION_CHANGE
-
-        return self._events_stream.filter(td_change_filter)
+        return self._observe(DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def expose(self):
         """Start serving external requests for the Thing, so that
@@ -334,7 +400,7 @@ class ExposedThing(object):
         if not self.thing.find_interaction(name=event_name):
             raise ValueError("Unknown event: {}".format(event_name))
 
-        self._events_stream.on_next(EmittedEvent(name=event_name, init=payload))
+        self._emit(EmittedEvent(name=event_name, init=payload))
 
     def add_property(self, name, property_init, value=None):
         """Adds a Property defined by the argument and updates the Thing Description.
@@ -356,7 +422,7 @@ class ExposedThing(object):
             description=ThingDescription.from_thing(self.thing).to_dict(),
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def remove_property(self, name):
         """Removes the Property specified by the name argument,
@@ -370,7 +436,7 @@ class ExposedThing(object):
             name=name,
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def add_action(self, name, action_init, action_handler=None):
         """Adds an Action to the Thing object as defined by the action
@@ -391,7 +457,7 @@ class ExposedThing(object):
             description=ThingDescription.from_thing(self.thing).to_dict(),
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
         if action_handler:
             self.set_action_handler(name, action_handler)
@@ -406,7 +472,7 @@ class ExposedThing(object):
             td_change_type=TDChangeType.ACTION, method=TDChangeMethod.REMOVE, name=name
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def add_event(self, name, event_init):
         """Adds an event to the Thing object as defined by the event argument
@@ -427,7 +493,7 @@ class ExposedThing(object):
             description=ThingDescription.from_thing(self.thing).to_dict(),
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def remove_event(self, name):
         """Removes the event specified by the name argument,
@@ -439,7 +505,7 @@ class ExposedThing(object):
             td_change_type=TDChangeType.EVENT, method=TDChangeMethod.REMOVE, name=name
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data))
 
     def set_action_handler(self, name, action_handler):
         """Takes name as string argument and action_handler as argument of type ActionHandler.
@@ -5,6 +5,10 @@
 Class that represents a group or set of ExposedThing instances that exist in the same context.
 """
 
+import uuid
+
+_UUID_STR_LEN = len(str(uuid.UUID(int=0)))
+
 
 class ExposedThingSet(object):
     """Represents a group of ExposedThing objects.
@@ -12,6 +16,8 @@ class ExposedThingSet(object):
 
     def __init__(self):
         self._exposed_things = {}
+        self._index_uuid = {}
+        self._index_thing = {}
 
     @property
     def exposed_things(self):
@@ -23,7 +29,9 @@ class ExposedThingSet(object):
     def contains(self, exposed_thing):
         """Returns True if this group contains the given ExposedThing."""
 
-        return exposed_thing in self._exposed_things.values()
+        existing = self._exposed_things.get(exposed_thing.thing.id, None)
+
+        return existing is not None and existing == exposed_thing
 
     def add(self, exposed_thing):
         """Add a new ExposedThing to this set."""
@@ -32,6 +40,8 @@ class ExposedThingSet(object):
             raise ValueError("Duplicate Exposed Thing: {}".format(exposed_thing.title))
 
         self._exposed_things[exposed_thing.thing.id] = exposed_thing
+        self._index_uuid[exposed_thing.thing.uuid] = exposed_thing
+        self._index_thing[exposed_thing.thing] = exposed_thing
 
     def remove(self, thing_id):
         """Removes an existing ExposedThing by ID.
@@ -43,27 +53,33 @@ class ExposedThingSet(object):
             raise ValueError("Unknown Exposed Thing: {}".format(thing_id))
 
         self._exposed_things.pop(exposed_thing.thing.id)
+        self._index_uuid.pop(exposed_thing.thing.uuid, None)
+        self._index_thing.pop(exposed_thing.thing, None)
 
     def find_by_thing_id(self, thing_id):
         """Finds an existing ExposedThing by Thing ID.
         The ID argument may be the original Thing ID or the URL-safe name
         (which is also unique and based on the ID)."""
 
-        def is_match(exp_thing):
-            return (
-                exp_thing.thing.id == thing_id or exp_thing.thing.url_name == thing_id
-            )
+        exposed_thing = self._exposed_things.get(thing_id, None)
+
+        if exposed_thing is not None:
+            return exposed_thing
+
+        # The URL name always ends with the Thing UUID, which is derived from the ID.
+        # Indexing by UUID keeps the lookup valid when the Thing title is updated.
 
-        return next(
-            (item for item in self._exposed_things.values() if is_match(item)), None
-        )
+        if not isinstance(thing_id, str) or len(thing_id) < _UUID_STR_LEN:
+            return None
+
+        exposed_thing = self._index_uuid.get(thing_id[-_UUID_STR_LEN:], None)
+
+        if exposed_thing is None or exposed_thing.thing.url_name != thing_id:
+            return None
+
+        return exposed_thing
 
     def find_by_interaction(self, interaction):
         """Finds the ExposedThing whose Thing contains the given Interaction."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing is interaction.thing
-
-        return next(
-            (item for item in self._exposed_things.values() if is_match(item)), None
-        )
+        return self._index_thing.get(interaction.thing, None)
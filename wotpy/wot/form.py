@@ -51,5 +51,6 @@ class Form(object):
             self.protocol,
             self.href,
             self.content_type,
-            tuple(self.op) if isinstance(self.op, list) else self.op
+            tuple(self.op) if isinstance(self.op, list) else self.op,
+            self.subprotocol
         ))
@@ -31,7 +31,9 @@ class InteractionPattern(object):
 
         self._thing = thing
         self._name = name
+        self._url_name = slugify(name)
         self._forms = []
+        self._fragment_dict = None
 
     def __getattr__(self, name):
         """Search for members that raised an AttributeError in
@@ -69,7 +71,19 @@ class InteractionPattern(object):
     def url_name(self):
         """URL-safe version of the name."""
 
-        return slugify(self.name)
+        return self._url_name
+
+    @property
+    def fragment_dict(self):
+        """JSON-serializable dict of the InteractionFragment of this
+        interaction, including its Forms. The dict is cached until the Forms change."""
+
+        if self._fragment_dict is None:
+            ret = self._init_dict.to_dict()
+            ret.update({"forms": [form.form_dict.to_dict() for form in self._forms]})
+            self._fragment_dict = ret
+
+        return self._fragment_dict
 
     @property
     def forms(self):
@@ -81,6 +95,7 @@ class InteractionPattern(object):
         """Removes all the Forms from this Interaction."""
 
         self._forms = []
+        self._invalidate_fragment()
 
     def add_form(self, form):
         """Add a new Form."""
@@ -93,6 +108,7 @@ class InteractionPattern(object):
             raise ValueError("Duplicate Form: {}".format(form))
 
         self._forms.append(form)
+        self._invalidate_fragment()
 
     def remove_form(self, form):
         """Remove an existing Form."""
@@ -101,7 +117,15 @@ class InteractionPattern(object):
             pop_idx = self._forms.index(form)
             self._forms.pop(pop_idx)
         except ValueError:
-            pass
+            return
+
+        self._invalidate_fragment()
+
+    def _invalidate_fragment(self):
+        """Discards the cached fragment dict of this interaction and the parent Thing."""
+
+        self._fragment_dict = None
+        self._thing.invalidate_fragment()
 
 
 class Property(InteractionPattern):
@@ -7,6 +7,8 @@ Class that represents a WoT servient.
 
 import asyncio
 import functools
+import hashlib
+import json
 import re
 import socket
 
@@ -23,46 +25,99 @@ from wotpy.wot.td import ThingDescription
 from wotpy.wot.wot import WoT
 
 
-class TDHandler(tornado.web.RequestHandler):
-    """Handler that returns the TD document of a given Thing."""
+class ThingDescriptionCache(object):
+    """Cache of JSON-serialized Thing Descriptions for the ExposedThings of a Servient.
+    Entries are rebuilt when the Thing revision or the Thing base URL change."""
+
+    def __init__(self, servient):
+        self._servient = servient
+        self._entries = {}
+
+    def get(self, exposed_thing):
+        """Returns a tuple with the serialized TD (bytes) of
+        the given ExposedThing and the ETag of that content."""
+
+        thing = exposed_thing.thing
+        base_url = self._servient.get_thing_base_url(exposed_thing)
+        entry_key = (thing, thing.revision, base_url)
+        entry = self._entries.get(thing.id, None)
+
+        if entry is None or entry[0] != entry_key:
+            td_doc = ThingDescription.from_thing(thing).to_dict()
+
+            if base_url:
+                td_doc.update({"base": base_url})
+
+            td_bytes = json.dumps(td_doc).encode()
+            # trunk-ignore(bandit/B324)
+            etag = '"{}"'.format(hashlib.sha1(td_bytes).hexdigest())
+            entry = (entry_key, td_bytes, etag)
+            self._entries[thing.id] = entry
+
+        return entry[1], entry[2]
+
+    def discard(self, thing_id):
+        """Removes the cached TD of the Thing with the given ID."""
+
+        self._entries.pop(thing_id, None)
+
+
+class BaseTDHandler(tornado.web.RequestHandler):
+    """Base handler for responses that contain serialized TD documents.
+    The ETag is the precomputed hash of the cached TD documents."""
 
     def initialize(self, servient):
         self.servient = servient
+        self.etag = None
 
-    def get(self, thing_url_name):
-        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(thing_url_name)
+    def compute_etag(self):
+        if self.etag is not None:
+            return self.etag
+
+        return super(BaseTDHandler, self).compute_etag()
+
+    def write_json_bytes(self, body, etag):
+        """Writes a pre-serialized JSON body and sets the ETag of the response."""
 
-        td_doc = ThingDescription.from_thing(exp_thing.thing).to_dict()
-        base_url = self.servient.get_thing_base_url(exp_thing)
+        self.etag = etag
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.write(body)
 
-        if base_url:
-            td_doc.update({"base": base_url})
 
-        self.write(td_doc)
+class TDHandler(BaseTDHandler):
+    """Handler that returns the TD document of a given Thing."""
 
+    def get(self, thing_url_name):
+        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(thing_url_name)
+        td_bytes, etag = self.servient.td_cache.get(exp_thing)
+        self.write_json_bytes(td_bytes, etag)
 
-class TDCatalogueHandler(tornado.web.RequestHandler):
+
+class TDCatalogueHandler(BaseTDHandler):
     """Handler that returns the entire catalogue of Things contained in this servient.
     May return TDs in expanded format or URL pointers to the individual TDs."""
 
-    def initialize(self, servient):
-        self.servient = servient
-
     def get(self):
-        response = {}
+        if not self.get_argument("expanded", False):
+            response = {
+                exp_thing.thing.id: "/{}".format(exp_thing.thing.url_name)
+                for exp_thing in self.servient.enabled_exposed_things
+            }
 
-        for exp_thing in self.servient.enabled_exposed_things:
-            thing_id = exp_thing.thing.id
+            self.write(response)
+            return
 
-            if self.get_argument("expanded", False):
-                val = ThingDescription.from_thing(exp_thing.thing).to_dict()
-                val.update({"base": self.servient.get_thing_base_url(exp_thing)})
-            else:
-                val = "/{}".format(exp_thing.thing.url_name)
+        items = []
+        # trunk-ignore(bandit/B324)
+        hasher = hashlib.sha1()
 
-            response[thing_id] = val
+        for exp_thing in self.servient.enabled_exposed_things:
+            td_bytes, etag = self.servient.td_cache.get(exp_thing)
+            items.append(json.dumps(exp_thing.thing.id).encode() + b":" + td_bytes)
+            hasher.update(etag.encode())
 
-        self.write(response)
+        body = b"{" + b",".join(items) + b"}"
+        self.write_json_bytes(body, '"{}"'.format(hasher.hexdigest()))
 
 
 class ServientStateException(Exception):
@@ -136,6 +191,7 @@ class Servient(object):
         self._catalogue_port = catalogue_port
         self._catalogue_server = None
         self._exposed_thing_set = ExposedThingSet()
+        self._td_cache = ThingDescriptionCache(servient=self)
         self._servient_lock = asyncio.Lock()
         self._is_running = False
 
@@ -225,6 +281,12 @@ class Servient(object):
 
         return self._exposed_thing_set
 
+    @property
+    def td_cache(self):
+        """Returns the cache of serialized TDs of the ExposedThings of this servient."""
+
+        return self._td_cache
+
     @property
     def exposed_things(self):
         """Returns an iterator for the ExposedThings contained in this Servient."""
@@ -415,9 +477,15 @@ class Servient(object):
             raise ValueError("Unknown server")
 
         for exp_thing in self._exposed_thing_set.exposed_things:
-            self._clean_protocol_forms(exp_thing, server.protocol)
-            if self._server_has_exposed_thing(server, exp_thing):
-                self._add_interaction_forms(server, exp_thing)
+            self._regenerate_thing_forms(server, exp_thing)
+
+    def _regenerate_thing_forms(self, server, exposed_thing):
+        """Cleans and regenerates Forms for the given server in a single ExposedThing."""
+
+        self._clean_protocol_forms(exposed_thing, server.protocol)
+
+        if self._server_has_exposed_thing(server, exposed_thing):
+            self._add_interaction_forms(server, exposed_thing)
 
     def get_thing_base_url(self, exposed_thing):
         """Return the base URL for the given ExposedThing
@@ -485,13 +553,20 @@ class Servient(object):
         """Enables the ExposedThing with the given ID.
         This is, the servers will listen for requests for this thing."""
 
-        exposed_thing = self.get_exposed_thing(thing_id)
+        self.enable_exposed_things([thing_id])
+
+    def enable_exposed_things(self, thing_ids):
+        """Enables all the ExposedThings with the given IDs at once.
+        Only the Forms of the given ExposedThings are regenerated."""
+
+        exposed_things = [self.get_exposed_thing(thing_id) for thing_id in thing_ids]
 
         for server in self._servers.values():
-            server.add_exposed_thing(exposed_thing)
-            self._regenerate_server_forms(server)
+            for exposed_thing in exposed_things:
+                server.add_exposed_thing(exposed_thing)
+                self._regenerate_thing_forms(server, exposed_thing)
 
-        self._enabled_exposed_thing_ids.add(exposed_thing.id)
+        self._enabled_exposed_thing_ids.update(item.id for item in exposed_things)
 
     def disable_exposed_thing(self, thing_id):
         """Disables the ExposedThing with the given ID.
@@ -504,7 +579,7 @@ class Servient(object):
 
         for server in self._servers.values():
             server.remove_exposed_thing(exposed_thing.id)
-            self._regenerate_server_forms(server)
+            self._regenerate_thing_forms(server, exposed_thing)
 
         self._enabled_exposed_thing_ids.remove(exposed_thing.id)
 
@@ -520,7 +595,9 @@ class Servient(object):
         if thing_id in self._enabled_exposed_thing_ids:
             self.disable_exposed_thing(thing_id)
 
+        exposed_thing = self.get_exposed_thing(thing_id)
         self._exposed_thing_set.remove(thing_id)
+        self._td_cache.discard(exposed_thing.id)
 
     def get_exposed_thing(self, thing_id):
         """Finds and returns an ExposedThing contained in this servient by Thing ID.
@@ -551,11 +628,18 @@ class Servient(object):
 
             return WoT(servient=self)
 
+    async def _shutdown_clients(self):
+        """Closes the connections kept open by the Protocol Binding clients."""
+
+        await asyncio.gather(*[client.shutdown() for client in self._clients.values()])
+
     async def shutdown(self):
-        """Stops the server configured under this servient."""
+        """Stops the server configured under this servient
+        and closes the connections kept open by its clients."""
 
         async with self._servient_lock:
             await asyncio.gather(*[server.stop() for server in self._servers.values()])
             self._stop_catalogue()
             await self._stop_dnssd()
+            await self._shutdown_clients()
             self._is_running = False
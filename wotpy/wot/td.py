@@ -5,10 +5,13 @@
 Classes that represent the JSON and JSON-LD serialization formats of a Thing Description document.
 """
 
+import hashlib
 import json
+from collections import OrderedDict
 
 import jsonschema
 
+from wotpy.utils.utils import build_schema_validator
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.thing import Thing
 from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
@@ -19,30 +22,59 @@ class ThingDescription(object):
     Contains logic to validate and transform a Thing to a serialized TD and vice versa.
     """
 
-    def __init__(self, doc):
+    VALIDATED_CACHE_SIZE = 1024
+
+    _validator = build_schema_validator(SCHEMA_THING)
+    _validated_hashes = OrderedDict()
+
+    def __init__(self, doc, validate=True):
         """Constructor.
-        Validates that the document conforms to the TD schema."""
+        Validates that the document conforms to the TD schema.
+        Validation may be skipped for documents that have been built internally."""
 
         self._doc = json.loads(doc) if isinstance(doc, (str, bytes)) else doc
         self._thing_fragment = ThingFragment(self._doc)
 
-        self.validate(doc=self._thing_fragment.to_dict())
+        if validate:
+            self.validate(doc=self._thing_fragment.to_dict())
 
     @classmethod
     def validate(cls, doc):
         """Validates the given Thing Description document against its schema.
-        Raises ValidationError if validation fails."""
+        Raises ValidationError if validation fails.
+        The hashes of the last validated documents are kept to skip repeated validations.
+        """
 
         try:
-            jsonschema.validate(doc, SCHEMA_THING)
+            doc_str = json.dumps(doc, sort_keys=True)
+            # trunk-ignore(bandit/B324)
+            doc_hash = hashlib.sha1(doc_str.encode()).digest()
+
+            if doc_hash in cls._validated_hashes:
+                cls._validated_hashes.move_to_end(doc_hash)
+                return
+
+            error = jsonschema.exceptions.best_match(cls._validator.iter_errors(doc))
+
+            if error is not None:
+                raise error
         except (jsonschema.ValidationError, TypeError) as ex:
             raise InvalidDescription(str(ex)) from ex
 
+        cls._validated_hashes[doc_hash] = True
+
+        while len(cls._validated_hashes) > cls.VALIDATED_CACHE_SIZE:
+            cls._validated_hashes.popitem(last=False)
+
     @classmethod
     def from_thing(cls, thing):
-        """Builds an instance of a JSON-serialized Thing Description from a Thing object."""
+        """Builds an instance of a JSON-serialized Thing Description from a Thing object.
+        The document is built internally from the Thing and is therefore not validated.
+        It shares its nested values with the cached Thing.fragment_dict,
+        so the dicts returned by to_dict() must not be modified in place.
+        """
 
-        return ThingDescription(thing.thing_fragment.to_dict())
+        return ThingDescription(thing.fragment_dict, validate=False)
 
     def __getattr__(self, name):
         """Search for members that raised an AttributeError in
@@ -5,6 +5,7 @@
 Class that represents a Thing.
 """
 
+import copy
 import hashlib
 import itertools
 import uuid
@@ -38,9 +39,15 @@ class Thing(object):
         self._thing_fragment = (
             thing_fragment if thing_fragment else ThingFragment(**kwargs)
         )
+        self._fragment_doc = None
+        self._revision = 0
+        self._uuid = None
+        self._url_name = None
         self._properties = {}
         self._actions = {}
         self._events = {}
+        self._interactions_index = {}
+        self._change_callbacks = []
         self._init_fragment_interactions()
 
     def __getattr__(self, name):
@@ -50,14 +57,34 @@ class Thing(object):
         return getattr(self._thing_fragment, name)
 
     def __setattr__(self, name, value):
-        """Setter for ThingFragment attributes."""
+        """Setter for ThingFragment attributes.
+        The change callbacks are called with the camel case field name."""
 
         name_camel = to_camel(name)
 
         if name_camel not in self.THING_FRAGMENT_WRITABLE_FIELDS:
             return super(Thing, self).__setattr__(name, value)
 
-        return self._thing_fragment.__setattr__(name, value)
+        self._thing_fragment.__setattr__(name, value)
+        self.invalidate_fragment()
+
+        if name_camel == "title":
+            self._url_name = None
+
+        for callback in list(self._change_callbacks):
+            callback(name_camel)
+
+    def add_change_callback(self, callback):
+        """Adds a function that is called with the field name
+        each time a writable ThingFragment field is updated."""
+
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback):
+        """Removes a function added with add_change_callback."""
+
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
 
     def _init_fragment_interactions(self):
         """Adds the interactions declared in the ThingFragment to the instance private dicts."""
@@ -75,58 +102,65 @@ class Thing(object):
             self.add_interaction(event)
 
     @property
-    def thing_fragment(self):
-        """The ThingFragment dictionary of this Thing."""
-
-        def interaction_to_json(intrct):
-            """Returns the JSON serialization of an Interaction instance."""
+    def fragment_dict(self):
+        """JSON-serializable dict of the ThingFragment of this Thing, including
+        its interactions. The dict is cached and only rebuilt after a change in
+        the interactions, the forms or the writable fields. It is shared by all
+        the callers and must not be modified (use thing_fragment for a copy)."""
+
+        if self._fragment_doc is None:
+            doc = self._thing_fragment.to_dict()
+
+            doc.update(
+                {
+                    "properties": {
+                        key: val.fragment_dict for key, val in self.properties.items()
+                    }
+                }
+            )
 
-            ret = intrct.interaction_fragment.to_dict()
+            doc.update(
+                {
+                    "actions": {
+                        key: val.fragment_dict for key, val in self.actions.items()
+                    }
+                }
+            )
 
-            ret.update({"forms": [form.form_dict.to_dict() for form in intrct.forms]})
+            doc.update(
+                {"events": {key: val.fragment_dict for key, val in self.events.items()}}
+            )
 
-            return ret
+            self._fragment_doc = doc
 
-        doc = self._thing_fragment.to_dict()
+        return self._fragment_doc
 
-        doc.update(
-            {
-                "properties": {
-                    key: interaction_to_json(val)
-                    for key, val in self.properties.items()
-                }
-            }
-        )
+    @property
+    def thing_fragment(self):
+        """The ThingFragment dictionary of this Thing.
+        Each call returns a copy of the cached fragment_dict
+        that may be modified without affecting the cache."""
 
-        doc.update(
-            {
-                "actions": {
-                    key: interaction_to_json(val) for key, val in self.actions.items()
-                }
-            }
-        )
+        return ThingFragment(copy.deepcopy(self.fragment_dict))
 
-        doc.update(
-            {
-                "events": {
-                    key: interaction_to_json(val) for key, val in self.events.items()
-                }
-            }
-        )
+    @property
+    def revision(self):
+        """Counter that is incremented every time the ThingFragment of this Thing changes.
+        It may be used to detect stale serializations of the Thing Description."""
 
-        return ThingFragment(doc)
+        return self._revision
 
     @property
     def id(self):
         """Thing ID."""
 
-        return self.thing_fragment.id
+        return self._thing_fragment.id
 
     @property
     def title(self):
         """Thing title."""
 
-        return self.thing_fragment.title
+        return self._thing_fragment.title
 
     @property
     def uuid(self):
@@ -134,12 +168,14 @@ class Thing(object):
         This value is deterministic and derived from the Thing ID.
         It may be of use when URL-unsafe chars are not acceptable."""
 
-        # trunk-ignore(bandit/B324)
-        hasher = hashlib.md5()
-        hasher.update(self.id.encode())
-        bytes_id_hash = hasher.digest()
+        if self._uuid is None:
+            # trunk-ignore(bandit/B324)
+            hasher = hashlib.md5()
+            hasher.update(self.id.encode())
+            bytes_id_hash = hasher.digest()
+            self._uuid = str(uuid.UUID(bytes=bytes_id_hash))
 
-        return str(uuid.UUID(bytes=bytes_id_hash))
+        return self._uuid
 
     @property
     def url_name(self):
@@ -147,7 +183,10 @@ class Thing(object):
         The URL name of a Thing is always unique and stable as long as the ID is unique.
         """
 
-        return slugify("{}-{}".format(self.title, self.uuid))
+        if self._url_name is None:
+            self._url_name = slugify("{}-{}".format(self.title, self.uuid))
+
+        return self._url_name
 
     @property
     def properties(self):
@@ -179,10 +218,7 @@ class Thing(object):
         """Finds an existing Interaction by name.
         The name argument may be the original name or the URL-safe version."""
 
-        def is_match(intrct):
-            return intrct.name == name or intrct.url_name == name
-
-        return next((intrct for intrct in self.interactions if is_match(intrct)), None)
+        return self._interactions_index.get(name, None)
 
     def add_interaction(self, interaction):
         """Add a new Interaction."""
@@ -193,8 +229,9 @@ class Thing(object):
         if interaction.thing is not self:
             raise ValueError("Interaction linked to another Thing")
 
-        if self.find_interaction(interaction.name) or self.find_interaction(
-            interaction.url_name
+        if (
+            interaction.name in self._interactions_index
+            or interaction.url_name in self._interactions_index
         ):
             raise ValueError("Duplicate Interaction: {}".format(interaction.name))
 
@@ -211,6 +248,9 @@ class Thing(object):
         )
 
         interaction_dict_map[interaction_class][interaction.name] = interaction
+        self._interactions_index[interaction.name] = interaction
+        self._interactions_index[interaction.url_name] = interaction
+        self.invalidate_fragment()
 
     def remove_interaction(self, name):
         """Removes an existing Interaction by name.
@@ -224,3 +264,13 @@ class Thing(object):
         self._properties.pop(interaction.name, None)
         self._actions.pop(interaction.name, None)
         self._events.pop(interaction.name, None)
+        self._interactions_index.pop(interaction.name, None)
+        self._interactions_index.pop(interaction.url_name, None)
+        self.invalidate_fragment()
+
+    def invalidate_fragment(self):
+        """Discards the cached ThingFragment document.
+        It will be rebuilt the next time it is accessed."""
+
+        self._fragment_doc = None
+        self._revision += 1